@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import members
+from app.api.endpoints import members, system
 
 api_router = APIRouter()
 api_router.include_router(members.router, prefix="/members", tags=["members"])
+api_router.include_router(system.router, prefix="/system", tags=["system"])
 # 다른 엔드포인트도 여기에 추가 가능
\ No newline at end of file
@@ -2,10 +2,11 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.member import Member as MemberModel
 from app.schemas.member import Member, MemberRanking
-from app.services.assembly_api import assembly_api
+from app.services import member_service
 
 router = APIRouter()
 
@@ -74,43 +75,13 @@ def get_member_rankings(
 @router.get("/sync-from-api")
 def sync_members_from_api(
     db: Session = Depends(get_db),
-    assembly_term: int = 22,
+    assembly_term: int = settings.ASSEMBLY_TERM,
 ):
     """
     국회정보 API에서 국회의원 정보를 가져와 데이터베이스에 동기화합니다.
+    (국회의원코드 기준으로 추가/업데이트/변경 없음 의원 수를 반환)
     """
-    try:
-        # API에서 국회의원 목록 조회
-        members_data = assembly_api.get_members(assembly_term=assembly_term)
-        
-        # 데이터베이스에 저장
-        for member_data in members_data:
-            # 이미 존재하는 국회의원인지 확인
-            existing_member = db.query(MemberModel).filter(
-                MemberModel.name == member_data.get("HG_NM", "")  # HG_NM: 이름
-            ).first()
-            
-            if existing_member:
-                # 기존 데이터 업데이트
-                existing_member.party = member_data.get("POLY_NM", "")  # POLY_NM: 정당명
-                existing_member.district = member_data.get("ORIG_NM", "")  # ORIG_NM: 선거구
-                existing_member.position = member_data.get("CURR_COMMITTEE", "")  # CURR_COMMITTEE: 소속위원회
-                existing_member.last_updated = datetime.now().date()
-            else:
-                # 새 국회의원 데이터 생성
-                new_member = MemberModel(
-                    name=member_data.get("HG_NM", ""),  # 이름
-                    hanja_name=member_data.get("HJ_NM", ""),  # 한자명
-                    eng_name=member_data.get("ENG_NM", ""),  # 영문명
-                    party=member_data.get("POLY_NM", ""),  # 정당명
-                    district=member_data.get("ORIG_NM", ""),  # 선거구
-                    position=member_data.get("CURR_COMMITTEE", ""),  # 소속위원회
-                )
-                db.add(new_member)
-        
-        db.commit()
-        return {"message": "국회의원 정보 동기화 완료", "count": len(members_data)}
-    
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"동기화 오류: {str(e)}")
\ No newline at end of file
+    result = member_service.sync_members_from_api(db, assembly_term=assembly_term)
+    if not result["total"]:
+        raise HTTPException(status_code=500, detail="동기화 오류: API에서 국회의원 정보를 가져오지 못했습니다.")
+    return {"message": "국회의원 정보 동기화 완료", "count": result["total"], **result}
\ No newline at end of file
@@ -0,0 +1,62 @@
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+
+from app.services.api_cache import response_cache
+from app.services.bill_prefetch import bill_view_tracker
+from app.services.rate_limiter import rate_limiter
+from app.services.circuit_breaker import circuit_breakers
+from app.services.single_flight import request_coalescer
+from app.services.sync_runs import get_recent_runs
+
+router = APIRouter()
+
+@router.get("/api-stats")
+def get_api_stats() -> Dict[str, Any]:
+    """
+    국회정보 API 클라이언트의 운영 통계를 조회합니다.
+    (응답 캐시 적중/미적중 횟수, 호출 속도 제한 상태, 엔드포인트별 서킷 브레이커 상태, 병합된 동시 요청 수,
+    API 호출 없이 DB만으로 응답한 의안 상세 페이지 비율 등)
+    """
+    return {
+        "cache": response_cache.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "circuit_breakers": circuit_breakers.stats(),
+        "coalescing": request_coalescer.stats(),
+        "bill_detail": bill_view_tracker.stats()
+    }
+
+@router.get("/sync-runs")
+def get_sync_runs(
+    job: Optional[str] = Query(None, description="동기화 작업 이름 (예: bills)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 조회 건수"),
+    db: Session = Depends(get_db)
+) -> List[Dict[str, Any]]:
+    """
+    최근 동기화 실행 기록을 조회합니다.
+    (모드, 상태, 마지막으로 완료한 페이지, 최고 수위, 처리 건수, 이어서 실행한 횟수, 소요 시간 등)
+    """
+    return [
+        {
+            "id": run.id,
+            "job": run.job,
+            "mode": run.mode,
+            "status": run.status,
+            "max_pages": run.max_pages,
+            "last_completed_page": run.last_completed_page,
+            "high_water_date": run.high_water_date,
+            "high_water_bill_no": run.high_water_bill_no,
+            "resume_count": run.resume_count,
+            "new_count": run.new_count,
+            "updated_count": run.updated_count,
+            "unchanged_count": run.unchanged_count,
+            "skipped_count": run.skipped_count,
+            "started_at": run.started_at,
+            "finished_at": run.finished_at,
+            "duration_seconds": run.duration_seconds,
+            "error": run.error,
+        }
+        for run in get_recent_runs(db, job=job, limit=limit)
+    ]
@@ -1,11 +1,32 @@
 import os
 from dotenv import load_dotenv
 from pathlib import Path
+from typing import Callable, Dict
 
 # .env 파일 로드
 env_path = Path('.') / '.env'
 load_dotenv(dotenv_path=env_path)
 
+def _parse_endpoint_map(value: str, cast: Callable = str) -> Dict[str, object]:
+    """
+    "ALLBILL=15,BILLINFOPPSR=5" 형식의 환경 변수 값을 엔드포인트별 딕셔너리로 변환
+    
+    Args:
+        value: 쉼표로 구분된 "엔드포인트=값" 문자열
+        cast: 값 변환 함수 (예: float, int)
+        
+    Returns:
+        Dict[str, object]: 엔드포인트를 키로 하는 딕셔너리
+    """
+    result = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        key, raw = item.split("=", 1)
+        if key.strip():
+            result[key.strip()] = cast(raw.strip())
+    return result
+
 class Settings:
     # 애플리케이션 기본 설정
     PROJECT_NAME: str = "국회정보 대시보드"
@@ -14,13 +35,165 @@ class Settings:
     
     # 국회정보 API 설정
     ASSEMBLY_API_KEY: str = os.getenv("ASSEMBLY_API_KEY")
-    ASSEMBLY_API_BASE_URL: str = "https://open.assembly.go.kr/portal/openapi"
+    # 로컬 모의 서버(python -m app.devtools.mock_server)로 바꿔 오프라인 부하 테스트 가능
+    ASSEMBLY_API_BASE_URL: str = os.getenv("ASSEMBLY_API_BASE_URL", "https://open.assembly.go.kr/portal/openapi")
+    # 설정하면 실제 API 응답을 이 디렉터리에 fixture 파일로 기록 (모의 서버 replay 모드에서 재생)
+    ASSEMBLY_API_RECORD_DIR: str = os.getenv("ASSEMBLY_API_RECORD_DIR", "")
+    
+    # 국회정보 API 커넥션 풀 설정 (keep-alive 연결 재사용)
+    ASSEMBLY_API_POOL_CONNECTIONS: int = int(os.getenv("ASSEMBLY_API_POOL_CONNECTIONS", "4"))  # 호스트별 풀 개수
+    ASSEMBLY_API_POOL_MAXSIZE: int = int(os.getenv("ASSEMBLY_API_POOL_MAXSIZE", "10"))  # 풀당 최대 연결 수
+    
+    # 국회정보 API 페이지 설정 (API는 한 번에 최대 1,000건까지 허용 - ERROR-336)
+    ASSEMBLY_API_MAX_PAGE_SIZE: int = int(os.getenv("ASSEMBLY_API_MAX_PAGE_SIZE", "1000"))
+    
+    # 페이지 단위 조회(iter_rows)에서 응답 본문을 스트리밍으로 읽어 row를 한 건씩 파싱할지 여부
+    # (대량 백필 시 메모리 사용량이 페이지가 아닌 row 하나 크기에 비례, 응답 캐시/fixture 기록은 생략)
+    ASSEMBLY_API_STREAM_ROWS: bool = os.getenv("ASSEMBLY_API_STREAM_ROWS", "False") == "True"
+    ASSEMBLY_API_STREAM_CHUNK_SIZE: int = int(os.getenv("ASSEMBLY_API_STREAM_CHUNK_SIZE", str(64 * 1024)))
+    
+    # 국회정보 API 타임아웃 설정 (초)
+    ASSEMBLY_API_CONNECT_TIMEOUT: float = float(os.getenv("ASSEMBLY_API_CONNECT_TIMEOUT", "5"))
+    ASSEMBLY_API_TIMEOUT: float = float(os.getenv("ASSEMBLY_API_TIMEOUT", "10"))  # 기본 읽기 타임아웃
+    # 엔드포인트별 읽기 타임아웃 (환경 변수 예: "ALLBILL=15,BILLINFOPPSR=5")
+    ASSEMBLY_API_ENDPOINT_TIMEOUTS: Dict[str, float] = {
+        "BILLINFOPPSR": 5.0,  # 의안 제안자정보 - 작은 응답이므로 빠르게 실패
+        **_parse_endpoint_map(os.getenv("ASSEMBLY_API_ENDPOINT_TIMEOUTS", ""), float),
+    }
+    
+    # 국회정보 API 호출 속도 제한 설정 (초당 요청 수, 과부하 시 감속 / 연속 성공 시 가속)
+    ASSEMBLY_API_RATE_LIMIT: float = float(os.getenv("ASSEMBLY_API_RATE_LIMIT", "5"))  # 시작 속도
+    ASSEMBLY_API_RATE_BURST: float = float(os.getenv("ASSEMBLY_API_RATE_BURST", "5"))
+    ASSEMBLY_API_RATE_MIN: float = float(os.getenv("ASSEMBLY_API_RATE_MIN", "0.5"))
+    ASSEMBLY_API_RATE_MAX: float = float(os.getenv("ASSEMBLY_API_RATE_MAX", "20"))
+    ASSEMBLY_API_RATE_INCREASE_STEP: float = float(os.getenv("ASSEMBLY_API_RATE_INCREASE_STEP", "0.5"))
+    ASSEMBLY_API_RATE_DECREASE_FACTOR: float = float(os.getenv("ASSEMBLY_API_RATE_DECREASE_FACTOR", "0.5"))
+    ASSEMBLY_API_RATE_SUCCESS_THRESHOLD: int = int(os.getenv("ASSEMBLY_API_RATE_SUCCESS_THRESHOLD", "20"))
+    
+    # 여러 의안의 제안자 정보를 한 번에 조회할 때 동시에 보낼 최대 요청 수
+    ASSEMBLY_API_PROPOSER_CONCURRENCY: int = int(os.getenv("ASSEMBLY_API_PROPOSER_CONCURRENCY", "8"))
+    
+    # 국회정보 API 서킷 브레이커 설정 (엔드포인트별 연속 실패 시 호출 차단, 일정 시간 후 시험 호출)
+    ASSEMBLY_API_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("ASSEMBLY_API_BREAKER_FAILURE_THRESHOLD", "5"))
+    ASSEMBLY_API_BREAKER_RECOVERY_TIMEOUT: float = float(os.getenv("ASSEMBLY_API_BREAKER_RECOVERY_TIMEOUT", "30"))
+    ASSEMBLY_API_BREAKER_HALF_OPEN_MAX_CALLS: int = int(os.getenv("ASSEMBLY_API_BREAKER_HALF_OPEN_MAX_CALLS", "1"))
+    
+    # 국회정보 API 응답 캐시 설정 (SQLite 파일, 엔드포인트별 TTL 초 단위)
+    ASSEMBLY_API_CACHE_ENABLED: bool = os.getenv("ASSEMBLY_API_CACHE_ENABLED", "True") == "True"
+    ASSEMBLY_API_CACHE_PATH: str = os.getenv("ASSEMBLY_API_CACHE_PATH", "./api_cache.db")
+    ASSEMBLY_API_CACHE_MAX_BYTES: int = int(os.getenv("ASSEMBLY_API_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    ASSEMBLY_API_CACHE_TTL: float = float(os.getenv("ASSEMBLY_API_CACHE_TTL", "3600"))  # 기본 1시간
+    # 엔드포인트별 TTL (환경 변수 예: "ALLBILL=21600,BILLINFOPPSR=0", 0이면 캐시하지 않음)
+    # 동기화 작업(의안/의원/발의안/활동 수집)은 캐시를 읽지 않고 받은 응답으로 캐시를 갱신하며, 데이터 없음 응답은 저장하지 않음
+    ASSEMBLY_API_CACHE_TTLS: Dict[str, float] = {
+        "nwvrqwxyaytdsfvhu": 24 * 3600.0,   # 국회의원 인적사항 - 하루
+        "BILLINFOPPSR": 7 * 24 * 3600.0,    # 의안 제안자정보 - 제안 후 바뀌지 않음
+        "ALLBILL": 6 * 3600.0,              # 의안정보 통합
+        "ncocpgfiaoituanbr": 3600.0,        # 대수별 의안 목록
+        **_parse_endpoint_map(os.getenv("ASSEMBLY_API_CACHE_TTLS", ""), float),
+    }
+    
+    # 국회 대수 설정 (현재 대수, 대수별 임기 시작일)
+    ASSEMBLY_TERM: int = int(os.getenv("ASSEMBLY_TERM", "22"))
+    ASSEMBLY_TERM_START_DATES: Dict[int, str] = {
+        17: "20040530",
+        18: "20080530",
+        19: "20120530",
+        20: "20160530",
+        21: "20200530",
+        22: "20240530",
+    }
+    
+    # 다대수 백필 설정 (대수별로 나눠 여러 프로세스에서 동시에 실행, API 호출 속도 한도는 프로세스 수만큼 나눠 사용)
+    BACKFILL_TERMS: str = os.getenv("BACKFILL_TERMS", "17-22")  # 예: "17-22", "20,21,22"
+    BACKFILL_WORKERS: int = int(os.getenv("BACKFILL_WORKERS", "3"))
+    BACKFILL_MAX_PAGES: int = int(os.getenv("BACKFILL_MAX_PAGES", "1000"))  # 대수별 최대 페이지 수 (페이지당 100건)
+    
+    # 국회의원 활동 점수 설정 (app.services.scoring)
+    # 항목별 가중치 (환경 변수 예: "bills=0.5,attendance=0.3,speech=0.1,pass_rate=0.1")
+    SCORE_WEIGHTS: Dict[str, float] = {
+        "bills": 0.4,       # 발의안 수
+        "attendance": 0.3,  # 출석률
+        "speech": 0.2,      # 발언 횟수
+        "pass_rate": 0.1,   # 법안 통과율
+        **_parse_endpoint_map(os.getenv("SCORE_WEIGHTS", ""), float),
+    }
+    # 건수 항목(발의안 수, 발언 횟수)을 0~100으로 바꾸는 방식
+    # fixed: 고정 상한(SCORE_FIXED_CAPS), max: 최댓값, percentile: 상위 백분위 값(SCORE_PERCENTILE)을 상한으로, rank: 백분위 순위
+    SCORE_NORMALIZATION: str = os.getenv("SCORE_NORMALIZATION", "percentile")
+    SCORE_PERCENTILE: float = float(os.getenv("SCORE_PERCENTILE", "95"))
+    SCORE_FIXED_CAPS: Dict[str, float] = {
+        "bills": 50.0,
+        "speech": 200.0,
+        **_parse_endpoint_map(os.getenv("SCORE_FIXED_CAPS", ""), float),
+    }
+    # 상세 페이지 지표 차트용 정규화 결과를 재사용하는 최대 시간 (점수 설정/상한이 바뀌면 즉시 다시 계산)
+    SCORE_PROFILE_CACHE_SECONDS: float = float(os.getenv("SCORE_PROFILE_CACHE_SECONDS", "300"))
     
     # 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+    # SQLite 잠금 대기 설정 (동기화 워커/백필 프로세스가 같은 DB 파일에 쓸 때)
+    SQLITE_BUSY_TIMEOUT: float = float(os.getenv("SQLITE_BUSY_TIMEOUT", "30"))  # 다른 연결의 쓰기가 끝나기를 기다리는 시간 (초)
+    DB_WRITE_RETRIES: int = int(os.getenv("DB_WRITE_RETRIES", "3"))  # 그래도 잠겨 있으면 쓰기 트랜잭션을 다시 시도할 횟수
+    
+    # 동기화 파이프라인 설정 (조회 -> 파싱 -> 저장 단계 사이의 큐 크기)
+    SYNC_PREFETCH_PAGES: int = int(os.getenv("SYNC_PREFETCH_PAGES", "3"))  # 미리 조회할 페이지 수
+    SYNC_QUEUE_SIZE: int = int(os.getenv("SYNC_QUEUE_SIZE", "2"))  # 파싱 -> 저장 단계 사이에 쌓아둘 최대 페이지 수
+    SYNC_FULL_CONCURRENCY: int = int(os.getenv("SYNC_FULL_CONCURRENCY", "4"))  # 전체 동기화에서 동시에 조회할 페이지 수
     
+    # 증분 동기화 워터마크 설정
+    SYNC_WATERMARK_OVERLAP_DAYS: int = int(os.getenv("SYNC_WATERMARK_OVERLAP_DAYS", "1"))  # 발의일 워터마크보다 며칠 앞부터 다시 조회할지 (늦게 등록되는 의안 대비)
+    SYNC_STATUS_SWEEP_DAYS: int = int(os.getenv("SYNC_STATUS_SWEEP_DAYS", "60"))  # 증분 업데이트마다 처리 상태를 다시 확인할 계류 의안의 발의일 구간 (가장 오래된 계류 의안부터 돌아가며 확인)
+    SYNC_DELTA_PAGE_SIZE: int = int(os.getenv("SYNC_DELTA_PAGE_SIZE", "1000"))  # 증분 조회(ALLBILL) 페이지 크기 (API 최대 1000)
+
+    # 동기화 워커 설정 (python -m app.sync, 주기 단위: 초)
+    SYNC_IN_WEB_PROCESS: bool = os.getenv("SYNC_IN_WEB_PROCESS", "True") == "True"  # False면 웹 서버는 동기화하지 않고 조회만 함 (워커를 따로 실행)
+    SYNC_MEMBERS_INTERVAL: int = int(os.getenv("SYNC_MEMBERS_INTERVAL", "86400"))
+    SYNC_BILLS_INTERVAL: int = int(os.getenv("SYNC_BILLS_INTERVAL", "3600"))
+    SYNC_CONTENTS_INTERVAL: int = int(os.getenv("SYNC_CONTENTS_INTERVAL", "600"))
+    SYNC_SCORES_INTERVAL: int = int(os.getenv("SYNC_SCORES_INTERVAL", "3600"))
+    SYNC_JITTER_RATIO: float = float(os.getenv("SYNC_JITTER_RATIO", "0.1"))  # 주기에 더할 무작위 편차 비율 (여러 워커가 같은 시각에 몰리지 않도록)
+    SYNC_STARTUP_DELAY_MAX: int = int(os.getenv("SYNC_STARTUP_DELAY_MAX", "30"))  # 워커 시작 후 첫 실행까지 최대 대기 시간
+    SYNC_CONTENT_BATCH: int = int(os.getenv("SYNC_CONTENT_BATCH", "200"))  # 한 번에 상세 내용을 채울 의안 수
+    SYNC_MEMBER_BILLS_INTERVAL: int = int(os.getenv("SYNC_MEMBER_BILLS_INTERVAL", "86400"))
+    SYNC_MEMBER_BILLS_RATE: float = float(os.getenv("SYNC_MEMBER_BILLS_RATE", "5.0"))  # 의원별 발의안 조회에 쓸 초당 API 호출 수
+    SYNC_MEMBER_BILLS_CONCURRENCY: int = int(os.getenv("SYNC_MEMBER_BILLS_CONCURRENCY", "8"))  # 동시에 조회할 의원 수
+    SYNC_ACTIVITY_INTERVAL: int = int(os.getenv("SYNC_ACTIVITY_INTERVAL", "86400"))  # 출석률/발언 횟수 수집 주기 (대수 전체 표결정보/영상회의록을 읽음)
+    SYNC_ACTIVITY_PAGE_SIZE: int = int(os.getenv("SYNC_ACTIVITY_PAGE_SIZE", "1000"))  # 표결정보/영상회의록 페이지 크기 (API 최대 1000)
+    SYNC_ACTIVITY_RATE: float = float(os.getenv("SYNC_ACTIVITY_RATE", "5.0"))  # 출석률/발언 횟수 수집에 쓸 초당 API 호출 수 (영상회의록은 임기 중 하루당 1회 이상)
+    SYNC_ACTIVITY_CONCURRENCY: int = int(os.getenv("SYNC_ACTIVITY_CONCURRENCY", "4"))  # 동시에 조회할 회의일자 수
+
+    # 의안 상세 내용 미리 가져오기(prefetch) 설정 (조회 수, 발의일, 홈 화면 노출 순으로 우선순위 계산)
+    CONTENT_PREFETCH_RATE: float = float(os.getenv("CONTENT_PREFETCH_RATE", "2.0"))  # 미리 가져오기에 쓸 초당 API 호출 수 (사용자 요청 몫을 남겨둠)
+    CONTENT_PREFETCH_SYNC_BUDGET: int = int(os.getenv("CONTENT_PREFETCH_SYNC_BUDGET", "50"))  # 의안 동기화 직후(fetch_content) 채울 최대 의안 수
+    CONTENT_PREFETCH_CANDIDATES: int = int(os.getenv("CONTENT_PREFETCH_CANDIDATES", "1000"))  # 발의일 기준으로 살펴볼 최근 의안 수
+    CONTENT_PREFETCH_VIEW_WEIGHT: float = float(os.getenv("CONTENT_PREFETCH_VIEW_WEIGHT", "10.0"))
+    CONTENT_PREFETCH_RECENCY_WEIGHT: float = float(os.getenv("CONTENT_PREFETCH_RECENCY_WEIGHT", "1.0"))
+    CONTENT_PREFETCH_HOME_WEIGHT: float = float(os.getenv("CONTENT_PREFETCH_HOME_WEIGHT", "100.0"))
+    CONTENT_PREFETCH_VIEW_HALF_LIFE_HOURS: float = float(os.getenv("CONTENT_PREFETCH_VIEW_HALF_LIFE_HOURS", "24"))  # 조회 수 점수가 절반으로 줄어드는 시간
+    CONTENT_PREFETCH_RECENCY_DAYS: float = float(os.getenv("CONTENT_PREFETCH_RECENCY_DAYS", "30"))  # 발의일 점수가 절반이 되는 경과 일수
+    CONTENT_PREFETCH_RECHECK_HOURS: float = float(os.getenv("CONTENT_PREFETCH_RECHECK_HOURS", "72"))  # 조회했지만 내용이 비어 있던 의안을 다시 후보에 넣기까지의 시간
+    HOME_RECENT_BILLS: int = int(os.getenv("HOME_RECENT_BILLS", "5"))  # 홈 화면에 표시할 최근 발의안 수
+    BILL_VIEW_FLUSH_SECONDS: int = int(os.getenv("BILL_VIEW_FLUSH_SECONDS", "30"))  # 조회 기록을 모아서 DB에 저장하는 간격
+    BILL_VIEW_FLUSH_SIZE: int = int(os.getenv("BILL_VIEW_FLUSH_SIZE", "100"))  # 이만큼 쌓이면 간격과 관계없이 저장
+    SYNC_LOCK_PATH: str = os.getenv("SYNC_LOCK_PATH", "./sync.lock")
+    SYNC_LOCK_STALE_SECONDS: int = int(os.getenv("SYNC_LOCK_STALE_SECONDS", "21600"))  # 이 시간보다 오래된 잠금은 비정상 종료로 보고 회수
+    SYNC_LOCK_RETRY_SECONDS: int = int(os.getenv("SYNC_LOCK_RETRY_SECONDS", "60"))  # 잠금을 얻지 못한 작업을 다시 시도할 간격
+
     # 기타 설정
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    
+    def term_start_date(self, assembly_term: int) -> str:
+        """
+        국회 대수의 임기 시작일 조회
+        
+        Args:
+            assembly_term: 국회 대수
+            
+        Returns:
+            str: 임기 시작일 (YYYYMMDD, 목록에 없는 대수는 4년 주기로 계산)
+        """
+        return self.ASSEMBLY_TERM_START_DATES.get(assembly_term, f"{2004 + (assembly_term - 17) * 4}0530")
 
 settings = Settings()
\ No newline at end of file
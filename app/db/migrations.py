@@ -0,0 +1,78 @@
+"""
+경량 스키마 마이그레이션 모듈
+
+Base.metadata.create_all은 없는 테이블만 만들고 기존 테이블에 새 컬럼을 추가하지 않으므로,
+모델에 컬럼을 추가했을 때 이미 만들어진 DB(app.db 등)에 ALTER TABLE ... ADD COLUMN으로 반영합니다.
+추가하는 컬럼은 NULL을 허용해야 하며(기존 행은 NULL로 채워짐), 컬럼 삭제/변경은 다루지 않습니다.
+단일 컬럼 인덱스도 함께 만들며, 고유(unique) 인덱스는 기존 행이 모두 NULL이어도 충돌하지 않으므로 그대로 고유 인덱스로 만듭니다.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Type
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+def add_missing_columns(engine: Engine, *models: Type, fill_values: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    모델에는 있지만 DB 테이블에는 없는 컬럼을 추가
+
+    Args:
+        engine: 데이터베이스 엔진
+        models: 확인할 SQLAlchemy 모델 클래스 (테이블이 이미 생성되어 있어야 함)
+        fill_values: 컬럼을 새로 추가했을 때 기존 행에 채울 값 ({"테이블.컬럼": 값}, 선택)
+
+    Returns:
+        List[str]: 추가한 컬럼 목록 ("테이블.컬럼" 형식)
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as conn:
+        for model in models:
+            table = model.__table__
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable or column.primary_key:
+                    logger.warning(f"{table.name}.{column.name}: NULL을 허용하지 않는 컬럼은 자동으로 추가하지 않습니다.")
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                key = f"{table.name}.{column.name}"
+                if fill_values and key in fill_values:
+                    conn.execute(text(f"UPDATE {table.name} SET {column.name} = :value"), {"value": fill_values[key]})
+                for index in table.indexes:
+                    if [c.name for c in index.columns] == [column.name]:
+                        unique = "UNIQUE " if index.unique else ""
+                        conn.execute(text(f"CREATE {unique}INDEX IF NOT EXISTS {index.name} ON {table.name} ({column.name})"))
+                added.append(key)
+    if added:
+        logger.info(f"스키마 마이그레이션: 컬럼 추가 {added}")
+    return added
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """
+    앱 모델의 새 컬럼을 기존 DB에 반영 (create_all 이후 호출)
+
+    국회 대수(term) 컬럼은 추가하면서 기존 행을 현재 대수로 채웁니다.
+    (대수 컬럼이 생기기 전에는 현재 대수 데이터만 저장했으므로)
+
+    Args:
+        engine: 데이터베이스 엔진
+
+    Returns:
+        List[str]: 추가한 컬럼 목록
+    """
+    from app.core.config import settings
+    from app.models.bill import Bill
+    from app.models.member import Member
+    from app.models.sync_run import SyncRun
+
+    return add_missing_columns(
+        engine, Bill, Member, SyncRun,
+        fill_values={"bills.term": settings.ASSEMBLY_TERM, "members.term": settings.ASSEMBLY_TERM}
+    )
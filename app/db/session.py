@@ -5,8 +5,9 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 # SQLite용 엔진 생성
+# (다른 프로세스가 쓰는 중이면 바로 "database is locked"로 실패하지 않고 SQLITE_BUSY_TIMEOUT초까지 기다림)
 engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
+    settings.DATABASE_URL, connect_args={"check_same_thread": False, "timeout": settings.SQLITE_BUSY_TIMEOUT}
 )
 
 # 세션 팩토리 생성
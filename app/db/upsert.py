@@ -0,0 +1,155 @@
+"""
+대량 쓰기(bulk write) 헬퍼 모듈
+
+동기화 작업이 행마다 SELECT/INSERT를 반복하지 않도록
+한 페이지 분량의 행을 한 번의 INSERT ... ON CONFLICT DO UPDATE 문으로 저장하고,
+집계 컬럼도 한 번의 UPDATE 문으로 갱신합니다.
+SQLite와 PostgreSQL은 ON CONFLICT 구문을 사용하고, 그 밖의 DB는 ORM으로 한 건씩 처리합니다.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+from sqlalchemy import case, func, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 한 문장에 담을 최대 행 수 (SQLite 바인드 변수 개수 제한 대비)
+DEFAULT_CHUNK_SIZE = 500
+
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+T = TypeVar("T")
+
+def bulk_upsert(db: Session,
+                model: Type,
+                rows: List[Dict[str, Any]],
+                index_elements: List[str],
+                update_columns: List[str],
+                coalesce_columns: Optional[List[str]] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    여러 행을 한 번에 삽입하고, 고유 키가 겹치는 행은 지정한 컬럼만 갱신
+
+    Args:
+        db: 데이터베이스 세션
+        model: SQLAlchemy 모델 클래스
+        rows: 저장할 행 목록 (모든 행의 키 구성이 같아야 함)
+        index_elements: 충돌을 판단할 고유 컬럼 목록 (예: ["bill_id"])
+        update_columns: 충돌 시 새 값으로 갱신할 컬럼 목록
+        coalesce_columns: update_columns 중 새 값이 NULL이면 기존 값을 유지할 컬럼 목록
+        chunk_size: 한 문장에 담을 최대 행 수
+
+    Returns:
+        int: 처리한 행 수
+    """
+    if not rows:
+        return 0
+
+    coalesce_columns = set(coalesce_columns or [])
+    insert = _DIALECT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        return _orm_upsert(db, model, rows, index_elements, update_columns, coalesce_columns)
+
+    table = model.__table__
+    for start in range(0, len(rows), chunk_size):
+        stmt = insert(table).values(rows[start:start + chunk_size])
+        set_ = {}
+        for column in update_columns:
+            if column in coalesce_columns:
+                set_[column] = func.coalesce(stmt.excluded[column], table.c[column])
+            else:
+                set_[column] = stmt.excluded[column]
+        if set_:
+            stmt = stmt.on_conflict_do_update(index_elements=index_elements, set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+        db.execute(stmt)
+    return len(rows)
+
+def _orm_upsert(db: Session,
+                model: Type,
+                rows: List[Dict[str, Any]],
+                index_elements: List[str],
+                update_columns: List[str],
+                coalesce_columns: set) -> int:
+    """ON CONFLICT 구문을 지원하지 않는 DB용 한 건씩 처리하는 대체 경로"""
+    logger.debug(f"{db.get_bind().dialect.name}: ON CONFLICT 미지원 - ORM으로 한 건씩 저장")
+    for row in rows:
+        existing = db.query(model).filter_by(**{key: row[key] for key in index_elements}).first()
+        if existing is None:
+            db.add(model(**row))
+            continue
+        for column in update_columns:
+            if column in coalesce_columns and row.get(column) is None:
+                continue
+            setattr(existing, column, row.get(column))
+    db.flush()
+    return len(rows)
+
+def increment_column(db: Session, model: Type, column: str, increments: Dict[int, int]) -> int:
+    """
+    기본키별 증가량만큼 정수 컬럼을 한 번의 UPDATE 문으로 증가
+
+    Args:
+        db: 데이터베이스 세션
+        model: SQLAlchemy 모델 클래스 (기본키 컬럼 id)
+        column: 증가시킬 컬럼명 (예: "num_bills")
+        increments: {기본키: 증가량}
+
+    Returns:
+        int: 갱신된 행 수
+    """
+    increments = {key: amount for key, amount in increments.items() if amount}
+    if not increments:
+        return 0
+
+    target = getattr(model, column)
+    stmt = (
+        update(model)
+        .where(model.id.in_(list(increments.keys())))
+        .values({column: func.coalesce(target, 0) + case(increments, value=model.id, else_=0)})
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(stmt).rowcount
+
+def is_lock_error(error: Exception) -> bool:
+    """다른 연결이 DB를 잠그고 있어 실패한 오류인지 여부 (SQLite "database is locked")"""
+    return isinstance(error, OperationalError) and "locked" in str(error).lower()
+
+def run_with_lock_retry(db: Session, write: Callable[[], T], retries: int, backoff: float = 0.5) -> T:
+    """
+    쓰기 트랜잭션을 실행하고, DB 잠금으로 실패하면 롤백한 뒤 처음부터 다시 실행
+
+    여러 프로세스가 같은 SQLite 파일에 쓰면 잠금 대기 시간(busy timeout)을 넘기거나
+    읽기 트랜잭션을 쓰기로 올리지 못해 실패할 수 있으므로 일정 횟수까지 간격을 늘려 가며 재시도합니다.
+    (롤백하면 세션의 객체가 만료되어 다시 실행할 때 DB 값부터 새로 읽음)
+
+    Args:
+        db: 데이터베이스 세션
+        write: 쓰기와 커밋을 모두 수행하는 함수 (다시 실행해도 같은 결과여야 함)
+        retries: 잠금 오류 시 다시 시도할 횟수
+        backoff: 첫 재시도 전 대기 시간 (초, 재시도마다 두 배)
+
+    Returns:
+        write의 반환값
+
+    Raises:
+        Exception: 잠금 이외의 오류, 또는 재시도 후에도 잠겨 있는 경우 마지막 오류 (롤백 후 발생)
+    """
+    for attempt in range(retries + 1):
+        try:
+            return write()
+        except Exception as e:
+            db.rollback()
+            if attempt >= retries or not is_lock_error(e):
+                raise
+            delay = backoff * (2 ** attempt)
+            logger.warning(f"DB 잠금으로 쓰기 실패 - {delay:.1f}초 후 다시 시도 ({attempt + 1}/{retries}): {e}")
+            time.sleep(delay)
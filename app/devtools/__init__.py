@@ -0,0 +1,7 @@
+"""
+개발/부하 테스트용 도구 모음
+
+- fixtures: 실제 API 응답을 fixture 파일로 기록/조회
+- synthetic: 원하는 규모의 가짜 Open API 데이터 생성
+- mock_server: fixture 재생 또는 가짜 데이터를 응답하는 로컬 HTTP 서버
+"""
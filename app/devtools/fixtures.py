@@ -0,0 +1,80 @@
+"""
+국회정보 Open API 응답 fixture 저장소
+
+ASSEMBLY_API_BASE_URL 대신 로컬 모의 서버로 동기화를 재현할 수 있도록
+실제 응답을 "<디렉터리>/<엔드포인트>/<요청 키>.json" 파일로 기록하고 다시 읽어옵니다.
+요청 키는 응답 캐시와 같은 방식(엔드포인트 + 정규화된 파라미터, API 키 제외)으로 만듭니다.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+from app.services.api_cache import make_request_key, normalize_params
+
+logger = logging.getLogger(__name__)
+
+class FixtureStore:
+    """
+    API 응답 fixture 파일 저장소
+    """
+    def __init__(self, root: str):
+        """
+        FixtureStore 클래스 초기화
+
+        Args:
+            root: fixture 파일을 저장할 디렉터리
+        """
+        self.root = Path(root)
+
+    def path_for(self, endpoint: str, params: Dict[str, Any]) -> Path:
+        """요청에 해당하는 fixture 파일 경로"""
+        return self.root / endpoint / f"{make_request_key(endpoint, params)}.json"
+
+    def save(self, endpoint: str, params: Dict[str, Any], response: Dict) -> None:
+        """
+        API 원본 응답을 fixture 파일로 저장
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리 (API 키는 저장하지 않음)
+            response: 파싱된 원본 응답 딕셔너리
+        """
+        path = self.path_for(endpoint, params)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 기록 중 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "endpoint": endpoint,
+                    "params": normalize_params(params),
+                    "response": response
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"API 응답 fixture 기록 중 오류: {e}")
+
+    def load(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+        """
+        요청에 해당하는 원본 응답 조회
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+
+        Returns:
+            Optional[Dict]: 기록된 응답 (없으면 None)
+        """
+        path = self.path_for(endpoint, params)
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["response"]
+
+# ASSEMBLY_API_RECORD_DIR이 설정된 경우에만 응답을 기록
+fixture_recorder: Optional[FixtureStore] = (
+    FixtureStore(settings.ASSEMBLY_API_RECORD_DIR) if settings.ASSEMBLY_API_RECORD_DIR else None
+)
@@ -0,0 +1,200 @@
+"""
+국회정보 Open API 모의 서버
+
+실제 API 대신 동기화/부하 테스트에 사용할 로컬 HTTP 서버입니다.
+- replay: ASSEMBLY_API_RECORD_DIR로 기록한 fixture를 그대로 응답
+- synthetic: 원하는 규모의 가짜 데이터를 생성해 응답
+
+지연 시간과 오류(HTTP 500/429, ERROR-337 트래픽 초과, ERROR-500 서버 오류)를 주입할 수 있습니다.
+
+실행 방법:
+    python -m app.devtools.mock_server --mode replay --fixtures ./fixtures
+    python -m app.devtools.mock_server --mode synthetic --bills 20000 --members 300 \\
+        --latency-ms 50 --jitter-ms 20 --error-rate 0.02
+
+서버를 띄운 뒤 앱을 ASSEMBLY_API_BASE_URL=http://127.0.0.1:<포트>/portal/openapi 로 실행합니다.
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+from app.devtools.fixtures import FixtureStore
+from app.devtools.synthetic import SyntheticAssemblyData, NO_DATA
+
+logger = logging.getLogger(__name__)
+
+# 주입할 오류 종류: (HTTP 상태 코드, 응답 본문)
+INJECTED_ERRORS = [
+    (500, {"RESULT": {"CODE": "ERROR-500", "MESSAGE": "서버 오류입니다."}}),
+    (429, {"RESULT": {"CODE": "ERROR-337", "MESSAGE": "일별 트래픽 제한을 넘은 호출입니다."}}),
+    (200, {"RESULT": {"CODE": "ERROR-337", "MESSAGE": "일별 트래픽 제한을 넘은 호출입니다."}}),
+    (200, {"RESULT": {"CODE": "ERROR-500", "MESSAGE": "서버 오류입니다."}}),
+]
+
+class MockAPIServer(ThreadingHTTPServer):
+    """
+    응답 소스와 지연/오류 주입 설정을 가진 모의 API 서버
+    """
+    daemon_threads = True
+
+    def __init__(self,
+                 address: Tuple[str, int],
+                 fixtures: Optional[FixtureStore] = None,
+                 synthetic: Optional[SyntheticAssemblyData] = None,
+                 latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0,
+                 error_rate: float = 0.0,
+                 seed: int = 22):
+        """
+        MockAPIServer 클래스 초기화
+
+        Args:
+            address: (호스트, 포트)
+            fixtures: replay 모드에서 사용할 fixture 저장소
+            synthetic: synthetic 모드에서 사용할 가짜 데이터 생성기
+            latency_ms: 응답마다 추가할 지연 시간 (밀리초)
+            jitter_ms: 지연 시간에 더할 무작위 편차 (밀리초)
+            error_rate: 오류를 주입할 확률 (0~1)
+            seed: 지연/오류 주입용 난수 시드
+        """
+        super().__init__(address, MockAPIHandler)
+        self.fixtures = fixtures
+        self.synthetic = synthetic
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        # 통계
+        self.requests_served = 0
+        self.errors_injected = 0
+        self.fixture_misses = 0
+        self.connections_opened = 0
+
+    def build_response(self, endpoint: str, params: Dict[str, str]) -> Tuple[int, Dict]:
+        """
+        요청에 대한 (HTTP 상태 코드, 응답 본문) 생성
+
+        Args:
+            endpoint: 요청 경로의 마지막 부분 (API 엔드포인트)
+            params: 쿼리 문자열 파라미터
+
+        Returns:
+            Tuple[int, Dict]: 상태 코드와 응답 딕셔너리
+        """
+        with self.lock:
+            self.requests_served += 1
+            delay = self.latency_ms + self.random.uniform(0, self.jitter_ms)
+            injected = None
+            if self.error_rate > 0 and self.random.random() < self.error_rate:
+                injected = self.random.choice(INJECTED_ERRORS)
+                self.errors_injected += 1
+
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if injected is not None:
+            return injected
+
+        if self.fixtures is not None:
+            response = self.fixtures.load(endpoint, params)
+            if response is None:
+                with self.lock:
+                    self.fixture_misses += 1
+                logger.warning(f"기록되지 않은 요청: {endpoint} {params}")
+                return 200, NO_DATA
+            return 200, response
+
+        return 200, self.synthetic.response(endpoint, params)
+
+    def stats(self) -> Dict[str, int]:
+        """서버 통계 조회"""
+        return {
+            "requests": self.requests_served,
+            "errors_injected": self.errors_injected,
+            "fixture_misses": self.fixture_misses,
+            "connections_opened": self.connections_opened,
+        }
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """Open API 형식의 GET 요청을 처리하는 핸들러"""
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 방지
+
+    def setup(self):
+        # setup()은 TCP 연결 하나당 한 번 호출됨
+        with self.server.lock:
+            self.server.connections_opened += 1
+        super().setup()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+        params = dict(parse_qsl(url.query))
+        status, response = self.server.build_response(endpoint, params)
+
+        body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+def main():
+    parser = argparse.ArgumentParser(description="국회정보 Open API 모의 서버")
+    parser.add_argument("--mode", choices=["replay", "synthetic"], default="synthetic", help="응답 방식 (기본값: synthetic)")
+    parser.add_argument("--fixtures", help="replay 모드에서 읽을 fixture 디렉터리")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8800, help="포트 (기본값: 8800)")
+    parser.add_argument("--bills", type=int, default=20000, help="synthetic 모드의 의안 수 (기본값: 20000)")
+    parser.add_argument("--members", type=int, default=300, help="synthetic 모드의 의원 수 (기본값: 300)")
+    parser.add_argument("--speeches", type=int, default=None, help="synthetic 모드의 발언 수 (기본값: 의원 수 x 100)")
+    parser.add_argument("--term", type=int, default=22, help="synthetic 모드의 국회 대수 (기본값: 22)")
+    parser.add_argument("--seed", type=int, default=22, help="난수 시드 (기본값: 22)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 시간 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답 지연 편차 (밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 주입 확률 (0~1)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    fixtures = None
+    synthetic = None
+    if args.mode == "replay":
+        if not args.fixtures:
+            parser.error("replay 모드에는 --fixtures 디렉터리가 필요합니다.")
+        fixtures = FixtureStore(args.fixtures)
+    else:
+        synthetic = SyntheticAssemblyData(
+            bills=args.bills, members=args.members, speeches=args.speeches, assembly_term=args.term, seed=args.seed
+        )
+
+    server = MockAPIServer(
+        (args.host, args.port),
+        fixtures=fixtures,
+        synthetic=synthetic,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    logger.info(f"모의 API 서버 시작 ({args.mode}): ASSEMBLY_API_BASE_URL=http://{args.host}:{server.server_port}/portal/openapi")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"모의 API 서버 종료: {server.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,510 @@
+"""
+가짜 국회정보 Open API 데이터 생성 모듈
+
+실제 API와 같은 응답 구조로 원하는 규모의 의원/의안 데이터를 만들어 냅니다.
+각 행은 인덱스와 시드만으로 결정되므로 전체 데이터를 메모리에 올리지 않고
+요청된 페이지의 행만 그때그때 생성합니다.
+
+지원 엔드포인트:
+- nwvrqwxyaytdsfvhu: 국회의원 인적사항
+- ncocpgfiaoituanbr: 대수별 의안 목록
+- BILLINFOPPSR: 의안 제안자정보
+- ALLBILL: 의안정보 통합
+- nzmimeepazxkubdpq: 국회의원 본회의 표결정보
+- npeslxqbanwkimebr: 국회의원 영상회의록(발언)
+"""
+import random
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Optional, Iterator
+
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임",
+            "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍"]
+GIVEN_FIRST = ["민", "서", "지", "현", "준", "영", "수", "성", "재", "동",
+               "은", "정", "상", "진", "경", "태", "혜", "승", "우", "형"]
+GIVEN_SECOND = ["호", "우", "희", "진", "석", "훈", "아", "숙", "철", "주",
+                "연", "민", "규", "원", "식", "미", "환", "일", "빈", "윤"]
+PARTIES = ["더불어민주당", "국민의힘", "조국혁신당", "개혁신당", "진보당", "무소속"]
+REGIONS = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
+           "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
+COMMITTEES = ["법제사법위원회", "정무위원회", "기획재정위원회", "교육위원회",
+              "과학기술정보방송통신위원회", "외교통일위원회", "국방위원회", "행정안전위원회",
+              "문화체육관광위원회", "농림축산식품해양수산위원회", "산업통상자원중소벤처기업위원회",
+              "보건복지위원회", "환경노동위원회", "국토교통위원회", "정보위원회", "여성가족위원회"]
+LAWS = ["조세특례제한법", "국민건강보험법", "주택법", "근로기준법", "지방자치법", "도로교통법",
+        "공직선거법", "소득세법", "정보통신망 이용촉진 및 정보보호 등에 관한 법률", "형법",
+        "의료법", "교육기본법", "국가재정법", "환경영향평가법", "중소기업기본법"]
+RESULTS = ["원안가결", "수정가결", "대안반영폐기", "철회", "부결"]
+# 본회의 표결을 거친 처리 결과
+PLENARY_RESULTS = ("원안가결", "수정가결", "부결")
+VOTE_CHOICES = ["찬성", "반대", "기권"]
+VOTE_WEIGHTS = [85, 10, 5]
+
+NO_DATA = {"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}}
+MAX_PAGE_SIZE = 1000
+
+def _fmt(value: Optional[date]) -> Optional[str]:
+    """날짜를 API 응답 형식(YYYY-MM-DD)으로 변환"""
+    return value.strftime("%Y-%m-%d") if value else None
+
+class SyntheticAssemblyData:
+    """
+    시드 기반의 결정적인 가짜 Open API 데이터
+    """
+    def __init__(self,
+                 bills: int = 20000,
+                 members: int = 300,
+                 speeches: Optional[int] = None,
+                 assembly_term: int = 22,
+                 start_date: date = date(2024, 5, 30),
+                 end_date: Optional[date] = None,
+                 seed: int = 22):
+        """
+        SyntheticAssemblyData 클래스 초기화
+
+        Args:
+            bills: 생성할 의안 수
+            members: 생성할 국회의원 수
+            speeches: 생성할 발언 수 (기본값: 의원 수 x 100)
+            assembly_term: 국회 대수
+            start_date: 첫 의안 발의일 (대수 개원일)
+            end_date: 마지막 의안 발의일 (기본값: 오늘)
+            seed: 난수 시드
+        """
+        self.bill_count = bills
+        self.member_count = members
+        self.assembly_term = assembly_term
+        self.start_date = start_date
+        self.end_date = end_date or date.today()
+        self.seed = seed
+        self.span_days = max(1, (self.end_date - self.start_date).days)
+        self.speech_count = members * 100 if speeches is None else speeches
+        # 필요할 때 한 번만 계산 (표결된 의안 인덱스 목록, 발언자 누적 가중치)
+        self._voted_bills: Optional[List[int]] = None
+        self._speaker_weights: Optional[List[float]] = None
+
+    # ------------------------------------------------------------------
+    # 행 생성
+    # ------------------------------------------------------------------
+
+    def member_name(self, index: int) -> str:
+        """인덱스로 고유한 의원 이름 생성"""
+        surname = SURNAMES[index % len(SURNAMES)]
+        first = GIVEN_FIRST[(index // len(SURNAMES)) % len(GIVEN_FIRST)]
+        second = GIVEN_SECOND[(index // (len(SURNAMES) * len(GIVEN_FIRST))) % len(GIVEN_SECOND)]
+        return surname + first + second
+
+    def member(self, index: int) -> Dict[str, Any]:
+        """국회의원 인적사항 행 생성"""
+        rng = random.Random(self.seed * 7919 + index)
+        region = REGIONS[index % len(REGIONS)]
+        committee = COMMITTEES[index % len(COMMITTEES)]
+        return {
+            "HG_NM": self.member_name(index),
+            "HJ_NM": "",
+            "ENG_NM": f"MEMBER {index}",
+            "BTH_GBN_NM": "양",
+            "BTH_DATE": f"{1955 + rng.randrange(30)}-{1 + rng.randrange(12):02d}-{1 + rng.randrange(28):02d}",
+            "JOB_RES_NM": "",
+            "POLY_NM": PARTIES[rng.randrange(len(PARTIES))],
+            "ORIG_NM": f"{region} 제{1 + index // len(REGIONS)}선거구",
+            "ELECT_GBN_NM": "지역구",
+            "CMIT_NM": committee,
+            "CMITS": committee,
+            "REELE_GBN_NM": ["초선", "재선", "3선", "4선"][rng.randrange(4)],
+            "UNITS": f"제{self.assembly_term}대",
+            "SEX_GBN_NM": ["남", "여"][rng.randrange(2)],
+            "TEL_NO": f"02-784-{index:04d}",
+            "E_MAIL": f"member{index}@assembly.go.kr",
+            "HOMEPAGE": "",
+            "MONA_CD": f"SYN{self.seed:02d}{index:05d}",
+        }
+
+    def bill_id(self, index: int) -> str:
+        """의안 인덱스(0이 최신)로 의안ID 생성"""
+        return f"PRC_SYN{self.seed:02d}{index:09d}"
+
+    def bill_no(self, index: int) -> str:
+        """의안 인덱스(0이 최신)로 의안번호 생성 (오래된 의안일수록 작은 번호)"""
+        return str(self.assembly_term * 100000 + self.bill_count - index)
+
+    def bill_index(self, bill_id: Optional[str] = None, bill_no: Optional[str] = None) -> Optional[int]:
+        """의안ID 또는 의안번호로 의안 인덱스 조회"""
+        try:
+            if bill_id:
+                prefix = f"PRC_SYN{self.seed:02d}"
+                if not bill_id.startswith(prefix):
+                    return None
+                index = int(bill_id[len(prefix):])
+            elif bill_no:
+                index = self.assembly_term * 100000 + self.bill_count - int(bill_no)
+            else:
+                return None
+        except ValueError:
+            return None
+        return index if 0 <= index < self.bill_count else None
+
+    def rep_member_index(self, index: int) -> int:
+        """의안의 대표발의 의원 인덱스"""
+        return random.Random(self.seed * 104729 + index).randrange(self.member_count)
+
+    def _bill_facts(self, index: int) -> Dict[str, Any]:
+        """의안 하나의 공통 속성(발의일, 처리 결과, 공동발의자 등) 생성"""
+        rng = random.Random(self.seed * 1000003 + index)
+        proposal_date = self.start_date + timedelta(
+            days=(self.bill_count - 1 - index) * self.span_days // max(1, self.bill_count)
+        )
+        processed = rng.random() < 0.4
+        proc_date = None
+        result = None
+        if processed:
+            proc_date = min(self.end_date, proposal_date + timedelta(days=rng.randrange(10, 200)))
+            result = RESULTS[rng.randrange(len(RESULTS))]
+        rep_index = self.rep_member_index(index)
+        co_count = min(self.member_count - 1, 9 + rng.randrange(6))
+        co_indexes = []
+        while len(co_indexes) < co_count:
+            candidate = rng.randrange(self.member_count)
+            if candidate != rep_index and candidate not in co_indexes:
+                co_indexes.append(candidate)
+        return {
+            "rng": rng,
+            "proposal_date": proposal_date,
+            "proc_date": proc_date,
+            "result": result,
+            "rep_index": rep_index,
+            "co_indexes": co_indexes,
+            "law": LAWS[rng.randrange(len(LAWS))],
+            "committee": COMMITTEES[rng.randrange(len(COMMITTEES))],
+        }
+
+    def bill_summary(self, index: int) -> Dict[str, Any]:
+        """대수별 의안 목록(ncocpgfiaoituanbr) 행 생성"""
+        facts = self._bill_facts(index)
+        rep_name = self.member_name(facts["rep_index"])
+        return {
+            "BILL_ID": self.bill_id(index),
+            "BILL_NO": self.bill_no(index),
+            "BILL_NAME": f"{facts['law']} 일부개정법률안({rep_name}의원 대표발의)",
+            "BILL_KIND_CD": "법률안",
+            "AGE": str(self.assembly_term),
+            "CURR_COMMITTEE": facts["committee"],
+            "PROPOSE_DT": _fmt(facts["proposal_date"]),
+            # 처리된 의안은 처리일, 계류 중인 의안은 발의일
+            "PROC_DT": _fmt(facts["proc_date"] or facts["proposal_date"]),
+            "PROC_RESULT_CD": facts["result"],
+            "PROPOSER": f"{rep_name}의원 등 {len(facts['co_indexes']) + 1}인",
+            "LINK_URL": f"https://likms.assembly.go.kr/bill/billDetail.do?billId={self.bill_id(index)}",
+        }
+
+    def bill_detail(self, index: int) -> Dict[str, Any]:
+        """의안정보 통합(ALLBILL) 행 생성"""
+        facts = self._bill_facts(index)
+        rng = facts["rng"]
+        rep_name = self.member_name(facts["rep_index"])
+        proposal_date = facts["proposal_date"]
+        proc_date = facts["proc_date"]
+        cmmt_date = proposal_date + timedelta(days=1 + rng.randrange(5))
+        title = f"{facts['law']} 일부개정법률안({rep_name}의원 대표발의)"
+        return {
+            "BILL_ID": self.bill_id(index),
+            "BILL_NO": self.bill_no(index),
+            "AGE": str(self.assembly_term),
+            "BILL_NM": title,
+            "BILL_KND": "법률안",
+            "PPSR_KND": "의원",
+            "PPSR_NM": f"{rep_name}의원 등 {len(facts['co_indexes']) + 1}인",
+            "PPSL_DT": _fmt(proposal_date),
+            "JRCMIT_NM": facts["committee"],
+            "JRCMIT_CMMT_DT": _fmt(min(self.end_date, cmmt_date)),
+            "JRCMIT_PRSNT_DT": _fmt(proc_date and min(proc_date, cmmt_date + timedelta(days=7))),
+            "JRCMIT_PROC_DT": _fmt(proc_date),
+            "JRCMIT_PROC_RSLT": facts["result"],
+            "LAW_CMMT_DT": None,
+            "RGS_RSLN_DT": _fmt(proc_date) if facts["result"] in ("원안가결", "수정가결", "부결") else None,
+            "RGS_CONF_RSLT": facts["result"],
+            "DETAIL_CONTENT": (
+                f"제안이유 및 주요내용\n현행 {facts['law']}의 미비점을 보완하려는 것임"
+                f"(안 제{1 + rng.randrange(80)}조)."
+            ),
+            "LINK_URL": f"https://likms.assembly.go.kr/bill/billDetail.do?billId={self.bill_id(index)}",
+        }
+
+    def bill_proposers(self, index: int) -> List[Dict[str, Any]]:
+        """의안 제안자정보(BILLINFOPPSR) 행 목록 생성"""
+        facts = self._bill_facts(index)
+        rows = [{
+            "BILL_ID": self.bill_id(index),
+            "PPSR_NM": self.member_name(facts["rep_index"]),
+            "REP_DIV": "대표발의",
+        }]
+        for co_index in facts["co_indexes"]:
+            rows.append({
+                "BILL_ID": self.bill_id(index),
+                "PPSR_NM": self.member_name(co_index),
+                "REP_DIV": "공동발의",
+            })
+        return rows
+
+    def voted_bills(self) -> List[int]:
+        """본회의 표결을 거친 의안 인덱스 목록 (오래된 의안부터)"""
+        if self._voted_bills is None:
+            self._voted_bills = [
+                index for index in range(self.bill_count - 1, -1, -1)
+                if self._bill_facts(index)["result"] in PLENARY_RESULTS
+            ]
+        return self._voted_bills
+
+    def member_absence_rate(self, index: int) -> float:
+        """의원별 본회의 표결 불참 확률 (2~22%)"""
+        return 0.02 + 0.2 * random.Random(self.seed * 15485863 + index).random()
+
+    def member_vote(self, vote_index: int) -> Dict[str, Any]:
+        """국회의원 본회의 표결정보(nzmimeepazxkubdpq) 행 생성 (표결된 의안 x 의원 순서)"""
+        bill_index = self.voted_bills()[vote_index // self.member_count]
+        member_index = vote_index % self.member_count
+        facts = self._bill_facts(bill_index)
+        member = self.member(member_index)
+        rng = random.Random(self.seed * 2750159 + vote_index)
+        if rng.random() < self.member_absence_rate(member_index):
+            result = "불참"
+        else:
+            result = rng.choices(VOTE_CHOICES, weights=VOTE_WEIGHTS)[0]
+        return {
+            "HG_NM": member["HG_NM"],
+            "POLY_NM": member["POLY_NM"],
+            "ORIG_NM": member["ORIG_NM"],
+            "MONA_CD": member["MONA_CD"],
+            "BILL_ID": self.bill_id(bill_index),
+            "BILL_NO": self.bill_no(bill_index),
+            "BILL_NAME": f"{facts['law']} 일부개정법률안",
+            "CURR_COMMITTEE": facts["committee"],
+            "VOTE_DATE": _fmt(facts["proc_date"]),
+            "RESULT_VOTE_MOD": result,
+            "AGE": str(self.assembly_term),
+        }
+
+    def speaker_weights(self) -> List[float]:
+        """발언자 선택에 쓰는 의원별 누적 가중치 (의원마다 발언량이 크게 다름)"""
+        if self._speaker_weights is None:
+            total = 0.0
+            weights = []
+            for index in range(self.member_count):
+                total += 0.05 + random.Random(self.seed * 49979687 + index).random() ** 2
+                weights.append(total)
+            self._speaker_weights = weights
+        return self._speaker_weights
+
+    def speech_date(self, index: int) -> date:
+        """발언 인덱스(0이 가장 오래됨)의 회의일자"""
+        return self.start_date + timedelta(days=index * self.span_days // max(1, self.speech_count))
+
+    def speech(self, index: int) -> Dict[str, Any]:
+        """국회의원 영상회의록(npeslxqbanwkimebr) 발언 행 생성"""
+        rng = random.Random(self.seed * 86028121 + index)
+        member_index = rng.choices(range(self.member_count), cum_weights=self.speaker_weights())[0]
+        committee = COMMITTEES[rng.randrange(len(COMMITTEES))]
+        return {
+            "CT1": str(self.assembly_term),
+            "TAKING_DATE": self.speech_date(index).strftime("%Y%m%d"),
+            "CONF_TITLE": f"제{self.assembly_term}대 국회 {committee} 회의",
+            "ESSENTIAL_PERSON": self.member_name(member_index),
+            "LINK_URL": f"https://w3.assembly.go.kr/vod/{self.seed:02d}{index:09d}",
+        }
+
+    def _first_speech_on_or_after(self, days: int) -> int:
+        """개원일로부터 days일째 이후 회의의 첫 발언 인덱스"""
+        if days <= 0:
+            return 0
+        # speech_date(i) >= days 를 만족하는 가장 작은 i
+        return min(self.speech_count, -(-days * self.speech_count // self.span_days))
+
+    def _speech_range(self, taking_date: Optional[str]) -> range:
+        """회의일자가 정확히 taking_date(YYYYMMDD)인 발언 인덱스 범위 (실제 API처럼 하루 단위 조회, 없으면 전체)"""
+        if not taking_date:
+            return range(self.speech_count)
+        days = (datetime.strptime(taking_date, "%Y%m%d").date() - self.start_date).days
+        if days < 0:
+            return range(0)
+        return range(self._first_speech_on_or_after(days), self._first_speech_on_or_after(days + 1))
+
+    # ------------------------------------------------------------------
+    # 응답 생성
+    # ------------------------------------------------------------------
+
+    def _page(self, endpoint: str, rows: Iterator[Dict], params: Dict[str, str]) -> Dict:
+        """조건에 맞는 행들을 pIndex/pSize로 잘라 표준 응답 구조로 감싸기"""
+        page_index = max(1, int(params.get("pIndex", 1)))
+        page_size = max(1, int(params.get("pSize", 10)))
+        start = (page_index - 1) * page_size
+        page_rows = []
+        total = 0
+        for row in rows:
+            if start <= total < start + page_size:
+                page_rows.append(row)
+            total += 1
+        if not page_rows:
+            return NO_DATA
+        return {endpoint: [
+            {"head": [
+                {"list_total_count": total},
+                {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}}
+            ]},
+            {"row": page_rows}
+        ]}
+
+    def _count_page(self, endpoint: str, total: int, make_row, params: Dict[str, str], first: int = 0) -> Dict:
+        """필터 없는 목록(인덱스 first부터 total 전까지)에서 요청 페이지의 행만 생성"""
+        page_index = max(1, int(params.get("pIndex", 1)))
+        page_size = max(1, int(params.get("pSize", 10)))
+        start = first + (page_index - 1) * page_size
+        indexes = range(start, min(start + page_size, total))
+        if not indexes:
+            return NO_DATA
+        return {endpoint: [
+            {"head": [
+                {"list_total_count": total - first},
+                {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}}
+            ]},
+            {"row": [make_row(index) for index in indexes]}
+        ]}
+
+    def response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        """
+        엔드포인트와 요청 파라미터에 해당하는 응답 생성
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: 요청 파라미터 (쿼리 문자열 값)
+
+        Returns:
+            Dict: 실제 API와 같은 구조의 응답
+        """
+        try:
+            if int(params.get("pSize", 10)) > MAX_PAGE_SIZE:
+                return {"RESULT": {"CODE": "ERROR-336", "MESSAGE": "데이터요청은 한번에 최대 1,000건을 넘을 수 없습니다."}}
+        except ValueError:
+            return {"RESULT": {"CODE": "ERROR-333", "MESSAGE": "요청위치 값의 타입이 유효하지 않습니다."}}
+
+        handler = {
+            "nwvrqwxyaytdsfvhu": self._members_response,
+            "ncocpgfiaoituanbr": self._bill_list_response,
+            "BILLINFOPPSR": self._proposers_response,
+            "ALLBILL": self._allbill_response,
+            "nzmimeepazxkubdpq": self._member_votes_response,
+            "npeslxqbanwkimebr": self._speeches_response,
+        }.get(endpoint)
+        if handler is None:
+            return {"RESULT": {"CODE": "ERROR-310", "MESSAGE": "해당하는 서비스를 찾을 수 없습니다."}}
+        return handler(endpoint, params)
+
+    def _age_matches(self, params: Dict[str, str], key: str) -> bool:
+        """대수 파라미터가 생성 데이터의 대수와 일치하는지 확인"""
+        return params.get(key, str(self.assembly_term)) == str(self.assembly_term)
+
+    def _members_response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        if not self._age_matches(params, "ASSEMBLY"):
+            return NO_DATA
+        name = params.get("HG_NM")
+        party = params.get("POLY_NM")
+        if not name and not party:
+            return self._count_page(endpoint, self.member_count, self.member, params)
+        rows = (
+            row for row in (self.member(i) for i in range(self.member_count))
+            if (not name or name in row["HG_NM"]) and (not party or party in row["POLY_NM"])
+        )
+        return self._page(endpoint, rows, params)
+
+    def _bill_list_response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        if not self._age_matches(params, "AGE"):
+            return NO_DATA
+        return self._count_page(endpoint, self.bill_count, self.bill_summary, params)
+
+    def _proposers_response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        index = self.bill_index(bill_id=params.get("BILL_ID"))
+        if index is None:
+            return NO_DATA
+        return self._page(endpoint, iter(self.bill_proposers(index)), params)
+
+    def _allbill_response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        # 의안ID/의안번호 직접 조회
+        if params.get("BILL_ID") or params.get("BILL_NO"):
+            index = self.bill_index(bill_id=params.get("BILL_ID"), bill_no=params.get("BILL_NO"))
+            if index is None:
+                return NO_DATA
+            return self._page(endpoint, iter([self.bill_detail(index)]), params)
+
+        if not self._age_matches(params, "AGE"):
+            return NO_DATA
+
+        proposer = params.get("PPSR_NM")
+        bill_name = params.get("BILL_NM")
+        committee = params.get("COMMITTEE")
+        propose_from = params.get("PROPOSE_FROM")
+        propose_to = params.get("PROPOSE_TO")
+        date_from = datetime.strptime(propose_from, "%Y%m%d").date() if propose_from else None
+        date_to = datetime.strptime(propose_to, "%Y%m%d").date() if propose_to else None
+
+        def matches(index: int) -> bool:
+            # 대표발의자 조건은 전체 행을 만들기 전에 먼저 걸러냄
+            if proposer and proposer != self.member_name(self.rep_member_index(index)):
+                return False
+            return True
+
+        def rows() -> Iterator[Dict]:
+            for index in range(self.bill_count):
+                if not matches(index):
+                    continue
+                # 발의일 조건: 최신 의안부터 정렬되어 있으므로 시작일보다 오래되면 중단
+                facts_date = self.start_date + timedelta(
+                    days=(self.bill_count - 1 - index) * self.span_days // max(1, self.bill_count)
+                )
+                if date_from and facts_date < date_from:
+                    break
+                if date_to and facts_date > date_to:
+                    continue
+                row = self.bill_detail(index)
+                if bill_name and bill_name not in row["BILL_NM"]:
+                    continue
+                if committee and committee not in row["JRCMIT_NM"]:
+                    continue
+                yield row
+
+        return self._page(endpoint, rows(), params)
+
+    def _member_votes_response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        if not self._age_matches(params, "ASSEMBLY"):
+            return NO_DATA
+        bill_id = params.get("BILL_ID")
+        name = params.get("HG_NM")
+        if bill_id:
+            index = self.bill_index(bill_id=bill_id)
+            if index is None or index not in self.voted_bills():
+                return NO_DATA
+            first = self.voted_bills().index(index) * self.member_count
+            rows = (self.member_vote(first + i) for i in range(self.member_count))
+            if name:
+                rows = (row for row in rows if name in row["HG_NM"])
+            return self._page(endpoint, rows, params)
+        total = len(self.voted_bills()) * self.member_count
+        if not name:
+            return self._count_page(endpoint, total, self.member_vote, params)
+        members = [i for i in range(self.member_count) if name in self.member_name(i)]
+        rows = (
+            self.member_vote(bill * self.member_count + member)
+            for bill in range(len(self.voted_bills())) for member in members
+        )
+        return self._page(endpoint, rows, params)
+
+    def _speeches_response(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        if not self._age_matches(params, "CT1"):
+            return NO_DATA
+        # 회의일자는 오래된 발언부터 정렬되어 있으므로 해당 날짜의 인덱스 범위만 계산
+        indexes = self._speech_range(params.get("TAKING_DATE"))
+        speaker = params.get("ESSENTIAL_PERSON")
+        if not speaker:
+            return self._count_page(endpoint, indexes.stop, self.speech, params, first=indexes.start)
+        rows = (
+            row for row in (self.speech(i) for i in indexes)
+            if row["ESSENTIAL_PERSON"] == speaker
+        )
+        return self._page(endpoint, rows, params)
@@ -15,9 +15,13 @@ from jinja2 import pass_context
 from app.api import api_router
 from app.core.config import settings
 from app.db.session import engine, get_db
-from app.models import member, bill
+from app.db.migrations import upgrade_schema
+from app.models import member, bill, sync_run
 from app.routes import dashboard_routes, member_routes, bill_routes
 from app.services import bill_service, member_service
+from app.services.assembly_api import assembly_api, async_assembly_api
+from app.services.bill_prefetch import bill_view_tracker
+from app.sync.lock import sync_lock
 from app.utils.helpers import clean_duplicate_members, pprint_filter
 
 # 로거 설정
@@ -27,6 +31,8 @@ logger = logging.getLogger(__name__)
 # 데이터베이스 테이블 생성 - 테이블이 없을 때만 생성
 member.Base.metadata.create_all(bind=engine)
 bill.Bill.metadata.create_all(bind=engine)
+# 기존 DB에 모델에 새로 추가된 컬럼 반영
+upgrade_schema(engine)
 
 # 서버 시작 시 동기화 상태 추적을 위한 변수
 bills_sync_in_progress = False
@@ -71,6 +77,8 @@ app.include_router(bill_routes.router)
 @app.on_event("startup")
 def startup_clean():
     """애플리케이션 시작 시 중복 데이터 정리"""
+    if not settings.SYNC_IN_WEB_PROCESS:
+        return
     db = next(get_db())
     try:
         clean_duplicate_members(db)
@@ -83,6 +91,10 @@ def startup_event():
     """
     애플리케이션 시작 시 국회의원 데이터를 확인하고 필요한 경우에만 API에서 불러옴
     """
+    # 동기화 워커(python -m app.sync)를 따로 실행하는 경우 웹 서버는 조회만 함
+    if not settings.SYNC_IN_WEB_PROCESS:
+        logger.info("웹 서버 동기화가 꺼져 있습니다 (SYNC_IN_WEB_PROCESS=False). 국회의원 동기화를 건너뜁니다.")
+        return
     db = next(get_db())
     try:
         # 기존 데이터 확인
@@ -94,20 +106,23 @@ def startup_event():
             logger.info(f"이미 {existing_count}명의 국회의원 데이터가 DB에 존재합니다. API 호출을 건너뜁니다.")
             return
             
-        # 데이터 동기화가 필요한 경우, 기존 데이터를 모두 삭제하고 새로 추가
+        # 데이터 동기화가 필요한 경우, 국회의원코드 기준으로 기존 의원은 갱신하고 새 의원만 추가
+        # (기존 데이터를 지우지 않으므로 의안의 발의자 연결이 유지됨)
         if existing_count > 0:
-            logger.info(f"기존 {existing_count}명의 국회의원 데이터를 삭제하고 새로 불러옵니다.")
-            db.query(member.Member).delete()
-            db.commit()
+            logger.info(f"기존 {existing_count}명의 국회의원 데이터를 API 데이터로 갱신합니다.")
             
         # API 키 확인
         api_key = settings.ASSEMBLY_API_KEY
         if not api_key or api_key == "":
             logger.warning("API 키가 설정되지 않았습니다.")
         
-        # 국회의원 정보 동기화
-        member_count = member_service.sync_members_from_api(db, assembly_term=22)
-        logger.info(f"API에서 {member_count}명의 국회의원 데이터를 성공적으로 불러왔습니다.")
+        # 국회의원 정보 동기화 (동기화 워커가 실행 중이면 겹치지 않도록 건너뜀)
+        with sync_lock.hold("web:members") as acquired:
+            if not acquired:
+                logger.info("다른 동기화 작업이 실행 중이므로 서버 시작 시 국회의원 동기화를 건너뜁니다.")
+                return
+            result = member_service.sync_members_from_api(db, assembly_term=settings.ASSEMBLY_TERM)
+        logger.info(f"API에서 {result['total']}명의 국회의원 데이터를 성공적으로 불러왔습니다.")
         
     except Exception as e:
         db.rollback()
@@ -120,8 +135,8 @@ async def sync_bills_on_startup():
     """애플리케이션 시작 시 의안 데이터 동기화"""
     global bills_sync_in_progress, bills_sync_completed
     
-    # 이미 동기화가 진행 중이거나 완료된 경우 스킵
-    if bills_sync_in_progress or bills_sync_completed:
+    # 이미 동기화가 진행 중이거나 완료된 경우, 또는 동기화 워커가 따로 실행되는 경우 스킵
+    if bills_sync_in_progress or bills_sync_completed or not settings.SYNC_IN_WEB_PROCESS:
         return
         
     # 백그라운드 작업으로 시작 (서버 시작 블로킹 방지)
@@ -135,32 +150,39 @@ async def background_sync_bills():
         bills_sync_in_progress = True
         logger.info("서버 시작: 의안 데이터 백그라운드 동기화 시작...")
         
-        db = next(get_db())
-        
-        try:
-            # 기존 데이터 체크
-            bills_count = db.query(bill.Bill).count()
+        # 동기화 워커가 실행 중이면 겹치지 않도록 건너뜀
+        with sync_lock.hold("web:bills") as acquired:
+            if not acquired:
+                logger.info("다른 동기화 작업이 실행 중이므로 서버 시작 시 의안 동기화를 건너뜁니다.")
+                return
             
-            if bills_count < 100:
-                # 데이터가 적은 경우 - 전체 동기화
-                logger.info(f"의안 데이터 부족 (현재 {bills_count}개). 전체 동기화를 시작합니다.")
-                await bill_service.sync_bills_data(db, max_pages=20, incremental=False, fetch_content=True)
-            else:
-                # 데이터가 이미 있는 경우 - 증분 동기화만 수행
-                logger.info(f"의안 데이터가 있습니다 (현재 {bills_count}개). 증분 동기화를 시작합니다.")
-                await bill_service.sync_bills_data(db, max_pages=5, incremental=True, fetch_content=True)
-                
-            logger.info("서버 시작 시 의안 데이터 동기화 완료")
+            db = next(get_db())
             
-        except Exception as e:
-            logger.error(f"의안 데이터 동기화 중 오류: {e}")
-        finally:
-            db.close()
+            try:
+                await bill_service.auto_sync_bills(db)
+                    
+                logger.info("서버 시작 시 의안 데이터 동기화 완료")
+                
+            except Exception as e:
+                logger.error(f"의안 데이터 동기화 중 오류: {e}")
+            finally:
+                db.close()
             
         bills_sync_completed = True
     finally:
         bills_sync_in_progress = False
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 저장하지 않은 의안 조회 기록을 저장하고 API 클라이언트의 커넥션 풀 정리"""
+    db = next(get_db())
+    try:
+        bill_view_tracker.flush(db)
+    finally:
+        db.close()
+    assembly_api.close()
+    await async_assembly_api.aclose()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
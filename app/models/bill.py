@@ -16,6 +16,7 @@ class Bill(Base):
     id = Column(Integer, primary_key=True, index=True, comment="고유 ID")
     bill_id = Column(String, index=True, unique=True, comment="의안ID - BILL_ID")
     bill_no = Column(String, index=True, comment="의안번호 - BILL_NO")
+    term = Column(Integer, index=True, nullable=True, comment="국회 대수 - AGE")
     
     # 의안 기본 정보
     title = Column(String, index=True, comment="의안명")
@@ -24,6 +25,7 @@ class Bill(Base):
     committee = Column(String, index=True, comment="소관 위원회")
     proposal_date = Column(Date, comment="발의일")
     content = Column(Text, comment="제안이유 및 주요내용")
+    content_checked_at = Column(DateTime, nullable=True, comment="상세 내용을 마지막으로 조회한 일시 (내용이 비어 있던 의안의 재조회 간격 판단용)")
     
     # 발의자 관련 정보
     co_proposers = Column(String, nullable=True, comment="공동발의자 (쉼표로 구분된 문자열)")
@@ -36,6 +38,7 @@ class Bill(Base):
     bill_kind = Column(String, nullable=True, comment="의안 종류")
     
     # 데이터 관리용 필드
+    row_hash = Column(String, nullable=True, comment="처리 상태/표결 정보 해시 (변경 감지용)")
     last_updated = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment="최종 업데이트 일시")
 
     # 관계 설정 (발의자와의 관계)
@@ -72,5 +75,23 @@ class Bill(Base):
         # 처리 경과 정보 날짜순 정렬
         return sorted(process_history, key=lambda x: x["date"])
 
+class BillView(Base):
+    """
+    의안 상세 페이지 조회 기록을 저장하는 모델
+
+    의안 상세 내용 미리 가져오기(prefetch)의 우선순위 계산에 사용
+    (아직 DB에 없는 의안도 조회될 수 있으므로 의안번호로 저장)
+    """
+    __tablename__ = "bill_views"
+
+    id = Column(Integer, primary_key=True, index=True, comment="고유 ID")
+    bill_no = Column(String, index=True, unique=True, nullable=False, comment="의안번호 - BILL_NO")
+    view_count = Column(Integer, default=0, comment="누적 조회 수")
+    last_viewed_at = Column(DateTime, nullable=True, comment="마지막 조회 일시")
+
+    def __repr__(self):
+        """객체 문자열 표현"""
+        return f"<BillView(bill_no='{self.bill_no}', view_count={self.view_count})>"
+
 # Member 모델에 bills 관계 설정 (순환 참조 문제 해결)
 Member.bills = relationship("Bill", order_by=Bill.proposal_date.desc(), back_populates="proposer_member")
\ No newline at end of file
@@ -12,6 +12,7 @@ class Member(Base):
 
     # 기본 식별 필드
     id = Column(Integer, primary_key=True, index=True)
+    member_code = Column(String, index=True, unique=True, nullable=True, comment="국회의원코드 - MONA_CD")
     name = Column(String, index=True, nullable=False, comment="국회의원 이름")
     
     # 기본 인적사항
@@ -44,9 +45,12 @@ class Member(Base):
     speech_count = Column(Integer, default=0, comment="발언 횟수")
     activity_score = Column(Float, default=0.0, comment="활동 점수 (자체 계산)")
     bill_pass_rate = Column(Float, default=0.0, comment="법안 통과율 (%)")
+    score_dirty = Column(Boolean, index=True, nullable=True, comment="점수 지표가 바뀌어 활동 점수를 다시 계산해야 하는지 여부")
     
     # 데이터 관리용 필드
     is_active = Column(Boolean, default=True, comment="현직 여부")
+    term = Column(Integer, index=True, nullable=True, comment="국회 대수 (여러 대수에 걸친 의원은 가장 최근 대수)")
+    row_hash = Column(String, nullable=True, comment="원본 API 행 해시 (변경 감지용)")
     last_updated = Column(Date, nullable=True, comment="정보 최종 업데이트 일자")
 
     # relationship은 bill.py에서 정의 (순환 참조 방지)
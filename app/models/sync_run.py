@@ -0,0 +1,63 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Float, Text, UniqueConstraint
+from datetime import datetime
+from app.db.session import Base
+
+class SyncRun(Base):
+    """
+    데이터 동기화 실행 기록(ledger)을 저장하는 모델
+
+    실행 단위로 모드, 마지막으로 완료한 페이지(체크포인트), 최고 수위(high-water mark),
+    처리 건수와 소요 시간을 기록하여 중단된 동기화를 이어서 실행할 수 있게 함
+    """
+    __tablename__ = "sync_runs"
+
+    # 기본 식별 필드
+    id = Column(Integer, primary_key=True, index=True, comment="실행 ID")
+    job = Column(String, index=True, nullable=False, comment="동기화 작업 이름 (예: bills)")
+    mode = Column(String, nullable=False, comment="실행 모드 (full/incremental)")
+    status = Column(String, index=True, nullable=False, default="running", comment="상태 (running/completed/failed)")
+
+    # 체크포인트 정보
+    max_pages = Column(Integer, nullable=True, comment="처리할 최대 페이지 수")
+    last_completed_page = Column(Integer, default=0, comment="마지막으로 저장을 마친 페이지")
+    high_water_date = Column(Date, nullable=True, comment="저장한 의안 중 가장 최근 날짜")
+    high_water_bill_no = Column(String, nullable=True, comment="저장한 의안 중 가장 큰 의안번호")
+    resume_count = Column(Integer, default=0, comment="이어서 실행한 횟수")
+
+    # 처리 건수
+    new_count = Column(Integer, default=0, comment="신규 저장 건수")
+    updated_count = Column(Integer, default=0, comment="업데이트 건수")
+    unchanged_count = Column(Integer, default=0, comment="원본 행이 바뀌지 않아 저장하지 않은 건수")
+    skipped_count = Column(Integer, default=0, comment="건너뛴 건수")
+
+    # 실행 시간
+    started_at = Column(DateTime, default=datetime.now, comment="최초 시작 일시")
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment="마지막 체크포인트 일시")
+    finished_at = Column(DateTime, nullable=True, comment="완료 일시")
+    duration_seconds = Column(Float, default=0.0, comment="실제 실행 시간 합계 (초, 재개 전 실행 포함)")
+    error = Column(Text, nullable=True, comment="실패 시 오류 메시지")
+
+    def __repr__(self):
+        """객체 문자열 표현"""
+        return f"<SyncRun(id={self.id}, job='{self.job}', mode='{self.mode}', status='{self.status}', page={self.last_completed_page})>"
+
+class SyncWatermark(Base):
+    """
+    증분 동기화의 워터마크(어디까지 반영했는지)를 저장하는 모델
+
+    작업별로 이름이 다른 워터마크를 여러 개 둘 수 있음 (예: bills의 proposed - 신규 발의, status - 처리 상태 변경)
+    날짜가 아닌 상태(예: 활동 점수 정규화 상한)는 state에 저장
+    """
+    __tablename__ = "sync_watermarks"
+    __table_args__ = (UniqueConstraint("job", "name", name="uq_sync_watermarks_job_name"),)
+
+    id = Column(Integer, primary_key=True, index=True, comment="고유 ID")
+    job = Column(String, index=True, nullable=False, comment="동기화 작업 이름 (예: bills)")
+    name = Column(String, nullable=False, comment="워터마크 이름 (예: proposed, status)")
+    value = Column(Date, nullable=True, comment="워터마크 날짜")
+    state = Column(Text, nullable=True, comment="날짜가 아닌 워터마크 상태 (예: 마지막으로 적용한 활동 점수 설정/정규화 상한)")
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment="갱신 일시")
+
+    def __repr__(self):
+        """객체 문자열 표현"""
+        return f"<SyncWatermark(job='{self.job}', name='{self.name}', value={self.value})>"
@@ -10,9 +10,11 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.bill import Bill as BillModel
-from app.services.assembly_api import assembly_api
+from app.services.assembly_api import async_assembly_api
+from app.services.bill_prefetch import bill_view_tracker
 from app.utils.helpers import calculate_pagination_range, create_process_history
 
 # 로거 설정
@@ -63,8 +65,8 @@ async def bills_page(
         page = 1 if page < 1 else page
         limit = max(1, min(limit, 100))  # 1~100 사이로 제한
 
-        # 쿼리 빌드
-        query = db.query(BillModel)
+        # 쿼리 빌드 (현재 대수 의안만, 이전 대수 의안은 백필 데이터)
+        query = db.query(BillModel).filter(BillModel.term == settings.ASSEMBLY_TERM)
         
         # 필터 적용
         if title:
@@ -176,9 +178,14 @@ async def bill_detail_page(
         # DB에서 의안 정보 조회
         bill = db.query(BillModel).filter(BillModel.bill_no == bill_no).first()
         
+        # 조회 기록 (미리 가져오기 우선순위와 DB만으로 응답한 비율 집계용)
+        bill_view_tracker.record(bill_no, served_from_db=bool(bill and bill.content))
+        bill_view_tracker.maybe_flush(db)
+        
         # DB에 없거나 내용이 비어있으면 API에서 조회
+        # (동시에 같은 의안을 조회하는 요청은 API 호출 하나로 병합됨)
         if not bill or not bill.content:
-            bill_data = assembly_api.get_bill_detail(bill_no=bill_no)
+            bill_data = await async_assembly_api.get_bill_detail(bill_no=bill_no)
             
             if not bill_data:
                 raise HTTPException(status_code=404, detail="발의안을 찾을 수 없습니다")
@@ -195,7 +202,7 @@ async def bill_detail_page(
             # 제안자 정보 조회
             proposers_info = {}
             if bill_id:
-                proposers_info = assembly_api.get_bill_proposers(bill_id)
+                proposers_info = await async_assembly_api.get_bill_proposers(bill_id)
 
             # API 응답 구조 로깅
             logger.info(f"발의안 API 응답 필드: {list(bill_data.keys())}")
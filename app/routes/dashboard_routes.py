@@ -11,9 +11,11 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.member import Member as MemberModel
 from app.models.bill import Bill as BillModel
+from app.services.bill_prefetch import get_recent_bills
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -57,8 +59,8 @@ async def home_page(request: Request, db: Session = Depends(get_db)):
             'counts': [party[1] for party in party_counts if party[0]]   # 빈 문자열 제외
         }
         
-        # 최근 발의안 5개 조회
-        recent_bills = db.query(BillModel).order_by(BillModel.proposal_date.desc()).limit(5).all()
+        # 최근 발의안 조회 (상세 내용 미리 가져오기에서도 같은 목록을 우선 처리)
+        recent_bills = get_recent_bills(db)
         
         return templates.TemplateResponse(
             "index.html", 
@@ -127,6 +129,7 @@ async def search_page(
         
         # 발의안 검색
         bills = db.query(BillModel)\
+            .filter(BillModel.term == settings.ASSEMBLY_TERM)\
             .filter(
                 BillModel.title.contains(q) | 
                 BillModel.content.contains(q) |
@@ -137,6 +140,7 @@ async def search_page(
             .all()
         
         total_bills = db.query(BillModel)\
+            .filter(BillModel.term == settings.ASSEMBLY_TERM)\
             .filter(
                 BillModel.title.contains(q) | 
                 BillModel.content.contains(q) |
@@ -11,9 +11,11 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.member import Member as MemberModel
 from app.models.bill import Bill as BillModel
+from app.services.scoring import member_metric_profile
 from app.utils.helpers import calculate_pagination_range
 
 # 로거 설정
@@ -159,20 +161,22 @@ async def member_detail_page(
                 .order_by(BillModel.proposal_date.desc())\
                 .limit(5).all()
             
-            # 활동 지표 계산
+            # 활동 지표 계산 (활동 점수와 같은 방식으로 0~100 정규화, 평균은 같은 대수 의원 기준)
+            # (위원회 활동 지표는 아직 수집하지 않으므로 고정값)
+            profile = member_metric_profile(db, member.id, member.term or settings.ASSEMBLY_TERM)
             activity_data = {
                 "member": {
-                    "bills": (member.num_bills / 50) * 100 if member.num_bills else 85,
-                    "attendance": member.attendance_rate if member.attendance_rate else 95,
-                    "speeches": (member.speech_count / 200) * 100 if member.speech_count else 90,
-                    "pass_rate": member.bill_pass_rate if member.bill_pass_rate else 75,
+                    "bills": profile["member"]["bills"],
+                    "attendance": profile["member"]["attendance"],
+                    "speeches": profile["member"]["speech"],
+                    "pass_rate": profile["member"]["pass_rate"],
                     "committee": 88
                 },
                 "average": {
-                    "bills": 70,
-                    "attendance": 80,
-                    "speeches": 65,
-                    "pass_rate": 60,
+                    "bills": profile["average"]["bills"],
+                    "attendance": profile["average"]["attendance"],
+                    "speeches": profile["average"]["speech"],
+                    "pass_rate": profile["average"]["pass_rate"],
                     "committee": 75
                 }
             }
@@ -0,0 +1,239 @@
+"""
+국회정보 Open API 응답 캐시 모듈
+
+API 응답을 SQLite 파일에 저장하여 서버 재시작이나 동기화 재실행 시
+같은 페이지를 다시 내려받지 않도록 합니다.
+- 키: 엔드포인트 + 정규화된 요청 파라미터 (API 키 제외)
+- 엔드포인트별 TTL, 용량 한도 초과 시 LRU 방식으로 삭제
+- 적중/미적중 횟수 집계
+"""
+import json
+import logging
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에서 제외할 파라미터 (API 키와 응답 형식은 결과에 영향을 주지 않음)
+EXCLUDED_PARAMS = {"KEY", "Type"}
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """
+    요청 파라미터 정규화 (API 키/응답 형식 제외, 값은 문자열로 통일, 키 순서 정렬)
+
+    Args:
+        params: API 요청 파라미터 딕셔너리
+
+    Returns:
+        Dict[str, str]: 정규화된 파라미터
+    """
+    return {
+        str(key): str(value)
+        for key, value in sorted(params.items(), key=lambda item: str(item[0]))
+        if key not in EXCLUDED_PARAMS and value is not None
+    }
+
+def make_request_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """
+    엔드포인트와 정규화된 파라미터로 요청 키 생성
+
+    Args:
+        endpoint: API 엔드포인트 문자열
+        params: API 요청 파라미터 딕셔너리
+
+    Returns:
+        str: 요청 키 (SHA-256 해시)
+    """
+    raw = json.dumps([endpoint, sorted(normalize_params(params).items())], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """
+    SQLite 기반 API 응답 캐시
+    """
+    def __init__(self,
+                 path: str,
+                 max_bytes: int,
+                 default_ttl: float,
+                 endpoint_ttls: Optional[Dict[str, float]] = None,
+                 enabled: bool = True):
+        """
+        ResponseCache 클래스 초기화
+
+        Args:
+            path: 캐시 SQLite 파일 경로
+            max_bytes: 캐시 최대 용량 (바이트, 압축된 응답 크기 기준)
+            default_ttl: 기본 유효 시간 (초)
+            endpoint_ttls: 엔드포인트별 유효 시간 (초, 0이면 캐시하지 않음)
+            enabled: 캐시 사용 여부
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """캐시 DB 연결 조회 (처음 사용할 때 테이블 생성)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache ("
+                " key TEXT PRIMARY KEY,"
+                " endpoint TEXT NOT NULL,"
+                " body BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_api_cache_last_access ON api_cache (last_access)")
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM api_cache").fetchone()[0]
+        return self._conn
+
+    def get_ttl(self, endpoint: str) -> float:
+        """엔드포인트의 캐시 유효 시간(초) 조회"""
+        return self.endpoint_ttls.get(endpoint, self.default_ttl)
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+
+        Returns:
+            Optional[Dict]: 캐시된 응답 (없거나 만료되었으면 None)
+        """
+        if not self.enabled or self.get_ttl(endpoint) <= 0:
+            return None
+
+        key = make_request_key(endpoint, params)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                row = conn.execute(
+                    "SELECT body, size, expires_at FROM api_cache WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                body, size, expires_at = row
+                if expires_at <= now:
+                    # 만료된 항목 삭제
+                    conn.execute("DELETE FROM api_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    self._total_bytes -= size
+                    self.misses += 1
+                    return None
+
+                conn.execute("UPDATE api_cache SET last_access = ? WHERE key = ?", (now, key))
+                conn.commit()
+                self.hits += 1
+
+            return json.loads(zlib.decompress(body).decode("utf-8"))
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"API 응답 캐시 조회 중 오류: {e}")
+            return None
+
+    def set(self, endpoint: str, params: Dict[str, Any], data: Dict) -> None:
+        """
+        응답을 캐시에 저장하고 용량 한도를 넘으면 오래 사용하지 않은 항목부터 삭제
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+            data: 저장할 응답 딕셔너리
+        """
+        ttl = self.get_ttl(endpoint)
+        if not self.enabled or ttl <= 0:
+            return
+
+        key = make_request_key(endpoint, params)
+        body = zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        size = len(body)
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                previous = conn.execute("SELECT size FROM api_cache WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO api_cache (key, endpoint, body, size, expires_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, body, size, now + ttl, now)
+                )
+                self._total_bytes += size - (previous[0] if previous else 0)
+                self._evict(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"API 응답 캐시 저장 중 오류: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """용량 한도를 넘은 만큼 마지막 사용 시각이 오래된 항목부터 삭제"""
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM api_cache ORDER BY last_access LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                conn.execute("DELETE FROM api_cache WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("DELETE FROM api_cache")
+            conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict[str, Any]: 적중/미적중 횟수, 적중률, 저장 용량 등
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+# 두 API 클라이언트(동기/비동기)가 함께 사용하는 캐시 인스턴스
+response_cache = ResponseCache(
+    path=settings.ASSEMBLY_API_CACHE_PATH,
+    max_bytes=settings.ASSEMBLY_API_CACHE_MAX_BYTES,
+    default_ttl=settings.ASSEMBLY_API_CACHE_TTL,
+    endpoint_ttls=settings.ASSEMBLY_API_CACHE_TTLS,
+    enabled=settings.ASSEMBLY_API_CACHE_ENABLED
+)
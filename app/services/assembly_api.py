@@ -1,205 +1,386 @@
+import codecs
 import logging
+import asyncio
 import requests
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterator, AsyncIterator
+from requests.adapters import HTTPAdapter
 
 from app.core.config import settings
+from app.services.api_cache import ResponseCache, make_request_key, response_cache
+from app.services.rate_limiter import AdaptiveRateLimiter, rate_limiter
+from app.services.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError, circuit_breakers
+from app.services.json_stream import RowStreamParser
+from app.services.single_flight import SingleFlight, request_coalescer
+from app.devtools.fixtures import fixture_recorder
 
 logger = logging.getLogger(__name__)
 
-class AssemblyAPI:
+# 과부하/일시 장애로 보고 호출 속도를 줄여야 하는 API 결과 코드
+# (ERROR-337: 일별 트래픽 초과, ERROR-500: 서버 오류, ERROR-600: 데이터베이스 연결 오류)
+THROTTLE_RESULT_CODES = {"ERROR-337", "ERROR-500", "ERROR-600"}
+
+class AssemblyAPIError(Exception):
     """
-    국회정보 Open API와 통신하여 데이터를 가져오는 클래스
+    국회정보 API가 오류 응답을 보낸 경우 발생하는 예외
+
+    Attributes:
+        status_code: HTTP 상태 코드 (HTTP 오류인 경우)
+        code: API 결과 코드 (예: ERROR-337)
+    """
+    def __init__(self, message: str, status_code: Optional[int] = None, code: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+
+    @property
+    def is_throttle(self) -> bool:
+        """과부하 신호(HTTP 429/5xx 또는 과부하 결과 코드)인지 여부"""
+        if self.status_code is not None and (self.status_code == 429 or self.status_code >= 500):
+            return True
+        return self.code in THROTTLE_RESULT_CODES
+
+class BaseAssemblyAPI:
+    """
+    국회정보 Open API 클라이언트의 공통 기능을 모아놓은 기본 클래스
+
+    요청 파라미터 구성과 응답 정규화/파싱 로직을 담당하며,
+    실제 HTTP 통신은 동기(AssemblyAPI)/비동기(AsyncAssemblyAPI) 하위 클래스에서 구현합니다.
     """
-    def __init__(self):
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 api_key: Optional[str] = None,
+                 cache: Optional[ResponseCache] = response_cache,
+                 limiter: Optional[AdaptiveRateLimiter] = rate_limiter,
+                 breakers: Optional[CircuitBreakerRegistry] = circuit_breakers,
+                 coalescer: Optional[SingleFlight] = request_coalescer):
         """
-        AssemblyAPI 클래스 초기화
+        클라이언트 공통 초기화
         - API 기본 URL, 키 설정
-        - 제안자 API 실패 횟수 추적 변수 초기화
+        - 응답 캐시, 호출 속도 제한기, 엔드포인트별 서킷 브레이커, 동시 요청 병합기 설정
+
+        Args:
+            base_url: API 기본 URL (선택, 기본값: 설정값)
+            api_key: API 키 (선택, 기본값: 설정값)
+            cache: 응답 캐시 (선택, 기본값: 공용 캐시, None이면 캐시 사용 안 함)
+            limiter: 호출 속도 제한기 (선택, 기본값: 공용 제한기, None이면 제한 없음)
+            breakers: 엔드포인트별 서킷 브레이커 (선택, 기본값: 공용 브레이커, None이면 사용 안 함)
+            coalescer: 동시 요청 병합기 (선택, 기본값: 공용 병합기, None이면 병합 안 함)
         """
-        self.base_url = settings.ASSEMBLY_API_BASE_URL
-        self.api_key = settings.ASSEMBLY_API_KEY
-        # 제안자 정보 API 실패 횟수 추적
-        self.proposer_api_fail_count = 0
-        self.max_proposer_api_fails = 5  # 5번 이상 연속 실패하면 호출 중단
-        
-    def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict:
+        self.base_url = base_url or settings.ASSEMBLY_API_BASE_URL
+        self.api_key = api_key or settings.ASSEMBLY_API_KEY
+        self.cache = cache
+        self.limiter = limiter
+        self.breakers = breakers
+        self.coalescer = coalescer
+        # ASSEMBLY_API_RECORD_DIR이 설정되면 원본 응답을 fixture로 기록
+        self.recorder = fixture_recorder
+
+    def _get_timeout(self, endpoint: str) -> Tuple[float, float]:
         """
-        국회정보 API에 요청을 보내는 기본 메서드
-        
+        엔드포인트별 (연결, 읽기) 타임아웃 조회
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+
+        Returns:
+            Tuple[float, float]: (연결 타임아웃, 읽기 타임아웃) 초 단위
+        """
+        read_timeout = settings.ASSEMBLY_API_ENDPOINT_TIMEOUTS.get(endpoint, settings.ASSEMBLY_API_TIMEOUT)
+        return (settings.ASSEMBLY_API_CONNECT_TIMEOUT, read_timeout)
+
+    def _get_cached(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+        """
+        캐시된 응답 조회 (적중 시 네트워크 요청을 생략)
+
         Args:
             endpoint: API 엔드포인트 문자열
             params: API 요청 파라미터 딕셔너리
-            
+
         Returns:
-            API 응답 데이터 딕셔너리
-            
+            Optional[Dict]: 캐시된 응답 (없으면 None)
+        """
+        if self.cache is None:
+            return None
+        cached = self.cache.get(endpoint, params)
+        if cached is not None:
+            logger.debug(f"API 캐시 적중: {endpoint}, 파라미터: {params}")
+        return cached
+
+    def _store_cached(self, endpoint: str, params: Dict[str, Any], result: Dict) -> None:
+        """
+        정상 응답을 캐시에 저장
+
+        데이터 없음(INFO-200) 응답은 곧 데이터가 생길 수 있으므로 저장하지 않습니다.
+        (새 의안이 아직 없는 발의일 구간 등을 캐시하면 TTL 동안 새 데이터를 보지 못함)
+        """
+        if self.cache is None:
+            return
+        if not self._extract_rows(endpoint, result):
+            logger.debug(f"데이터 없는 응답은 캐시하지 않음: {endpoint}, 파라미터: {params}")
+            return
+        self.cache.set(endpoint, params, result)
+
+    def _before_call(self, endpoint: str) -> None:
+        """
+        네트워크 요청 전 엔드포인트 서킷 상태 확인
+
         Raises:
-            Exception: API 요청 또는 응답 파싱 중 발생한 오류
+            CircuitOpenError: 서킷이 열려 있어 호출을 건너뛰어야 하는 경우
+        """
+        if self.breakers is not None:
+            self.breakers.get(endpoint).before_call()
+
+    def _record_success(self, endpoint: str) -> None:
+        """정상 응답을 속도 제한기와 서킷 브레이커에 알림"""
+        if self.limiter is not None:
+            self.limiter.record_success()
+        if self.breakers is not None:
+            self.breakers.get(endpoint).record_success()
+
+    def _record_failure(self, endpoint: str, error: Exception) -> None:
+        """
+        실패 응답을 분류하여 속도 제한기와 서킷 브레이커에 알림
+
+        서버가 정상적으로 응답한 요청 오류(필수값 누락 등)는 장애로 보지 않습니다.
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            error: 요청 중 발생한 예외
+        """
+        if isinstance(error, AssemblyAPIError):
+            is_throttle = error.is_throttle
+            is_outage = error.is_throttle
+        else:
+            # 타임아웃/연결 오류도 서버 과부하 신호로 간주
+            is_throttle = isinstance(error, (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+                httpx.TimeoutException,
+                httpx.NetworkError
+            ))
+            # 그 밖의 네트워크/응답 파싱 오류는 장애로 간주
+            is_outage = True
+
+        if self.limiter is not None and is_throttle:
+            self.limiter.record_throttle()
+        if self.breakers is not None:
+            breaker = self.breakers.get(endpoint)
+            if is_outage:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def _prepare_request(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        요청 파라미터에 공통 값을 추가하고 요청 URL 생성
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리 (KEY, Type이 추가됨)
+
+        Returns:
+            str: 요청 URL
         """
         # API 키 추가
         params["KEY"] = self.api_key
         # 응답 형식 JSON으로 설정
         params["Type"] = "json"
-        
+
         # API URL 구성
         url = f"{self.base_url}/{endpoint}"
-        
+
         # 요청 전 로깅 (디버깅용)
         logger.info(f"API 요청: {url}, 파라미터: {params}")
-        
-        try:
-            # API 요청 보내기
-            response = requests.get(url, params=params, timeout=10)
-            
-            # 디버깅을 위한 응답 로깅
-            logger.info(f"API 응답 상태 코드: {response.status_code}")
-            
-            # HTTP 오류 확인
-            if response.status_code != 200:
-                logger.error(f"HTTP 오류: {response.status_code}, 응답: {response.text}")
-                raise Exception(f"API 요청 실패: {response.status_code}, {response.text}")
-            
-            # JSON 응답 파싱
-            result = response.json()
-            
-            # 응답 코드 확인
-            if "RESULT" in result and result["RESULT"]["CODE"] != "INFO-000":
-                error_code = result["RESULT"]["CODE"]
-                error_msg = result["RESULT"]["MESSAGE"]
-                
-                # 데이터 없음 코드는 오류로 처리하지 않고 빈 결과로 처리
-                if error_code == "INFO-200" and "해당하는 데이터가 없습니다" in error_msg:
-                    logger.info(f"API 응답: {error_code}, {error_msg} - 데이터 없음으로 처리")
-                    # 데이터가 없는 경우 빈 결과 구조 반환
-                    if endpoint == "ALLBILL":
-                        return {"ALLBILL": {"row": []}}
-                    elif endpoint == "BILLINFOPPSR":
-                        return {endpoint: {"row": []}}
-                    else:
-                        return {endpoint: [{"header": {}}, {"row": []}]}
+        return url
+
+    def _check_result(self, endpoint: str, result: Dict) -> Dict:
+        """
+        API 응답 코드를 확인하고 응답을 정규화
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            result: 파싱된 API 응답 딕셔너리
+
+        Returns:
+            Dict: 정상 응답 또는 데이터 없음을 나타내는 빈 결과 구조
+
+        Raises:
+            Exception: 데이터 없음 이외의 오류 코드를 받은 경우
+        """
+        # 응답 코드 확인
+        if "RESULT" in result and result["RESULT"]["CODE"] != "INFO-000":
+            error_code = result["RESULT"]["CODE"]
+            error_msg = result["RESULT"]["MESSAGE"]
+
+            # 데이터 없음 코드는 오류로 처리하지 않고 빈 결과로 처리
+            if error_code == "INFO-200" and "해당하는 데이터가 없습니다" in error_msg:
+                logger.info(f"API 응답: {error_code}, {error_msg} - 데이터 없음으로 처리")
+                # 데이터가 없는 경우 빈 결과 구조 반환
+                if endpoint == "ALLBILL":
+                    return {"ALLBILL": {"row": []}}
+                elif endpoint == "BILLINFOPPSR":
+                    return {endpoint: {"row": []}}
                 else:
-                    # 기타 오류는 로깅하고 예외 발생
-                    logger.error(f"API 오류 응답: {error_code}, {error_msg}")
-                    raise Exception(f"API 오류: {error_code}, {error_msg}")
-                    
-            return result
-            
-        except requests.exceptions.RequestException as e:
-            # 요청 관련 오류
-            logger.error(f"API 요청 중 오류: {str(e)}")
-            raise Exception(f"API 요청 오류: {str(e)}")
-            
-        except ValueError as e:
-            # JSON 파싱 오류
-            logger.error(f"API 응답 JSON 파싱 오류: {str(e)}")
-            raise Exception(f"API 응답 파싱 오류: {str(e)}")
-            
-        except Exception as e:
-            # 기타 오류
-            logger.error(f"API 요청 중 예상치 못한 오류: {str(e)}")
-            raise
-    
-    def get_members(self, 
-                assembly_term: int = 22,  # 22대 국회 기본값
-                name: Optional[str] = None,
-                party: Optional[str] = None) -> List[Dict]:
+                    return {endpoint: [{"header": {}}, {"row": []}]}
+            else:
+                # 기타 오류는 로깅하고 예외 발생
+                logger.error(f"API 오류 응답: {error_code}, {error_msg}")
+                raise AssemblyAPIError(f"API 오류: {error_code}, {error_msg}", code=error_code)
+
+        return result
+
+    def _extract_rows(self, endpoint: str, response_data: Dict) -> Optional[List[Dict]]:
         """
-        국회의원 인적사항 조회
-        
+        응답에서 row 목록 추출
+
+        Open API는 엔드포인트에 따라 [{"head": ...}, {"row": [...]}] 형태나
+        {"row": [...]} 형태로 응답하므로 두 형태를 모두 처리합니다.
+
         Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            name: 이름 검색어 (선택)
-            party: 정당 검색어 (선택)
-            
+            endpoint: API 엔드포인트 문자열
+            response_data: API 응답 딕셔너리
+
         Returns:
-            국회의원 정보 목록
+            Optional[List[Dict]]: row 목록 (응답 구조를 알 수 없으면 None)
         """
-        endpoint = "nwvrqwxyaytdsfvhu"  # 국회의원 인적사항 API 엔드포인트
-        
+        body = response_data.get(endpoint) if isinstance(response_data, dict) else None
+        if isinstance(body, dict):
+            return body.get("row")
+        if isinstance(body, list):
+            for item in body:
+                if isinstance(item, dict) and "row" in item:
+                    return item["row"]
+        return None
+
+    def _extract_total_count(self, endpoint: str, response_data: Dict) -> Optional[int]:
+        """
+        응답 헤더에서 전체 결과 수(list_total_count) 추출
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            response_data: API 응답 딕셔너리
+
+        Returns:
+            Optional[int]: 전체 결과 수 (헤더가 없으면 None)
+        """
+        body = response_data.get(endpoint) if isinstance(response_data, dict) else None
+        heads = []
+        if isinstance(body, dict):
+            heads = body.get("head", [])
+        elif isinstance(body, list):
+            for item in body:
+                if isinstance(item, dict) and "head" in item:
+                    heads = item["head"]
+                    break
+        for head in heads:
+            if isinstance(head, dict) and "list_total_count" in head:
+                try:
+                    return int(head["list_total_count"])
+                except (TypeError, ValueError):
+                    return None
+        return None
+
+    def _page_params(self, params: Dict[str, Any], page_index: int, page_size: int) -> Dict[str, Any]:
+        """페이지 위치/크기를 설정한 요청 파라미터 복사본 생성"""
+        page_params = dict(params)
+        page_params["pIndex"] = page_index
+        page_params["pSize"] = page_size
+        return page_params
+
+    def _resolve_page_size(self, params: Dict[str, Any], page_size: Optional[int]) -> int:
+        """요청할 페이지 크기 결정 (API 최대 허용치로 제한)"""
+        size = page_size or params.get("pSize") or settings.ASSEMBLY_API_MAX_PAGE_SIZE
+        return max(1, min(int(size), settings.ASSEMBLY_API_MAX_PAGE_SIZE))
+
+    def _has_next_page(self, row_count: int, page_index: int, page_size: int,
+                       total_count: Optional[int]) -> bool:
+        """다음 페이지를 요청해야 하는지 판단"""
+        if not row_count:
+            return False
+        if total_count is not None:
+            return page_index * page_size < total_count
+        # 헤더에 전체 건수가 없으면 페이지가 가득 찼는지로 판단
+        return row_count >= page_size
+
+    def _use_stream(self, stream: Optional[bool]) -> bool:
+        """스트리밍 파싱 사용 여부 결정 (지정하지 않으면 설정값)"""
+        return settings.ASSEMBLY_API_STREAM_ROWS if stream is None else stream
+
+    def _check_stream_event(self, endpoint: str, kind: str, value: Any) -> Optional[int]:
+        """
+        스트리밍 응답의 헤더/결과 코드 이벤트 확인
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            kind: 이벤트 종류 (RESULT, head 등)
+            value: 이벤트 값
+
+        Returns:
+            Optional[int]: 전체 결과 수 (데이터 없음 응답이면 0, 알 수 없으면 None)
+
+        Raises:
+            AssemblyAPIError: 데이터 없음 이외의 오류 코드를 받은 경우
+        """
+        if kind == "RESULT":
+            self._check_result(endpoint, {"RESULT": value})
+            return 0
+        if kind == "head":
+            return self._extract_total_count(endpoint, {endpoint: [{"head": value}]})
+        return None
+
+    def _log_member_fields(self, members_data: List[Dict]) -> None:
+        """디버깅: 첫 번째 의원 데이터 필드 확인"""
+        if len(members_data) > 0:
+            first_member = members_data[0]
+            logger.info(f"첫 번째 의원 데이터 필드: {list(first_member.keys())}")
+            logger.info(f"첫 번째 의원 생년월일 관련 필드:")
+            for key in first_member.keys():
+                if "DATE" in key or "BTH" in key or "birth" in key.lower():
+                    logger.info(f"  {key}: {first_member[key]}")
+
+    # ------------------------------------------------------------------
+    # 요청 파라미터 구성
+    # ------------------------------------------------------------------
+
+    def _members_params(self, assembly_term: int, name: Optional[str], party: Optional[str]) -> Dict[str, Any]:
+        """국회의원 인적사항 조회 파라미터 구성"""
         params = {
             "ASSEMBLY": assembly_term,  # 대수
             "pIndex": 1,               # 페이지 번호
             "pSize": 300               # 한 페이지 결과 수 (최대값으로 설정)
         }
-        
+
         # 필터링 옵션 추가
         if name:
             params["HG_NM"] = name     # 이름으로 검색
         if party:
             params["POLY_NM"] = party  # 정당으로 검색
-            
-        try:
-            response_data = self._make_request(endpoint, params)
-            
-            # API 응답에서 국회의원 목록 추출
-            try:
-                # 응답 구조 확인
-                if endpoint in response_data and len(response_data[endpoint]) > 1:
-                    members_data = response_data[endpoint][1]["row"]
-                    
-                    # 디버깅: 첫 번째 의원 데이터 필드 확인
-                    if len(members_data) > 0:
-                        first_member = members_data[0]
-                        logger.info(f"첫 번째 의원 데이터 필드: {list(first_member.keys())}")
-                        logger.info(f"첫 번째 의원 생년월일 관련 필드:")
-                        for key in first_member.keys():
-                            if "DATE" in key or "BTH" in key or "birth" in key.lower():
-                                logger.info(f"  {key}: {first_member[key]}")
-                    
-                    return members_data
-                else:
-                    # 응답 구조가 다른 경우 전체 응답 로깅
-                    logger.error(f"API 응답 구조 예상과 다름: {response_data}")
-                    return []
-            except (KeyError, IndexError) as e:
-                logger.error(f"API 응답 파싱 오류: {e}, 응답: {response_data}")
-                return []
-        except Exception as e:
-            logger.error(f"국회의원 정보 조회 중 오류: {str(e)}")
-            return []
+        return params
 
-    def get_bills(self, 
-             assembly_term: int = 22,
-             bill_name: Optional[str] = None,
-             proposer: Optional[str] = None,
-             committee: Optional[str] = None,
-             start_date: Optional[str] = None,
-             end_date: Optional[str] = None,
-             bill_id: Optional[str] = None,
-             bill_no: Optional[str] = None,
-             page_index: int = 1,
-             page_size: int = 20) -> List[Dict]:
-        """
-        국회 의안정보 조회
-        
-        Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            bill_name: 의안명 검색어 (선택)
-            proposer: 제안자명 검색어 (선택)
-            committee: 소관위원회명 검색어 (선택)
-            start_date: 제안일 시작일 (선택, 형식: YYYYMMDD)
-            end_date: 제안일 종료일 (선택, 형식: YYYYMMDD)
-            bill_id: 의안ID (선택)
-            bill_no: 의안번호 (선택)
-            page_index: 페이지 위치 (기본값: 1)
-            page_size: 페이지 당 결과 수 (기본값: 20)
-            
-        Returns:
-            의안 정보 목록
-        """
-        # 의안정보 조회 API 엔드포인트
-        endpoint = "ALLBILL"  # 의안정보 통합 API 엔드포인트
-        
+    def _bills_params(self,
+                      assembly_term: int,
+                      bill_name: Optional[str],
+                      proposer: Optional[str],
+                      committee: Optional[str],
+                      start_date: Optional[str],
+                      end_date: Optional[str],
+                      bill_id: Optional[str],
+                      bill_no: Optional[str],
+                      page_index: int,
+                      page_size: int) -> Dict[str, Any]:
+        """의안정보 통합 조회 파라미터 구성"""
         # 파라미터 초기화
         params = {
             "pIndex": page_index,       # 페이지 위치 (필수)
             "pSize": page_size          # 페이지 당 요청 숫자 (필수)
         }
-        
+
         # 제안자 처리
         if proposer:
-            params["PPSR_NM"] = proposer  # 제안자명 
+            params["PPSR_NM"] = proposer  # 제안자명
 
         # 검색 조건 적용
         if bill_name:
@@ -210,10 +391,10 @@ class AssemblyAPI:
             # 의안번호 없이 검색하려면 다른 조건 필요
             # 모든 의안을 불러오고 싶은 경우 특정 기간 지정
             if not start_date:
-                # 기본 기간 설정 (예: 22대 국회 개원일부터 현재까지)
-                start_date = "20240530"  # 22대 국회 개원일
+                # 기본 기간 설정 (해당 대수 국회 개원일부터 현재까지)
+                start_date = settings.term_start_date(assembly_term)
             params["AGE"] = assembly_term  # 국회대수 추가
-        
+
         # 나머지 선택적 파라미터 추가
         if bill_id:
             params["BILL_ID"] = bill_id    # 의안ID(선택)
@@ -223,314 +404,207 @@ class AssemblyAPI:
             params["PROPOSE_TO"] = end_date     # 제안일(종료)
         if committee:
             params["COMMITTEE"] = committee     # 소관위원회명(선택)
-            
-        try:
-            response_data = self._make_request(endpoint, params)
-            
-            # API 응답에서 의안 목록 추출
-            try:
-                # 로그로 응답 구조 확인 (디버깅용)
-                logger.info(f"API 응답 구조: {response_data.keys()}")
-                
-                # 응답 구조 확인하고 적절하게 처리
-                if "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], dict) and "row" in response_data["ALLBILL"]:
-                    bills_data = response_data["ALLBILL"]["row"]
-                    return bills_data
-                elif "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], list) and len(response_data["ALLBILL"]) > 0:
-                    # 리스트 형태로 반환된 경우 (인덱스 접근 방식 수정)
-                    for item in response_data["ALLBILL"]:
-                        if isinstance(item, dict) and "row" in item:
-                            return item["row"]
-                    
-                    logger.error(f"응답에서 'row' 키를 찾을 수 없음: {response_data}")
-                    return []
-                else:
-                    # "해당하는 데이터가 없습니다." 메시지 처리
-                    if "RESULT" in response_data and response_data["RESULT"]["CODE"] == "INFO-200":
-                        logger.info(f"발의안 검색 결과 없음: {params}")
-                        return []
-                        
-                    logger.error(f"API 응답 구조 예상과 다름: {response_data}")
-                    return []
-            except (KeyError, IndexError, TypeError) as e:
-                logger.error(f"API 응답 파싱 오류: {e}, 응답: {response_data}")
-                return []
-        except Exception as e:
-            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
-            return []
+        return params
 
-    def get_bill_detail(self, bill_id: str = None, bill_no: str = None) -> Dict:
-        """
-        의안 상세정보 조회
-        
-        Args:
-            bill_id: 의안ID (선택)
-            bill_no: 의안번호 (선택)
-            
-        Returns:
-            의안 상세 정보 딕셔너리
-            
-        Note:
-            bill_id 또는 bill_no 중 하나는 반드시 제공해야 함
-        """
-        # 동일한 엔드포인트 사용
-        endpoint = "ALLBILL"
-        
-        # BILL_NO(의안번호)나 BILL_ID(의안ID) 중 하나는 필수
-        if not bill_no and not bill_id:
-            logger.error("의안번호(BILL_NO)나 의안ID(BILL_ID)가 필요합니다.")
-            return {}
-        
+    def _bill_detail_params(self, bill_id: Optional[str], bill_no: Optional[str]) -> Dict[str, Any]:
+        """의안 상세정보 조회 파라미터 구성"""
         params = {
             "pIndex": 1,    # 페이지 위치 (필수)
             "pSize": 1      # 페이지 당 요청 숫자 (필수)
         }
-        
+
         # 의안번호 또는 의안ID 중 하나를 사용
         if bill_no:
             params["BILL_NO"] = bill_no
         if bill_id:
             params["BILL_ID"] = bill_id
-        
-        try:
-            response_data = self._make_request(endpoint, params)
-            
-            # API 응답에서 의안 상세정보 추출
-            try:
-                # 응답 구조 확인하고 적절하게 처리
-                if "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], dict) and "row" in response_data["ALLBILL"]:
-                    bills_data = response_data["ALLBILL"]["row"]
-                    # 첫 번째 결과만 반환 (상세정보이므로 단일 항목이어야 함)
-                    return bills_data[0] if bills_data else {}
-                elif "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], list) and len(response_data["ALLBILL"]) > 0:
-                    # 리스트 형태로 반환된 경우 (인덱스 접근 방식 수정)
-                    for item in response_data["ALLBILL"]:
-                        if isinstance(item, dict) and "row" in item:
-                            return item["row"][0] if item["row"] else {}
-                    
-                    logger.error(f"응답에서 'row' 키를 찾을 수 없음: {response_data}")
-                    return {}
-                else:
-                    logger.error(f"API 응답 구조 예상과 다름: {response_data}")
-                    return {}
-            except (KeyError, IndexError, TypeError) as e:
-                logger.error(f"API 응답 파싱 오류: {e}, 응답: {response_data}")
-                return {}
-        except Exception as e:
-            logger.error(f"의안 상세정보 조회 중 오류: {str(e)}")
-            return {}
+        return params
 
-    def get_bill_vote_results(self, 
-                             assembly_term: int = 22,
-                             bill_id: Optional[str] = None) -> List[Dict]:
-        """
-        의안별 표결 현황 조회
-        
-        Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            bill_id: 의안ID (선택)
-            
-        Returns:
-            의안 표결 현황 목록
-        """
-        endpoint = "nzmimeepazyrjsxdq"  # 의안별 표결현황 API 엔드포인트
-        
+    def _bill_vote_results_params(self, assembly_term: int, bill_id: Optional[str]) -> Dict[str, Any]:
+        """의안별 표결 현황 조회 파라미터 구성"""
         params = {
             "ASSEMBLY": assembly_term,  # 대수
             "pIndex": 1,                # 페이지 번호
             "pSize": 100                # 한 페이지 결과 수
         }
-        
+
         # 특정 의안 번호가 제공된 경우 추가
         if bill_id:
             params["BILL_ID"] = bill_id
-            
-        response_data = self._make_request(endpoint, params)
-        
-        # API 응답에서 표결 현황 추출
-        try:
-            vote_results = response_data[endpoint][1]["row"]
-            return vote_results
-        except (KeyError, IndexError) as e:
-            logger.error(f"API 응답 파싱 오류: {e}")
-            return []
-    
-    def get_member_vote_results(self, 
-                               assembly_term: int = 22,
-                               member_name: Optional[str] = None,
-                               bill_id: Optional[str] = None) -> List[Dict]:
-        """
-        국회의원 표결정보 조회
-        
-        Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            member_name: 의원명 (선택)
-            bill_id: 의안ID (선택)
-            
-        Returns:
-            국회의원 표결정보 목록
-        """
-        endpoint = "nzmimeepazxkubdpq"  # 국회의원 본회의 표결정보 API 엔드포인트
-        
+        return params
+
+    def _member_vote_results_params(self,
+                                    assembly_term: int,
+                                    member_name: Optional[str],
+                                    bill_id: Optional[str]) -> Dict[str, Any]:
+        """국회의원 표결정보 조회 파라미터 구성"""
         params = {
             "ASSEMBLY": assembly_term,  # 대수
             "pIndex": 1,                # 페이지 번호
             "pSize": 100                # 한 페이지 결과 수
         }
-        
+
         # 필터링 옵션 추가
         if member_name:
             params["HG_NM"] = member_name  # 이름으로 검색
         if bill_id:
             params["BILL_ID"] = bill_id    # 의안 번호로 검색
-            
-        response_data = self._make_request(endpoint, params)
-        
-        # API 응답에서 표결정보 추출
-        try:
-            vote_data = response_data[endpoint][1]["row"]
-            return vote_data
-        except (KeyError, IndexError) as e:
-            logger.error(f"API 응답 파싱 오류: {e}")
-            return []
-    
-    def get_committee_info(self, 
-                          assembly_term: int = 22,
-                          committee_name: Optional[str] = None) -> List[Dict]:
-        """
-        위원회 현황 정보 조회
-        
-        Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            committee_name: 위원회명 (선택)
-            
-        Returns:
-            위원회 정보 목록
-        """
-        endpoint = "nzmimeepazxkubdpc"  # 위원회 현황 정보 API 엔드포인트
-        
+        return params
+
+    def _committee_info_params(self, assembly_term: int, committee_name: Optional[str]) -> Dict[str, Any]:
+        """위원회 현황 정보 조회 파라미터 구성"""
         params = {
             "ASSEMBLY": assembly_term,  # 대수
             "pIndex": 1,                # 페이지 번호
             "pSize": 50                 # 한 페이지 결과 수
         }
-        
+
         # 특정 위원회 이름이 제공된 경우 추가
         if committee_name:
             params["CURR_COMMITTEE"] = committee_name
-            
-        response_data = self._make_request(endpoint, params)
-        
-        # API 응답에서 위원회 정보 추출
-        try:
-            committee_data = response_data[endpoint][1]["row"]
-            return committee_data
-        except (KeyError, IndexError) as e:
-            logger.error(f"API 응답 파싱 오류: {e}")
-            return []
-    
-    def get_speech_records(self, 
-                      assembly_term: int = 22,
-                      member_name: Optional[str] = None,
-                      start_date: Optional[str] = None,
-                      end_date: Optional[str] = None) -> List[Dict]:
-        """
-        국회의원 영상회의록(발언영상) 조회
-        
-        Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            member_name: 의원명 (선택)
-            start_date: 회의일자 시작일 (선택, 형식: YYYYMMDD)
-            end_date: 회의일자 종료일 (선택, 형식: YYYYMMDD)
-            
-        Returns:
-            발언영상 정보 목록
-        """
-        # API 엔드포인트
-        endpoint = "npeslxqbanwkimebr"  # 국회의원 영상회의록 API 엔드포인트
-        
+        return params
+
+    def _speech_records_params(self,
+                               assembly_term: int,
+                               member_name: Optional[str],
+                               start_date: Optional[str],
+                               end_date: Optional[str]) -> Dict[str, Any]:
+        """국회의원 영상회의록 조회 파라미터 구성"""
         # 날짜 기본값 설정 (없을 경우)
         if not start_date:
             start_date = "20240101"  # 2024년 1월 1일부터
         if not end_date:
             today = datetime.now().strftime("%Y%m%d")
             end_date = today  # 오늘까지
-        
+
         params = {
             "CT1": str(assembly_term),  # 대수 (필수)
             "TAKING_DATE": start_date,  # 회의일자 (필수)
             "pIndex": 1,                # 페이지 번호
             "pSize": 100                # 한 페이지 결과 수
         }
-        
+
         # 특정 의원 이름이 제공된 경우 추가
         if member_name:
             params["ESSENTIAL_PERSON"] = member_name  # 발언자
-                
+        return params
+
+    def _bill_ids_by_age_params(self, assembly_term: int, page_index: int, page_size: int) -> Dict[str, Any]:
+        """대수별 의안 목록 조회 파라미터 구성"""
+        return {
+            "AGE": str(assembly_term),  # 대수 (필수)
+            "pIndex": page_index,       # 페이지 위치
+            "pSize": page_size          # 페이지 당 요청 숫자
+        }
+
+    def _bill_proposers_params(self, bill_id: str) -> Dict[str, Any]:
+        """의안 제안자정보 조회 파라미터 구성"""
+        return {
+            "BILL_ID": bill_id,  # 의안ID (필수)
+            "pIndex": 1,
+            "pSize": 100
+        }
+
+    # ------------------------------------------------------------------
+    # 응답 파싱
+    # ------------------------------------------------------------------
+
+    def _parse_bills(self, response_data: Dict, params: Dict[str, Any]) -> List[Dict]:
+        """의안정보 통합 응답에서 의안 목록 추출"""
         try:
-            response_data = self._make_request(endpoint, params)
-            
-            # API 응답에서 발언영상 정보 추출
-            try:
-                # API 응답 구조 확인
-                if endpoint in response_data and len(response_data[endpoint]) > 1:
-                    speech_data = response_data[endpoint][1]["row"]
-                    return speech_data
-                else:
-                    logger.warning(f"API 응답에서 발언 데이터를 찾을 수 없음: {response_data}")
+            # 로그로 응답 구조 확인 (디버깅용)
+            logger.info(f"API 응답 구조: {response_data.keys()}")
+
+            # 응답 구조 확인하고 적절하게 처리
+            if "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], dict) and "row" in response_data["ALLBILL"]:
+                bills_data = response_data["ALLBILL"]["row"]
+                return bills_data
+            elif "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], list) and len(response_data["ALLBILL"]) > 0:
+                # 리스트 형태로 반환된 경우 (인덱스 접근 방식 수정)
+                for item in response_data["ALLBILL"]:
+                    if isinstance(item, dict) and "row" in item:
+                        return item["row"]
+
+                logger.error(f"응답에서 'row' 키를 찾을 수 없음: {response_data}")
+                return []
+            else:
+                # "해당하는 데이터가 없습니다." 메시지 처리
+                if "RESULT" in response_data and response_data["RESULT"]["CODE"] == "INFO-200":
+                    logger.info(f"발의안 검색 결과 없음: {params}")
                     return []
-            except (KeyError, IndexError) as e:
-                logger.error(f"API 응답 파싱 오류: {e}")
+
+                logger.error(f"API 응답 구조 예상과 다름: {response_data}")
                 return []
-        except Exception as e:
-            logger.error(f"발언 정보 조회 중 오류: {str(e)}")
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"API 응답 파싱 오류: {e}, 응답: {response_data}")
             return []
 
-    def get_bill_ids_by_age(self, assembly_term: int = 22, page_index: int = 1, page_size: int = 100) -> List[Dict]:
+    def _ensure_bill_detail_rows(self, endpoint: str, response_data: Dict) -> None:
         """
-        특정 대수의 의안 전체 정보 조회
-        
-        Args:
-            assembly_term: 국회 대수 (기본값: 22)
-            page_index: 페이지 위치 (기본값: 1)
-            page_size: 페이지 당 결과 수 (기본값: 100)
-            
-        Returns:
-            의안 정보 목록
+        의안 상세정보 응답에 row 목록이 있는지 확인
+
+        Raises:
+            AssemblyAPIError: 응답 구조를 알 수 없는 경우 (빈 결과와 구분하기 위해)
         """
-        endpoint = "ncocpgfiaoituanbr"  # 의안별 표결현황 API 엔드포인트
-        
-        params = {
-            "AGE": str(assembly_term),  # 대수 (필수)
-            "pIndex": page_index,       # 페이지 위치
-            "pSize": page_size          # 페이지 당 요청 숫자
-        }
-        
+        if self._extract_rows(endpoint, response_data) is None:
+            raise AssemblyAPIError(f"의안 상세정보 응답 구조 예상과 다름: {response_data}")
+
+    def _parse_bill_detail(self, response_data: Dict) -> Dict:
+        """의안정보 통합 응답에서 단일 의안 상세정보 추출"""
         try:
-            response_data = self._make_request(endpoint, params)
-            
-            # API 응답에서 의안 정보 추출
+            # 응답 구조 확인하고 적절하게 처리
+            if "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], dict) and "row" in response_data["ALLBILL"]:
+                bills_data = response_data["ALLBILL"]["row"]
+                # 첫 번째 결과만 반환 (상세정보이므로 단일 항목이어야 함)
+                return bills_data[0] if bills_data else {}
+            elif "ALLBILL" in response_data and isinstance(response_data["ALLBILL"], list) and len(response_data["ALLBILL"]) > 0:
+                # 리스트 형태로 반환된 경우 (인덱스 접근 방식 수정)
+                for item in response_data["ALLBILL"]:
+                    if isinstance(item, dict) and "row" in item:
+                        return item["row"][0] if item["row"] else {}
+
+                logger.error(f"응답에서 'row' 키를 찾을 수 없음: {response_data}")
+                return {}
+            else:
+                logger.error(f"API 응답 구조 예상과 다름: {response_data}")
+                return {}
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"API 응답 파싱 오류: {e}, 응답: {response_data}")
+            return {}
+
+    def _parse_speech_records(self, endpoint: str, response_data: Dict) -> List[Dict]:
+        """영상회의록 응답에서 발언 목록 추출"""
+        try:
+            # API 응답 구조 확인
             if endpoint in response_data and len(response_data[endpoint]) > 1:
-                bills_data = response_data[endpoint][1]["row"]
-                logger.info(f"의안별 표결현황 API에서 {len(bills_data)}개 의안 정보 가져옴")
-                return bills_data
+                speech_data = response_data[endpoint][1]["row"]
+                return speech_data
             else:
-                logger.warning(f"API 응답에서 의안 데이터를 찾을 수 없음")
+                logger.warning(f"API 응답에서 발언 데이터를 찾을 수 없음: {response_data}")
                 return []
-        except Exception as e:
-            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+        except (KeyError, IndexError) as e:
+            logger.error(f"API 응답 파싱 오류: {e}")
             return []
 
-    def get_bill_proposers(self, bill_id: str, bill_data: Dict = None) -> Dict:
+    def _parse_bill_ids_by_age(self, endpoint: str, response_data: Dict) -> List[Dict]:
+        """대수별 의안 목록 응답에서 의안 목록 추출"""
+        if endpoint in response_data and len(response_data[endpoint]) > 1:
+            bills_data = response_data[endpoint][1]["row"]
+            logger.info(f"의안별 표결현황 API에서 {len(bills_data)}개 의안 정보 가져옴")
+            return bills_data
+        else:
+            logger.warning(f"API 응답에서 의안 데이터를 찾을 수 없음")
+            return []
+
+    def _proposers_from_bill_data(self, bill_data: Optional[Dict]) -> Dict:
         """
-        의안 제안자 정보 조회 - 실패 시 기본 정보 활용
-        
+        의안 기본 정보에서 제안자 정보 추출 (제안자 API 호출 전 기본값)
+
         Args:
-            bill_id: 의안ID
             bill_data: 의안 기본 정보 (선택)
-            
+
         Returns:
-            의안 제안자 정보 딕셔너리 (대표발의자, 공동발의자 등)
+            Dict: 제안자 정보 딕셔너리 (대표발의자, 공동발의자 등)
         """
         # 기본 반환값 설정
         result = {
@@ -538,7 +612,7 @@ class AssemblyAPI:
             "proposer_info": None,  # 제안자 정보 (예: "홍길동의원 등 10인") 필드 추가
             "co_proposers": []
         }
-        
+
         # 의안 기본 정보에서 제안자 추출 시도
         if bill_data:
             # 가능한 제안자 정보 필드들을 검사
@@ -546,7 +620,7 @@ class AssemblyAPI:
                 if field in bill_data and bill_data[field]:
                     result["proposer_info"] = bill_data[field]
                     break
-            
+
             # 의안명에서 발의자 추출 시도 (예: "xxx법률안(홍길동의원 대표발의)")
             bill_name = bill_data.get("BILL_NAME", "")
             if "의원 대표발의" in bill_name:
@@ -558,7 +632,7 @@ class AssemblyAPI:
                         result["rep_proposer"] = rep_proposer
                 except:
                     pass
-            
+
             # 위원회 발의 또는 정부 제출 여부 확인
             if "위원장" in bill_name or "위원회" in bill_name:
                 try:
@@ -571,57 +645,1134 @@ class AssemblyAPI:
             elif "정부" in bill_name:
                 result["rep_proposer"] = "정부"
                 result["is_government"] = True
-        
-        # 연속 실패 횟수가 임계값을 초과하면 API 호출 건너뛰기
-        if self.proposer_api_fail_count >= self.max_proposer_api_fails:
-            logger.debug(f"제안자 정보 API 연속 {self.proposer_api_fail_count}회 실패로 호출 건너뜀: {bill_id}")
+        return result
+
+    def _apply_proposers_response(self, result: Dict, endpoint: str, response_data: Dict, bill_id: str) -> None:
+        """
+        제안자정보 API 응답을 제안자 정보 딕셔너리에 반영
+
+        Args:
+            result: 갱신할 제안자 정보 딕셔너리
+            endpoint: API 엔드포인트 문자열
+            response_data: 제안자정보 API 응답
+            bill_id: 의안ID (로깅용)
+        """
+        # API 응답에서 의안 제안자 정보 추출
+        proposers_data = self._extract_rows(endpoint, response_data)
+        if proposers_data is not None:
+            # 대표발의자와 공동발의자 구분
+            rep_proposer = None
+            co_proposers = []
+
+            for proposer in proposers_data:
+                if proposer.get("REP_DIV") == "대표발의":
+                    rep_proposer = proposer.get("PPSR_NM", "")
+                else:
+                    co_proposers.append(proposer.get("PPSR_NM", ""))
+
+            # 결과가 있는 경우에만 업데이트
+            if rep_proposer:
+                result["rep_proposer"] = rep_proposer
+            if co_proposers:
+                result["co_proposers"] = co_proposers
+        else:
+            logger.info(f"제안자 정보 API 데이터 없음: {bill_id}")
+
+    def _log_proposers_failure(self, bill_id: str, error: Exception) -> None:
+        """제안자정보 API 호출 실패 로깅 (서킷이 열려 건너뛴 경우는 디버그 로그)"""
+        if isinstance(error, CircuitOpenError):
+            logger.debug(f"제안자 정보 API 호출 건너뜀: {bill_id}, {str(error)}")
+        else:
+            logger.info(f"제안자 정보 API 호출 실패: {bill_id}, {str(error)}")
+
+class AssemblyAPI(BaseAssemblyAPI):
+    """
+    국회정보 Open API와 통신하여 데이터를 가져오는 클래스
+    """
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 api_key: Optional[str] = None,
+                 cache: Optional[ResponseCache] = response_cache,
+                 limiter: Optional[AdaptiveRateLimiter] = rate_limiter,
+                 breakers: Optional[CircuitBreakerRegistry] = circuit_breakers,
+                 coalescer: Optional[SingleFlight] = request_coalescer):
+        """
+        AssemblyAPI 클래스 초기화
+        - API 기본 URL, 키, 응답 캐시, 호출 속도 제한기, 서킷 브레이커 설정
+        - keep-alive 커넥션 풀을 사용하는 HTTP 세션 생성
+
+        Args:
+            base_url: API 기본 URL (선택, 기본값: 설정값)
+            api_key: API 키 (선택, 기본값: 설정값)
+            cache: 응답 캐시 (선택, 기본값: 공용 캐시, None이면 캐시 사용 안 함)
+            limiter: 호출 속도 제한기 (선택, 기본값: 공용 제한기, None이면 제한 없음)
+            breakers: 엔드포인트별 서킷 브레이커 (선택, 기본값: 공용 브레이커, None이면 사용 안 함)
+            coalescer: 동시 요청 병합기 (선택, 기본값: 공용 병합기, None이면 병합 안 함)
+        """
+        super().__init__(base_url=base_url, api_key=api_key, cache=cache, limiter=limiter,
+                         breakers=breakers, coalescer=coalescer)
+        # 연결을 재사용하는 HTTP 세션 (요청마다 TCP/TLS 연결을 새로 맺지 않음)
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        커넥션 풀이 설정된 HTTP 세션 생성
+
+        Returns:
+            requests.Session: keep-alive 연결을 재사용하는 세션
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.ASSEMBLY_API_POOL_CONNECTIONS,
+            pool_maxsize=settings.ASSEMBLY_API_POOL_MAXSIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def close(self):
+        """HTTP 세션과 풀에 남아 있는 연결 정리"""
+        self.session.close()
+
+    def _make_request(self, endpoint: str, params: Dict[str, Any], use_cache: bool = True) -> Dict:
+        """
+        국회정보 API에 요청을 보내는 기본 메서드
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+            use_cache: 캐시된 응답을 사용할지 여부 (False면 항상 새로 요청하고 받은 응답으로 캐시를 갱신,
+                       동기화처럼 최신 데이터가 필요한 경로에서 사용)
+
+        Returns:
+            API 응답 데이터 딕셔너리
+
+        Raises:
+            Exception: API 요청 또는 응답 파싱 중 발생한 오류
+        """
+        # 캐시에 있으면 네트워크 요청 없이 반환
+        if use_cache:
+            cached = self._get_cached(endpoint, params)
+            if cached is not None:
+                return cached
+
+        # 같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 함께 사용
+        if self.coalescer is not None:
+            return self.coalescer.do(
+                make_request_key(endpoint, params),
+                lambda: self._fetch(endpoint, params)
+            )
+        return self._fetch(endpoint, params)
+
+    def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict:
+        """
+        실제 HTTP 요청을 보내고 응답을 확인하여 캐시에 저장
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+
+        Returns:
+            API 응답 데이터 딕셔너리
+        """
+        url = self._prepare_request(endpoint, params)
+
+        # 서킷이 열려 있으면 타임아웃을 기다리지 않고 즉시 실패
+        self._before_call(endpoint)
+
+        # 허용 속도를 넘지 않도록 대기
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+        try:
+            # API 요청 보내기
+            response = self.session.get(url, params=params, timeout=self._get_timeout(endpoint))
+
+            # 디버깅을 위한 응답 로깅
+            logger.info(f"API 응답 상태 코드: {response.status_code}")
+
+            # HTTP 오류 확인
+            if response.status_code != 200:
+                logger.error(f"HTTP 오류: {response.status_code}, 응답: {response.text}")
+                raise AssemblyAPIError(
+                    f"API 요청 실패: {response.status_code}, {response.text}",
+                    status_code=response.status_code
+                )
+
+            # JSON 응답 파싱 (기록 모드면 원본 응답 저장) 후 응답 코드 확인
+            raw_result = response.json()
+            if self.recorder is not None:
+                self.recorder.save(endpoint, params, raw_result)
+            result = self._check_result(endpoint, raw_result)
+            self._record_success(endpoint)
+            self._store_cached(endpoint, params, result)
             return result
-        
-        # API에서 제안자 정보 조회 시도
+
+        except requests.exceptions.RequestException as e:
+            # 요청 관련 오류
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 오류: {str(e)}")
+            raise Exception(f"API 요청 오류: {str(e)}")
+
+        except ValueError as e:
+            # JSON 파싱 오류 (점검 안내 HTML 등 비정상 응답이므로 장애로 기록)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 응답 JSON 파싱 오류: {str(e)}")
+            raise Exception(f"API 응답 파싱 오류: {str(e)}")
+
+        except Exception as e:
+            # 기타 오류 (API 오류 응답 포함)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 예상치 못한 오류: {str(e)}")
+            raise
+
+    def _stream_page(self, endpoint: str, params: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """
+        한 페이지를 스트리밍으로 요청하여 응답 본문을 읽는 대로 파싱하는 제너레이터
+
+        응답 캐시와 fixture 기록은 본문 전체가 필요하므로 사용하지 않습니다.
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+
+        Yields:
+            Tuple[str, Any]: ("total", 전체 결과 수) 또는 ("row", 행 한 건)
+
+        Raises:
+            Exception: API 요청 또는 응답 파싱 중 발생한 오류
+        """
+        url = self._prepare_request(endpoint, params)
+
+        # 서킷이 열려 있으면 타임아웃을 기다리지 않고 즉시 실패
+        self._before_call(endpoint)
+
+        # 허용 속도를 넘지 않도록 대기
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+        try:
+            with self.session.get(url, params=params, timeout=self._get_timeout(endpoint), stream=True) as response:
+                logger.info(f"API 응답 상태 코드: {response.status_code}")
+
+                # HTTP 오류 확인
+                if response.status_code != 200:
+                    logger.error(f"HTTP 오류: {response.status_code}, 응답: {response.text}")
+                    raise AssemblyAPIError(
+                        f"API 요청 실패: {response.status_code}, {response.text}",
+                        status_code=response.status_code
+                    )
+
+                # 청크 경계에서 잘린 멀티바이트 문자를 이어 붙이기 위해 점진적 디코더 사용
+                parser = RowStreamParser()
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                for chunk in response.iter_content(chunk_size=settings.ASSEMBLY_API_STREAM_CHUNK_SIZE):
+                    for kind, value in parser.feed(decoder.decode(chunk)):
+                        if kind == "row":
+                            yield kind, value
+                            continue
+                        total_count = self._check_stream_event(endpoint, kind, value)
+                        if total_count is not None:
+                            yield "total", total_count
+                parser.feed(decoder.decode(b"", final=True))
+                parser.close()
+
+            self._record_success(endpoint)
+
+        except requests.exceptions.RequestException as e:
+            # 요청 관련 오류
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 오류: {str(e)}")
+            raise Exception(f"API 요청 오류: {str(e)}")
+
+        except ValueError as e:
+            # JSON 파싱 오류 (점검 안내 HTML 등 비정상 응답이므로 장애로 기록)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 응답 JSON 파싱 오류: {str(e)}")
+            raise Exception(f"API 응답 파싱 오류: {str(e)}")
+
+        except Exception as e:
+            # 기타 오류 (API 오류 응답 포함)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 예상치 못한 오류: {str(e)}")
+            raise
+
+    def _iter_rows_streaming(self, endpoint: str, params: Dict[str, Any],
+                             page_index: int, page_size: int,
+                             budget: Optional[AdaptiveRateLimiter] = None) -> Iterator[Dict]:
+        """페이지를 차례로 스트리밍 요청하며 행을 한 건씩 반환 (iter_rows의 스트리밍 모드)"""
+        while True:
+            if budget is not None:
+                budget.acquire()
+            total_count = None
+            row_count = 0
+            for kind, value in self._stream_page(endpoint, self._page_params(params, page_index, page_size)):
+                if kind == "total":
+                    total_count = value
+                else:
+                    row_count += 1
+                    yield value
+            if not self._has_next_page(row_count, page_index, page_size, total_count):
+                return
+            page_index += 1
+
+    def iter_rows(self,
+                  endpoint: str,
+                  params: Dict[str, Any],
+                  page_size: Optional[int] = None,
+                  stream: Optional[bool] = None,
+                  budget: Optional[AdaptiveRateLimiter] = None,
+                  use_cache: bool = True) -> Iterator[Dict]:
+        """
+        여러 페이지에 걸친 API 결과를 한 행씩 반환하는 제너레이터
+
+        응답 헤더의 list_total_count를 읽어 pIndex를 차례로 넘기며,
+        호출자가 현재 페이지를 소비하는 동안 다음 페이지를 미리 요청합니다.
+        전체 결과를 한 번에 메모리에 올리지 않습니다.
+        스트리밍 모드에서는 페이지 응답도 통째로 읽지 않고 도착하는 대로 row를 파싱합니다.
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리 (pIndex가 있으면 해당 페이지부터 시작)
+            page_size: 페이지 당 결과 수 (선택, 기본값: params의 pSize 또는 API 최대치)
+            stream: 스트리밍 파싱 사용 여부 (선택, 기본값: ASSEMBLY_API_STREAM_ROWS 설정값)
+            budget: 공용 속도 제한과 별도로 페이지 요청마다 토큰을 받을 작업별 호출 예산 (선택)
+            use_cache: 캐시된 페이지를 사용할지 여부 (기본값: True, 스트리밍 모드는 항상 새로 요청)
+
+        Yields:
+            Dict: 응답 row 한 건
+
+        Raises:
+            Exception: 페이지 요청 중 발생한 오류
+        """
+        size = self._resolve_page_size(params, page_size)
+        page_index = int(params.get("pIndex", 1))
+
+        if self._use_stream(stream):
+            yield from self._iter_rows_streaming(endpoint, params, page_index, size, budget)
+            return
+
+        def fetch(index: int) -> Dict:
+            if budget is not None:
+                budget.acquire()
+            return self._make_request(endpoint, self._page_params(params, index, size), use_cache=use_cache)
+
+        # 다음 페이지 선요청용 단일 작업자
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(fetch, page_index)
+        try:
+            while future is not None:
+                response_data = future.result()
+                rows = self._extract_rows(endpoint, response_data)
+                if rows is None:
+                    logger.error(f"API 응답 구조 예상과 다름: {response_data}")
+                    return
+                total_count = self._extract_total_count(endpoint, response_data)
+
+                # 현재 페이지를 넘겨주기 전에 다음 페이지 요청 시작
+                future = None
+                if self._has_next_page(len(rows), page_index, size, total_count):
+                    page_index += 1
+                    future = executor.submit(fetch, page_index)
+
+                del response_data
+                yield from rows
+        finally:
+            # 소비가 중단되면 대기 중인 선요청 취소
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def get_members(self,
+                assembly_term: int = settings.ASSEMBLY_TERM,
+                name: Optional[str] = None,
+                party: Optional[str] = None,
+                use_cache: bool = True) -> List[Dict]:
+        """
+        국회의원 인적사항 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            name: 이름 검색어 (선택)
+            party: 정당 검색어 (선택)
+            use_cache: 캐시된 응답을 사용할지 여부 (기본값: True, 동기화에서는 False)
+
+        Returns:
+            국회의원 정보 목록
+        """
+        endpoint = "nwvrqwxyaytdsfvhu"  # 국회의원 인적사항 API 엔드포인트
+        params = self._members_params(assembly_term, name, party)
+
+        try:
+            # 모든 페이지의 국회의원 목록 수집
+            members_data = list(self.iter_rows(endpoint, params, use_cache=use_cache))
+            self._log_member_fields(members_data)
+            return members_data
+        except Exception as e:
+            logger.error(f"국회의원 정보 조회 중 오류: {str(e)}")
+            return []
+
+    def get_bills(self,
+             assembly_term: int = settings.ASSEMBLY_TERM,
+             bill_name: Optional[str] = None,
+             proposer: Optional[str] = None,
+             committee: Optional[str] = None,
+             start_date: Optional[str] = None,
+             end_date: Optional[str] = None,
+             bill_id: Optional[str] = None,
+             bill_no: Optional[str] = None,
+             page_index: int = 1,
+             page_size: int = 20) -> List[Dict]:
+        """
+        국회 의안정보 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            bill_name: 의안명 검색어 (선택)
+            proposer: 제안자명 검색어 (선택)
+            committee: 소관위원회명 검색어 (선택)
+            start_date: 제안일 시작일 (선택, 형식: YYYYMMDD)
+            end_date: 제안일 종료일 (선택, 형식: YYYYMMDD)
+            bill_id: 의안ID (선택)
+            bill_no: 의안번호 (선택)
+            page_index: 페이지 위치 (기본값: 1)
+            page_size: 페이지 당 결과 수 (기본값: 20)
+
+        Returns:
+            의안 정보 목록
+        """
+        # 의안정보 조회 API 엔드포인트
+        endpoint = "ALLBILL"  # 의안정보 통합 API 엔드포인트
+        params = self._bills_params(
+            assembly_term, bill_name, proposer, committee,
+            start_date, end_date, bill_id, bill_no, page_index, page_size
+        )
+
         try:
-            endpoint = "BILLINFOPPSR"  # 의안 제안자정보 API 엔드포인트
-            
-            params = {
-                "BILL_ID": bill_id,  # 의안ID (필수)
-                "pIndex": 1,
-                "pSize": 100
-            }
-            
             response_data = self._make_request(endpoint, params)
-            
-            # API 응답에서 의안 제안자 정보 추출
-            if endpoint in response_data and "row" in response_data[endpoint]:
-                proposers_data = response_data[endpoint]["row"]
-                
-                # 대표발의자와 공동발의자 구분
-                rep_proposer = None
-                co_proposers = []
-                
-                for proposer in proposers_data:
-                    if proposer.get("REP_DIV") == "대표발의":
-                        rep_proposer = proposer.get("PPSR_NM", "")
-                    else:
-                        co_proposers.append(proposer.get("PPSR_NM", ""))
-                
-                # 결과가 있는 경우에만 업데이트
-                if rep_proposer:
-                    result["rep_proposer"] = rep_proposer
-                if co_proposers:
-                    result["co_proposers"] = co_proposers
-                
-                # 성공 시 실패 카운터 초기화
-                self.proposer_api_fail_count = 0
-            else:
-                # 데이터 없음은 실패로 간주
-                self.proposer_api_fail_count += 1
-                logger.info(f"제안자 정보 API 데이터 없음 ({self.proposer_api_fail_count}/{self.max_proposer_api_fails}): {bill_id}")
-        
+
+            # API 응답에서 의안 목록 추출
+            return self._parse_bills(response_data, params)
         except Exception as e:
-            # 실패 카운터 증가
-            self.proposer_api_fail_count += 1
-            logger.info(f"제안자 정보 API 호출 실패 ({self.proposer_api_fail_count}/{self.max_proposer_api_fails}): {str(e)}")
-        
-        return result
+            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+            return []
+
+    def get_bill_detail(self, bill_id: str = None, bill_no: str = None, raise_errors: bool = False) -> Dict:
+        """
+        의안 상세정보 조회
+
+        Args:
+            bill_id: 의안ID (선택)
+            bill_no: 의안번호 (선택)
+            raise_errors: 조회 실패 시 빈 딕셔너리 대신 예외를 발생시킬지 여부
+                (True면 빈 딕셔너리는 정상 응답에 의안이 없었다는 뜻)
+
+        Returns:
+            의안 상세 정보 딕셔너리
+
+        Raises:
+            Exception: raise_errors가 True이고 요청이 실패했거나 응답 구조를 알 수 없는 경우
+
+        Note:
+            bill_id 또는 bill_no 중 하나는 반드시 제공해야 함
+        """
+        # 동일한 엔드포인트 사용
+        endpoint = "ALLBILL"
+
+        # BILL_NO(의안번호)나 BILL_ID(의안ID) 중 하나는 필수
+        if not bill_no and not bill_id:
+            logger.error("의안번호(BILL_NO)나 의안ID(BILL_ID)가 필요합니다.")
+            return {}
+
+        params = self._bill_detail_params(bill_id, bill_no)
+
+        try:
+            response_data = self._make_request(endpoint, params)
+            self._ensure_bill_detail_rows(endpoint, response_data)
+
+            # API 응답에서 의안 상세정보 추출
+            return self._parse_bill_detail(response_data)
+        except Exception as e:
+            logger.error(f"의안 상세정보 조회 중 오류: {str(e)}")
+            if raise_errors:
+                raise
+            return {}
+
+    def get_bill_vote_results(self,
+                             assembly_term: int = settings.ASSEMBLY_TERM,
+                             bill_id: Optional[str] = None) -> List[Dict]:
+        """
+        의안별 표결 현황 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            bill_id: 의안ID (선택)
+
+        Returns:
+            의안 표결 현황 목록
+        """
+        endpoint = "nzmimeepazyrjsxdq"  # 의안별 표결현황 API 엔드포인트
+        params = self._bill_vote_results_params(assembly_term, bill_id)
+
+        # 모든 페이지의 표결 현황 수집
+        return list(self.iter_rows(endpoint, params))
+
+    def get_member_vote_results(self,
+                               assembly_term: int = settings.ASSEMBLY_TERM,
+                               member_name: Optional[str] = None,
+                               bill_id: Optional[str] = None) -> List[Dict]:
+        """
+        국회의원 표결정보 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            member_name: 의원명 (선택)
+            bill_id: 의안ID (선택)
+
+        Returns:
+            국회의원 표결정보 목록
+        """
+        endpoint = "nzmimeepazxkubdpq"  # 국회의원 본회의 표결정보 API 엔드포인트
+        params = self._member_vote_results_params(assembly_term, member_name, bill_id)
+
+        # 모든 페이지의 표결정보 수집
+        return list(self.iter_rows(endpoint, params))
+
+    def get_committee_info(self,
+                          assembly_term: int = settings.ASSEMBLY_TERM,
+                          committee_name: Optional[str] = None) -> List[Dict]:
+        """
+        위원회 현황 정보 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            committee_name: 위원회명 (선택)
+
+        Returns:
+            위원회 정보 목록
+        """
+        endpoint = "nzmimeepazxkubdpc"  # 위원회 현황 정보 API 엔드포인트
+        params = self._committee_info_params(assembly_term, committee_name)
+
+        # 모든 페이지의 위원회 정보 수집
+        return list(self.iter_rows(endpoint, params))
+
+    def get_speech_records(self,
+                      assembly_term: int = settings.ASSEMBLY_TERM,
+                      member_name: Optional[str] = None,
+                      start_date: Optional[str] = None,
+                      end_date: Optional[str] = None) -> List[Dict]:
+        """
+        국회의원 영상회의록(발언영상) 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            member_name: 의원명 (선택)
+            start_date: 회의일자 시작일 (선택, 형식: YYYYMMDD)
+            end_date: 회의일자 종료일 (선택, 형식: YYYYMMDD)
+
+        Returns:
+            발언영상 정보 목록
+        """
+        # API 엔드포인트
+        endpoint = "npeslxqbanwkimebr"  # 국회의원 영상회의록 API 엔드포인트
+        params = self._speech_records_params(assembly_term, member_name, start_date, end_date)
+
+        try:
+            response_data = self._make_request(endpoint, params)
+
+            # API 응답에서 발언영상 정보 추출
+            return self._parse_speech_records(endpoint, response_data)
+        except Exception as e:
+            logger.error(f"발언 정보 조회 중 오류: {str(e)}")
+            return []
+
+    def get_bill_ids_by_age(self,
+                            assembly_term: int = settings.ASSEMBLY_TERM,
+                            page_index: int = 1,
+                            page_size: int = 100,
+                            use_cache: bool = True) -> List[Dict]:
+        """
+        특정 대수의 의안 전체 정보 조회
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            page_index: 페이지 위치 (기본값: 1)
+            page_size: 페이지 당 결과 수 (기본값: 100)
+            use_cache: 캐시된 응답을 사용할지 여부 (기본값: True, 동기화에서는 False)
+
+        Returns:
+            의안 정보 목록
+        """
+        endpoint = "ncocpgfiaoituanbr"  # 의안별 표결현황 API 엔드포인트
+        params = self._bill_ids_by_age_params(assembly_term, page_index, page_size)
+
+        try:
+            response_data = self._make_request(endpoint, params, use_cache=use_cache)
+
+            # API 응답에서 의안 정보 추출
+            return self._parse_bill_ids_by_age(endpoint, response_data)
+        except Exception as e:
+            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+            return []
+
+    def get_bill_ids_by_age_with_total(self,
+                                       assembly_term: int = settings.ASSEMBLY_TERM,
+                                       page_index: int = 1,
+                                       page_size: int = 100,
+                                       use_cache: bool = True) -> Tuple[List[Dict], Optional[int]]:
+        """
+        특정 대수의 의안 목록 한 페이지와 전체 결과 수(list_total_count)를 함께 조회
+        (전체 동기화에서 첫 페이지로 남은 페이지 수를 계산해 나머지 페이지를 동시에 요청할 때 사용)
+
+        Args:
+            assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+            page_index: 페이지 위치 (기본값: 1)
+            page_size: 페이지 당 결과 수 (기본값: 100)
+            use_cache: 캐시된 응답을 사용할지 여부 (기본값: True, 동기화에서는 False)
+
+        Returns:
+            (의안 정보 목록, 전체 결과 수 또는 None)
+        """
+        endpoint = "ncocpgfiaoituanbr"
+        params = self._bill_ids_by_age_params(assembly_term, page_index, page_size)
+
+        try:
+            response_data = self._make_request(endpoint, params, use_cache=use_cache)
+            return (self._parse_bill_ids_by_age(endpoint, response_data),
+                    self._extract_total_count(endpoint, response_data))
+        except Exception as e:
+            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+            return [], None
+
+    def get_bill_proposers(self, bill_id: str, bill_data: Dict = None) -> Dict:
+        """
+        의안 제안자 정보 조회 - 실패 시 기본 정보 활용
+
+        Args:
+            bill_id: 의안ID
+            bill_data: 의안 기본 정보 (선택)
+
+        Returns:
+            의안 제안자 정보 딕셔너리 (대표발의자, 공동발의자 등)
+        """
+        # 의안 기본 정보에서 제안자 추출 (API 실패 시 기본값)
+        result = self._proposers_from_bill_data(bill_data)
+
+        # API에서 제안자 정보 조회 시도
+        try:
+            endpoint = "BILLINFOPPSR"  # 의안 제안자정보 API 엔드포인트
+            params = self._bill_proposers_params(bill_id)
+
+            response_data = self._make_request(endpoint, params)
+
+            # API 응답에서 의안 제안자 정보 추출
+            self._apply_proposers_response(result, endpoint, response_data, bill_id)
+
+        except Exception as e:
+            # 실패 시 의안 기본 정보에서 추출한 값 사용
+            self._log_proposers_failure(bill_id, e)
+
+        return result
+
+    def get_bill_proposers_many(self,
+                                bill_ids: List[str],
+                                bills_data: Optional[Dict[str, Dict]] = None,
+                                concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        여러 의안의 제안자 정보를 스레드 풀로 동시에 조회
+
+        Args:
+            bill_ids: 의안ID 목록
+            bills_data: 의안ID별 의안 기본 정보 (선택, 실패 시 제안자 추출에 사용)
+            concurrency: 동시에 보낼 최대 요청 수 (선택, 기본값: 설정값)
+
+        Returns:
+            Dict[str, Dict]: 의안ID별 제안자 정보 딕셔너리
+        """
+        bill_ids = list(dict.fromkeys(bill_ids))
+        if not bill_ids:
+            return {}
+
+        bills_data = bills_data or {}
+        workers = max(1, min(concurrency or settings.ASSEMBLY_API_PROPOSER_CONCURRENCY, len(bill_ids)))
+        # 호출 속도는 공용 속도 제한기가 조절하므로 여기서는 동시 요청 수만 제한
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda bill_id: self.get_bill_proposers(bill_id, bills_data.get(bill_id)),
+                bill_ids
+            )
+            return dict(zip(bill_ids, results))
+
+class AsyncAssemblyAPI(BaseAssemblyAPI):
+    """
+    국회정보 Open API 비동기 클라이언트 (httpx.AsyncClient 기반)
+
+    AssemblyAPI와 같은 메서드와 응답 정규화를 제공하며,
+    이벤트 루프를 막지 않고 실제 I/O를 await 합니다.
+    (응답 캐시 조회/저장과 fixture 기록 같은 파일 I/O는 스레드에서 실행)
+    """
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 api_key: Optional[str] = None,
+                 cache: Optional[ResponseCache] = response_cache,
+                 limiter: Optional[AdaptiveRateLimiter] = rate_limiter,
+                 breakers: Optional[CircuitBreakerRegistry] = circuit_breakers,
+                 coalescer: Optional[SingleFlight] = request_coalescer):
+        """
+        AsyncAssemblyAPI 클래스 초기화
+
+        Args:
+            base_url: API 기본 URL (선택, 기본값: 설정값)
+            api_key: API 키 (선택, 기본값: 설정값)
+            cache: 응답 캐시 (선택, 기본값: 공용 캐시, None이면 캐시 사용 안 함)
+            limiter: 호출 속도 제한기 (선택, 기본값: 공용 제한기, None이면 제한 없음)
+            breakers: 엔드포인트별 서킷 브레이커 (선택, 기본값: 공용 브레이커, None이면 사용 안 함)
+            coalescer: 동시 요청 병합기 (선택, 기본값: 공용 병합기, None이면 병합 안 함)
+        """
+        super().__init__(base_url=base_url, api_key=api_key, cache=cache, limiter=limiter,
+                         breakers=breakers, coalescer=coalescer)
+        # 비동기 HTTP 클라이언트 (이벤트 루프 안에서 처음 사용할 때 생성)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        커넥션 풀이 설정된 비동기 HTTP 클라이언트 조회 (없으면 생성)
+
+        Returns:
+            httpx.AsyncClient: keep-alive 연결을 재사용하는 클라이언트
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.ASSEMBLY_API_POOL_MAXSIZE,
+                    max_keepalive_connections=settings.ASSEMBLY_API_POOL_MAXSIZE
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """비동기 HTTP 클라이언트와 풀에 남아 있는 연결 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_cached_async(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+        """캐시된 응답 조회 (SQLite 읽기가 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        if self.cache is None:
+            return None
+        return await asyncio.to_thread(self._get_cached, endpoint, params)
+
+    async def _store_cached_async(self, endpoint: str, params: Dict[str, Any], result: Dict) -> None:
+        """정상 응답을 캐시에 저장 (SQLite 쓰기가 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        if self.cache is not None:
+            await asyncio.to_thread(self._store_cached, endpoint, params, result)
+
+    async def _record_fixture_async(self, endpoint: str, params: Dict[str, Any], raw_result: Dict) -> None:
+        """기록 모드면 원본 응답을 fixture 파일로 저장 (파일 쓰기는 스레드에서 실행)"""
+        if self.recorder is not None:
+            await asyncio.to_thread(self.recorder.save, endpoint, params, raw_result)
+
+    async def _make_request(self, endpoint: str, params: Dict[str, Any], use_cache: bool = True) -> Dict:
+        """
+        국회정보 API에 비동기 요청을 보내는 기본 메서드
+
+        Args:
+            endpoint: API 엔드포인트 문자열
+            params: API 요청 파라미터 딕셔너리
+            use_cache: 캐시된 응답을 사용할지 여부 (False면 항상 새로 요청하고 받은 응답으로 캐시를 갱신)
+
+        Returns:
+            API 응답 데이터 딕셔너리
+
+        Raises:
+            Exception: API 요청 또는 응답 파싱 중 발생한 오류
+        """
+        # 캐시에 있으면 네트워크 요청 없이 반환
+        if use_cache:
+            cached = await self._get_cached_async(endpoint, params)
+            if cached is not None:
+                return cached
+
+        # 같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 함께 사용
+        if self.coalescer is not None:
+            return await self.coalescer.do_async(
+                make_request_key(endpoint, params),
+                lambda: self._fetch(endpoint, params)
+            )
+        return await self._fetch(endpoint, params)
+
+    async def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict:
+        """실제 HTTP 요청을 보내고 응답을 확인하여 캐시에 저장 (AssemblyAPI._fetch의 비동기 버전)"""
+        url = self._prepare_request(endpoint, params)
+        connect_timeout, read_timeout = self._get_timeout(endpoint)
+
+        # 서킷이 열려 있으면 타임아웃을 기다리지 않고 즉시 실패
+        self._before_call(endpoint)
+
+        # 허용 속도를 넘지 않도록 대기 (이벤트 루프는 막지 않음)
+        if self.limiter is not None:
+            await self.limiter.acquire_async()
+
+        try:
+            # API 요청 보내기
+            response = await self._get_client().get(
+                url,
+                params=params,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+            )
+
+            # 디버깅을 위한 응답 로깅
+            logger.info(f"API 응답 상태 코드: {response.status_code}")
+
+            # HTTP 오류 확인
+            if response.status_code != 200:
+                logger.error(f"HTTP 오류: {response.status_code}, 응답: {response.text}")
+                raise AssemblyAPIError(
+                    f"API 요청 실패: {response.status_code}, {response.text}",
+                    status_code=response.status_code
+                )
+
+            # JSON 응답 파싱 (기록 모드면 원본 응답 저장) 후 응답 코드 확인
+            raw_result = response.json()
+            await self._record_fixture_async(endpoint, params, raw_result)
+            result = self._check_result(endpoint, raw_result)
+            self._record_success(endpoint)
+            await self._store_cached_async(endpoint, params, result)
+            return result
+
+        except httpx.HTTPError as e:
+            # 요청 관련 오류
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 오류: {str(e)}")
+            raise Exception(f"API 요청 오류: {str(e)}")
+
+        except ValueError as e:
+            # JSON 파싱 오류 (점검 안내 HTML 등 비정상 응답이므로 장애로 기록)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 응답 JSON 파싱 오류: {str(e)}")
+            raise Exception(f"API 응답 파싱 오류: {str(e)}")
+
+        except Exception as e:
+            # 기타 오류 (API 오류 응답 포함)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 예상치 못한 오류: {str(e)}")
+            raise
+
+    async def _stream_page(self, endpoint: str, params: Dict[str, Any]) -> AsyncIterator[Tuple[str, Any]]:
+        """한 페이지를 스트리밍으로 요청하여 파싱 (AssemblyAPI._stream_page의 비동기 버전)"""
+        url = self._prepare_request(endpoint, params)
+        connect_timeout, read_timeout = self._get_timeout(endpoint)
+
+        # 서킷이 열려 있으면 타임아웃을 기다리지 않고 즉시 실패
+        self._before_call(endpoint)
+
+        # 허용 속도를 넘지 않도록 대기 (이벤트 루프는 막지 않음)
+        if self.limiter is not None:
+            await self.limiter.acquire_async()
+
+        try:
+            async with self._get_client().stream(
+                "GET",
+                url,
+                params=params,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+            ) as response:
+                logger.info(f"API 응답 상태 코드: {response.status_code}")
+
+                # HTTP 오류 확인
+                if response.status_code != 200:
+                    await response.aread()
+                    logger.error(f"HTTP 오류: {response.status_code}, 응답: {response.text}")
+                    raise AssemblyAPIError(
+                        f"API 요청 실패: {response.status_code}, {response.text}",
+                        status_code=response.status_code
+                    )
+
+                # 청크 경계에서 잘린 멀티바이트 문자를 이어 붙이기 위해 점진적 디코더 사용
+                parser = RowStreamParser()
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                async for chunk in response.aiter_bytes(settings.ASSEMBLY_API_STREAM_CHUNK_SIZE):
+                    for kind, value in parser.feed(decoder.decode(chunk)):
+                        if kind == "row":
+                            yield kind, value
+                            continue
+                        total_count = self._check_stream_event(endpoint, kind, value)
+                        if total_count is not None:
+                            yield "total", total_count
+                parser.feed(decoder.decode(b"", final=True))
+                parser.close()
+
+            self._record_success(endpoint)
+
+        except httpx.HTTPError as e:
+            # 요청 관련 오류
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 오류: {str(e)}")
+            raise Exception(f"API 요청 오류: {str(e)}")
+
+        except ValueError as e:
+            # JSON 파싱 오류 (점검 안내 HTML 등 비정상 응답이므로 장애로 기록)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 응답 JSON 파싱 오류: {str(e)}")
+            raise Exception(f"API 응답 파싱 오류: {str(e)}")
+
+        except Exception as e:
+            # 기타 오류 (API 오류 응답 포함)
+            self._record_failure(endpoint, e)
+            logger.error(f"API 요청 중 예상치 못한 오류: {str(e)}")
+            raise
+
+    async def _iter_rows_streaming(self, endpoint: str, params: Dict[str, Any],
+                                   page_index: int, page_size: int,
+                                   budget: Optional[AdaptiveRateLimiter] = None) -> AsyncIterator[Dict]:
+        """페이지를 차례로 스트리밍 요청하며 행을 한 건씩 반환 (iter_rows의 스트리밍 모드)"""
+        while True:
+            if budget is not None:
+                await budget.acquire_async()
+            total_count = None
+            row_count = 0
+            async for kind, value in self._stream_page(endpoint, self._page_params(params, page_index, page_size)):
+                if kind == "total":
+                    total_count = value
+                else:
+                    row_count += 1
+                    yield value
+            if not self._has_next_page(row_count, page_index, page_size, total_count):
+                return
+            page_index += 1
+
+    async def iter_rows(self,
+                        endpoint: str,
+                        params: Dict[str, Any],
+                        page_size: Optional[int] = None,
+                        stream: Optional[bool] = None,
+                        budget: Optional[AdaptiveRateLimiter] = None,
+                        use_cache: bool = True) -> AsyncIterator[Dict]:
+        """
+        여러 페이지에 걸친 API 결과를 한 행씩 반환하는 비동기 제너레이터
+        (AssemblyAPI.iter_rows의 비동기 버전, 다음 페이지를 태스크로 선요청, budget은 페이지 요청마다 토큰을 받음,
+        use_cache=False면 캐시를 거치지 않고 새로 요청)
+        """
+        size = self._resolve_page_size(params, page_size)
+        page_index = int(params.get("pIndex", 1))
+
+        if self._use_stream(stream):
+            async for row in self._iter_rows_streaming(endpoint, params, page_index, size, budget):
+                yield row
+            return
+
+        async def request(index: int) -> Dict:
+            if budget is not None:
+                await budget.acquire_async()
+            return await self._make_request(endpoint, self._page_params(params, index, size), use_cache=use_cache)
+
+        def fetch(index: int) -> asyncio.Task:
+            return asyncio.ensure_future(request(index))
+
+        task = fetch(page_index)
+        try:
+            while task is not None:
+                response_data = await task
+                rows = self._extract_rows(endpoint, response_data)
+                if rows is None:
+                    logger.error(f"API 응답 구조 예상과 다름: {response_data}")
+                    return
+                total_count = self._extract_total_count(endpoint, response_data)
+
+                # 현재 페이지를 넘겨주기 전에 다음 페이지 요청 시작
+                task = None
+                if self._has_next_page(len(rows), page_index, size, total_count):
+                    page_index += 1
+                    task = fetch(page_index)
+
+                del response_data
+                for row in rows:
+                    yield row
+        finally:
+            # 소비가 중단되면 대기 중인 선요청 취소
+            if task is not None:
+                task.cancel()
+
+    async def get_members(self,
+                          assembly_term: int = settings.ASSEMBLY_TERM,
+                          name: Optional[str] = None,
+                          party: Optional[str] = None,
+                          use_cache: bool = True) -> List[Dict]:
+        """국회의원 인적사항 조회 (AssemblyAPI.get_members의 비동기 버전)"""
+        endpoint = "nwvrqwxyaytdsfvhu"  # 국회의원 인적사항 API 엔드포인트
+        params = self._members_params(assembly_term, name, party)
+
+        try:
+            members_data = [row async for row in self.iter_rows(endpoint, params, use_cache=use_cache)]
+            self._log_member_fields(members_data)
+            return members_data
+        except Exception as e:
+            logger.error(f"국회의원 정보 조회 중 오류: {str(e)}")
+            return []
+
+    async def get_bills(self,
+                        assembly_term: int = settings.ASSEMBLY_TERM,
+                        bill_name: Optional[str] = None,
+                        proposer: Optional[str] = None,
+                        committee: Optional[str] = None,
+                        start_date: Optional[str] = None,
+                        end_date: Optional[str] = None,
+                        bill_id: Optional[str] = None,
+                        bill_no: Optional[str] = None,
+                        page_index: int = 1,
+                        page_size: int = 20) -> List[Dict]:
+        """국회 의안정보 조회 (AssemblyAPI.get_bills의 비동기 버전)"""
+        endpoint = "ALLBILL"  # 의안정보 통합 API 엔드포인트
+        params = self._bills_params(
+            assembly_term, bill_name, proposer, committee,
+            start_date, end_date, bill_id, bill_no, page_index, page_size
+        )
+
+        try:
+            response_data = await self._make_request(endpoint, params)
+            return self._parse_bills(response_data, params)
+        except Exception as e:
+            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+            return []
+
+    async def get_bill_detail(self, bill_id: str = None, bill_no: str = None, raise_errors: bool = False) -> Dict:
+        """의안 상세정보 조회 (AssemblyAPI.get_bill_detail의 비동기 버전)"""
+        endpoint = "ALLBILL"
+
+        # BILL_NO(의안번호)나 BILL_ID(의안ID) 중 하나는 필수
+        if not bill_no and not bill_id:
+            logger.error("의안번호(BILL_NO)나 의안ID(BILL_ID)가 필요합니다.")
+            return {}
+
+        params = self._bill_detail_params(bill_id, bill_no)
+
+        try:
+            response_data = await self._make_request(endpoint, params)
+            self._ensure_bill_detail_rows(endpoint, response_data)
+            return self._parse_bill_detail(response_data)
+        except Exception as e:
+            logger.error(f"의안 상세정보 조회 중 오류: {str(e)}")
+            if raise_errors:
+                raise
+            return {}
+
+    async def get_bill_vote_results(self,
+                                    assembly_term: int = settings.ASSEMBLY_TERM,
+                                    bill_id: Optional[str] = None) -> List[Dict]:
+        """의안별 표결 현황 조회 (AssemblyAPI.get_bill_vote_results의 비동기 버전)"""
+        endpoint = "nzmimeepazyrjsxdq"  # 의안별 표결현황 API 엔드포인트
+        params = self._bill_vote_results_params(assembly_term, bill_id)
+
+        return [row async for row in self.iter_rows(endpoint, params)]
+
+    async def get_member_vote_results(self,
+                                      assembly_term: int = settings.ASSEMBLY_TERM,
+                                      member_name: Optional[str] = None,
+                                      bill_id: Optional[str] = None) -> List[Dict]:
+        """국회의원 표결정보 조회 (AssemblyAPI.get_member_vote_results의 비동기 버전)"""
+        endpoint = "nzmimeepazxkubdpq"  # 국회의원 본회의 표결정보 API 엔드포인트
+        params = self._member_vote_results_params(assembly_term, member_name, bill_id)
+
+        return [row async for row in self.iter_rows(endpoint, params)]
+
+    async def get_committee_info(self,
+                                 assembly_term: int = settings.ASSEMBLY_TERM,
+                                 committee_name: Optional[str] = None) -> List[Dict]:
+        """위원회 현황 정보 조회 (AssemblyAPI.get_committee_info의 비동기 버전)"""
+        endpoint = "nzmimeepazxkubdpc"  # 위원회 현황 정보 API 엔드포인트
+        params = self._committee_info_params(assembly_term, committee_name)
+
+        return [row async for row in self.iter_rows(endpoint, params)]
+
+    async def get_speech_records(self,
+                                 assembly_term: int = settings.ASSEMBLY_TERM,
+                                 member_name: Optional[str] = None,
+                                 start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> List[Dict]:
+        """국회의원 영상회의록 조회 (AssemblyAPI.get_speech_records의 비동기 버전)"""
+        endpoint = "npeslxqbanwkimebr"  # 국회의원 영상회의록 API 엔드포인트
+        params = self._speech_records_params(assembly_term, member_name, start_date, end_date)
+
+        try:
+            response_data = await self._make_request(endpoint, params)
+            return self._parse_speech_records(endpoint, response_data)
+        except Exception as e:
+            logger.error(f"발언 정보 조회 중 오류: {str(e)}")
+            return []
+
+    async def get_bill_ids_by_age(self,
+                                  assembly_term: int = settings.ASSEMBLY_TERM,
+                                  page_index: int = 1,
+                                  page_size: int = 100,
+                                  use_cache: bool = True) -> List[Dict]:
+        """특정 대수의 의안 전체 정보 조회 (AssemblyAPI.get_bill_ids_by_age의 비동기 버전)"""
+        endpoint = "ncocpgfiaoituanbr"
+        params = self._bill_ids_by_age_params(assembly_term, page_index, page_size)
+
+        try:
+            response_data = await self._make_request(endpoint, params, use_cache=use_cache)
+            return self._parse_bill_ids_by_age(endpoint, response_data)
+        except Exception as e:
+            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+            return []
+
+    async def get_bill_ids_by_age_with_total(self,
+                                             assembly_term: int = settings.ASSEMBLY_TERM,
+                                             page_index: int = 1,
+                                             page_size: int = 100,
+                                             use_cache: bool = True) -> Tuple[List[Dict], Optional[int]]:
+        """의안 목록 한 페이지와 전체 결과 수를 함께 조회 (AssemblyAPI.get_bill_ids_by_age_with_total의 비동기 버전)"""
+        endpoint = "ncocpgfiaoituanbr"
+        params = self._bill_ids_by_age_params(assembly_term, page_index, page_size)
+
+        try:
+            response_data = await self._make_request(endpoint, params, use_cache=use_cache)
+            return (self._parse_bill_ids_by_age(endpoint, response_data),
+                    self._extract_total_count(endpoint, response_data))
+        except Exception as e:
+            logger.error(f"의안 정보 조회 중 오류: {str(e)}")
+            return [], None
+
+    async def get_bill_proposers(self, bill_id: str, bill_data: Dict = None) -> Dict:
+        """의안 제안자 정보 조회 (AssemblyAPI.get_bill_proposers의 비동기 버전)"""
+        # 의안 기본 정보에서 제안자 추출 (API 실패 시 기본값)
+        result = self._proposers_from_bill_data(bill_data)
+
+        try:
+            endpoint = "BILLINFOPPSR"  # 의안 제안자정보 API 엔드포인트
+            params = self._bill_proposers_params(bill_id)
+
+            response_data = await self._make_request(endpoint, params)
+            self._apply_proposers_response(result, endpoint, response_data, bill_id)
+
+        except Exception as e:
+            # 실패 시 의안 기본 정보에서 추출한 값 사용
+            self._log_proposers_failure(bill_id, e)
+
+        return result
+
+    async def get_bill_proposers_many(self,
+                                      bill_ids: List[str],
+                                      bills_data: Optional[Dict[str, Dict]] = None,
+                                      concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """여러 의안의 제안자 정보를 동시에 조회 (AssemblyAPI.get_bill_proposers_many의 비동기 버전)"""
+        bill_ids = list(dict.fromkeys(bill_ids))
+        if not bill_ids:
+            return {}
+
+        bills_data = bills_data or {}
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.ASSEMBLY_API_PROPOSER_CONCURRENCY))
+
+        async def fetch(bill_id: str) -> Dict:
+            # 호출 속도는 공용 속도 제한기가 조절하므로 여기서는 동시 요청 수만 제한
+            async with semaphore:
+                return await self.get_bill_proposers(bill_id, bills_data.get(bill_id))
+
+        results = await asyncio.gather(*(fetch(bill_id) for bill_id in bill_ids))
+        return dict(zip(bill_ids, results))
 
 # 서비스 인스턴스 생성
-assembly_api = AssemblyAPI()
\ No newline at end of file
+assembly_api = AssemblyAPI()
+async_assembly_api = AsyncAssemblyAPI()
@@ -0,0 +1,169 @@
+"""
+다대수 의안 백필 모듈
+
+17대~22대처럼 여러 대수의 의안을 대수별로 나눈 독립된 작업(파티션)으로 채웁니다.
+각 파티션은 별도 프로세스에서 sync_bills_data 전체 동기화를 실행하며,
+실행 기록/체크포인트(sync_runs)를 대수별로 따로 남기므로 중단되면 대수마다 이어서 진행합니다.
+API 호출 속도 한도는 동시에 실행하는 프로세스 수만큼 나눠 사용하여 전체 한도를 넘지 않게 합니다.
+
+여러 프로세스가 같은 SQLite 파일에 페이지 단위로 커밋하므로, 시작할 때 DB를 WAL 모드로 바꿔 읽기와 쓰기가
+서로 막지 않게 하고, 각 프로세스는 잠금이 풀리기를 기다렸다가(SQLITE_BUSY_TIMEOUT) 그래도 잠겨 있으면
+페이지 쓰기를 다시 시도합니다(DB_WRITE_RETRIES).
+
+제한 사항:
+    백필 대상은 의안(bills)뿐입니다. members 테이블은 국회의원코드(member_code)당 한 행이고 term에는
+    가장 최근 대수만 남으므로, 이전 대수의 의원 명단은 백필되지 않고 이전 대수 의안도 발의 의원과 연결하지 않습니다.
+    (의원별 지표/발의안 수는 현재 대수 기준)
+
+실행 방법:
+    python -m app.services.backfill --terms 17-22 --workers 3
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def parse_terms(value: str) -> List[int]:
+    """
+    "17-22", "20,21,22" 형식의 대수 목록 문자열을 정수 목록으로 변환
+
+    Args:
+        value: 쉼표로 구분된 대수 또는 "시작-끝" 범위
+
+    Returns:
+        List[int]: 중복 없이 오름차순 정렬된 대수 목록
+    """
+    terms = set()
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "-" in item:
+            start, end = (int(part) for part in item.split("-", 1))
+            terms.update(range(start, end + 1))
+        else:
+            terms.add(int(item))
+    return sorted(terms)
+
+def _backfill_term(assembly_term: int, max_pages: int, rate_share: float) -> Dict[str, Any]:
+    """
+    대수 하나를 백필하는 파티션 작업 (작업 프로세스에서 실행)
+
+    Args:
+        assembly_term: 국회 대수
+        max_pages: 최대 페이지 수
+        rate_share: 이 프로세스가 사용할 API 호출 속도 한도 비율
+
+    Returns:
+        Dict[str, Any]: 대수, 신규 의안 수, 실행 상태, 소요 시간
+    """
+    # 작업 프로세스에서 새로 import하여 DB 엔진/HTTP 클라이언트를 프로세스마다 따로 생성
+    from app.db.session import SessionLocal
+    from app.services.assembly_api import async_assembly_api
+    from app.services.bill_service import bill_sync_job, sync_bills_data
+    from app.services.rate_limiter import rate_limiter
+    from app.services.sync_runs import get_recent_runs
+
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s - [{assembly_term}대] %(name)s - %(levelname)s - %(message)s")
+    rate_limiter.scale(rate_share)
+
+    async def run() -> int:
+        try:
+            return await sync_bills_data(
+                db,
+                max_pages=max_pages,
+                incremental=False,
+                fetch_content=False,
+                assembly_term=assembly_term
+            )
+        finally:
+            # 같은 프로세스가 다음 대수를 맡을 때 닫힌 이벤트 루프에 묶인 클라이언트를 쓰지 않도록 정리
+            await async_assembly_api.aclose()
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        new_bills = asyncio.run(run())
+        runs = get_recent_runs(db, job=bill_sync_job(assembly_term), limit=1)
+        return {
+            "term": assembly_term,
+            "new_bills": new_bills,
+            "status": runs[0].status if runs else None,
+            "last_completed_page": runs[0].last_completed_page if runs else None,
+            "elapsed_sec": round(time.perf_counter() - started, 2),
+        }
+    finally:
+        db.close()
+
+def backfill_terms(terms: List[int],
+                   workers: Optional[int] = None,
+                   max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    여러 대수의 의안을 대수별 프로세스로 나눠 동시에 백필
+
+    Args:
+        terms: 백필할 국회 대수 목록
+        workers: 동시에 실행할 프로세스 수 (선택, 기본값: settings.BACKFILL_WORKERS)
+        max_pages: 대수별 최대 페이지 수 (선택, 기본값: settings.BACKFILL_MAX_PAGES)
+
+    Returns:
+        List[Dict[str, Any]]: 대수별 결과 (대수 순 정렬)
+    """
+    if not terms:
+        return []
+
+    workers = max(1, min(len(terms), workers or settings.BACKFILL_WORKERS))
+    max_pages = max_pages or settings.BACKFILL_MAX_PAGES
+    # 동시에 실행되는 프로세스가 최대 workers개이므로 각 프로세스는 전체 한도의 1/workers만 사용
+    rate_share = 1.0 / workers
+    logger.info(f"다대수 백필 시작: {terms}대, 프로세스 {workers}개 (프로세스당 호출 한도 {rate_share:.0%})")
+
+    results = []
+    # fork 대신 spawn으로 시작하여 부모 프로세스의 DB 연결/이벤트 루프를 물려받지 않음
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(_backfill_term, term, max_pages, rate_share): term for term in terms}
+        for future in as_completed(futures):
+            term = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"{term}대 백필 중 오류: {e}")
+                result = {"term": term, "new_bills": 0, "status": "failed", "error": str(e)}
+            logger.info(f"{term}대 백필 종료: {result}")
+            results.append(result)
+    return sorted(results, key=lambda result: result["term"])
+
+def main():
+    parser = argparse.ArgumentParser(description="다대수 의안 백필")
+    parser.add_argument("--terms", default=settings.BACKFILL_TERMS, help=f"백필할 대수 (기본값: {settings.BACKFILL_TERMS})")
+    parser.add_argument("--workers", type=int, default=settings.BACKFILL_WORKERS, help=f"동시에 실행할 프로세스 수 (기본값: {settings.BACKFILL_WORKERS})")
+    parser.add_argument("--max-pages", type=int, default=settings.BACKFILL_MAX_PAGES, help=f"대수별 최대 페이지 수 (기본값: {settings.BACKFILL_MAX_PAGES})")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    # 테이블/컬럼을 먼저 준비해 두어 작업 프로세스끼리 스키마 생성을 경합하지 않도록 함
+    from app.db.migrations import upgrade_schema
+    from app.db.session import Base, engine
+    from app.models import bill, member, sync_run  # create_all 대상 테이블 등록
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    if engine.dialect.name == "sqlite":
+        # 작업 프로세스들의 페이지 커밋이 다른 프로세스의 읽기를 막지 않도록 WAL 모드로 전환 (DB 파일에 유지됨)
+        with engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql("PRAGMA journal_mode=WAL").scalar()
+        logger.info(f"SQLite 저널 모드: {journal_mode}")
+
+    for result in backfill_terms(parse_terms(args.terms), workers=args.workers, max_pages=args.max_pages):
+        print(result)
+
+if __name__ == "__main__":
+    main()
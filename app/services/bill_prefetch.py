@@ -0,0 +1,297 @@
+"""
+의안 상세 내용 미리 가져오기(prefetch) 모듈
+
+의안은 상세 내용(제안이유 및 주요내용) 없이 저장되므로, 상세 페이지를 처음 여는 사용자는 API 응답을 기다려야 합니다.
+이 모듈은 사용자가 보기 전에 내용을 채워 두기 위해
+- 상세 페이지 조회 기록을 모아 DB(bill_views)에 저장하고, DB만으로 응답한 비율(적중률)을 집계하며
+- 최근 조회 수, 발의일, 홈 화면 노출 여부로 우선순위를 매겨 높은 의안부터
+- 별도의 호출 속도 한도(settings.CONTENT_PREFETCH_RATE) 안에서 내용을 가져와 저장합니다.
+"""
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.upsert import bulk_upsert, increment_column
+from app.models.bill import Bill as BillModel, BillView
+from app.services.assembly_api import async_assembly_api
+from app.services.rate_limiter import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 조회하고 저장할 의안 수 (중간에 중단되어도 앞선 묶음은 저장됨)
+PREFETCH_CHUNK_SIZE = 50
+
+class BillViewTracker:
+    """
+    의안 상세 페이지 조회 기록 및 적중률 집계
+
+    조회할 때마다 DB에 쓰지 않도록 메모리에 모았다가 일정 간격/건수마다 한 번에 저장합니다.
+    """
+    def __init__(self, flush_seconds: float, flush_size: int):
+        """
+        BillViewTracker 클래스 초기화
+
+        Args:
+            flush_seconds: 조회 기록을 저장하는 간격 (초)
+            flush_size: 이만큼 쌓이면 간격과 관계없이 저장
+        """
+        self.flush_seconds = flush_seconds
+        self.flush_size = flush_size
+        self._pending: Counter = Counter()
+        self._last_viewed: Dict[str, datetime] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, bill_no: str, served_from_db: bool) -> None:
+        """
+        상세 페이지 조회 기록
+
+        Args:
+            bill_no: 의안번호
+            served_from_db: API 호출 없이 DB에 저장된 내용으로 응답했는지 여부
+        """
+        with self._lock:
+            self._pending[bill_no] += 1
+            self._last_viewed[bill_no] = datetime.now()
+            if served_from_db:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _take_pending(self) -> Tuple[Counter, Dict[str, datetime]]:
+        """저장할 조회 기록을 꺼내고 비움"""
+        with self._lock:
+            pending, last_viewed = self._pending, self._last_viewed
+            self._pending, self._last_viewed = Counter(), {}
+            self._last_flush = time.monotonic()
+            return pending, last_viewed
+
+    def _restore_pending(self, pending: Counter, last_viewed: Dict[str, datetime]) -> None:
+        """저장에 실패한 조회 기록을 되돌림"""
+        with self._lock:
+            self._pending.update(pending)
+            for bill_no, viewed_at in last_viewed.items():
+                self._last_viewed[bill_no] = max(viewed_at, self._last_viewed.get(bill_no, viewed_at))
+
+    def flush(self, db: Session) -> int:
+        """
+        모아 둔 조회 기록을 DB에 저장
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            int: 조회 기록을 저장한 의안 수
+        """
+        pending, last_viewed = self._take_pending()
+        if not pending:
+            return 0
+        try:
+            # 처음 조회된 의안은 0회로 추가하고, 모든 의안의 조회 수를 한 번의 UPDATE로 증가
+            bulk_upsert(
+                db, BillView,
+                [{"bill_no": bill_no, "view_count": 0, "last_viewed_at": last_viewed[bill_no]} for bill_no in pending],
+                index_elements=["bill_no"],
+                update_columns=["last_viewed_at"]
+            )
+            ids = dict(db.query(BillView.bill_no, BillView.id).filter(BillView.bill_no.in_(list(pending))).all())
+            increment_column(db, BillView, "view_count", {ids[bill_no]: count for bill_no, count in pending.items() if bill_no in ids})
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self._restore_pending(pending, last_viewed)
+            logger.error(f"의안 조회 기록 저장 중 오류: {e}")
+            return 0
+        return len(pending)
+
+    def maybe_flush(self, db: Session) -> int:
+        """
+        저장 간격이 지났거나 조회 기록이 충분히 쌓였으면 저장
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            int: 조회 기록을 저장한 의안 수 (저장하지 않았으면 0)
+        """
+        with self._lock:
+            due = (
+                len(self._pending) >= self.flush_size
+                or (self._pending and time.monotonic() - self._last_flush >= self.flush_seconds)
+            )
+        return self.flush(db) if due else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        상세 페이지 조회 통계 조회
+
+        Returns:
+            Dict[str, Any]: DB만으로 응답한 횟수(hits), API를 호출한 횟수(misses), 적중률, 저장 대기 중인 의안 수
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else None,
+                "pending_views": len(self._pending),
+            }
+
+def get_recent_bills(db: Session, limit: Optional[int] = None) -> List[BillModel]:
+    """
+    홈 화면에 표시하는 최근 발의안 조회
+
+    Args:
+        db: 데이터베이스 세션
+        limit: 조회할 의안 수 (선택, 기본값: settings.HOME_RECENT_BILLS)
+
+    Returns:
+        List[BillModel]: 발의일 최신순 의안 목록 (현재 대수)
+    """
+    return db.query(BillModel)\
+        .filter(BillModel.term == settings.ASSEMBLY_TERM)\
+        .order_by(BillModel.proposal_date.desc())\
+        .limit(limit or settings.HOME_RECENT_BILLS)\
+        .all()
+
+def _prefetch_score(view_count: int,
+                    last_viewed_at: Optional[datetime],
+                    proposal_date: Optional[date],
+                    on_home: bool,
+                    now: datetime) -> float:
+    """
+    미리 가져오기 우선순위 점수 계산
+
+    조회 수는 마지막 조회 이후 반감기마다, 발의일 점수는 발의 후 설정한 일수마다 절반으로 줄어듭니다.
+    """
+    score = 0.0
+    if view_count and last_viewed_at:
+        hours = max(0.0, (now - last_viewed_at).total_seconds() / 3600)
+        score += settings.CONTENT_PREFETCH_VIEW_WEIGHT * view_count * 0.5 ** (hours / settings.CONTENT_PREFETCH_VIEW_HALF_LIFE_HOURS)
+    if proposal_date:
+        days = max(0, (now.date() - proposal_date).days)
+        score += settings.CONTENT_PREFETCH_RECENCY_WEIGHT * 0.5 ** (days / settings.CONTENT_PREFETCH_RECENCY_DAYS)
+    if on_home:
+        score += settings.CONTENT_PREFETCH_HOME_WEIGHT
+    return score
+
+def rank_prefetch_targets(db: Session, limit: int, now: Optional[datetime] = None) -> List[Tuple[float, int, str]]:
+    """
+    상세 내용이 비어 있는 현재 대수 의안을 미리 가져오기 우선순위로 정렬
+
+    후보는 조회된 적이 있는 의안, 홈 화면의 최근 발의안, 발의일 기준 최근 의안(settings.CONTENT_PREFETCH_CANDIDATES건)입니다.
+    최근(settings.CONTENT_PREFETCH_RECHECK_HOURS 이내)에 조회했는데 API에도 내용이 없던 의안은 후보에서 뺍니다.
+
+    Args:
+        db: 데이터베이스 세션
+        limit: 반환할 최대 의안 수
+        now: 기준 시각 (선택, 기본값: 현재 시각)
+
+    Returns:
+        List[Tuple[float, int, str]]: (점수, 의안 DB ID, 의안ID) 목록 (점수 높은 순)
+    """
+    now = now or datetime.now()
+    recheck_before = now - timedelta(hours=settings.CONTENT_PREFETCH_RECHECK_HOURS)
+    empty_content = db.query(BillModel.id, BillModel.bill_id, BillModel.proposal_date)\
+        .filter(BillModel.term == settings.ASSEMBLY_TERM)\
+        .filter((BillModel.content == "") | BillModel.content.is_(None))\
+        .filter(BillModel.content_checked_at.is_(None) | (BillModel.content_checked_at < recheck_before))
+
+    # 의안 DB ID -> (의안ID, 발의일, 조회 수, 마지막 조회 일시)
+    candidates: Dict[int, Tuple[str, Optional[date], int, Optional[datetime]]] = {}
+    recent = empty_content.order_by(BillModel.proposal_date.desc()).limit(settings.CONTENT_PREFETCH_CANDIDATES).all()
+    for id_, bill_id, proposal_date in recent:
+        candidates[id_] = (bill_id, proposal_date, 0, None)
+    viewed = empty_content.add_columns(BillView.view_count, BillView.last_viewed_at)\
+        .join(BillView, BillView.bill_no == BillModel.bill_no)\
+        .all()
+    for id_, bill_id, proposal_date, view_count, last_viewed_at in viewed:
+        candidates[id_] = (bill_id, proposal_date, view_count or 0, last_viewed_at)
+    home_bills = get_recent_bills(db)
+    home_ids = {bill.id for bill in home_bills}
+    for bill in home_bills:
+        recently_checked = bill.content_checked_at is not None and bill.content_checked_at >= recheck_before
+        if not bill.content and not recently_checked and bill.id not in candidates:
+            candidates[bill.id] = (bill.bill_id, bill.proposal_date, 0, None)
+
+    # 우선순위 큐에서 점수가 높은 limit건만 꺼냄
+    queue = (
+        (_prefetch_score(view_count, last_viewed_at, proposal_date, id_ in home_ids, now), id_, bill_id)
+        for id_, (bill_id, proposal_date, view_count, last_viewed_at) in candidates.items()
+    )
+    ranked = heapq.nlargest(limit, queue)
+    logger.info(f"미리 가져오기 후보 {len(candidates)}건 (조회된 의안 {len(viewed)}건) 중 {len(ranked)}건 선택")
+    return ranked
+
+async def prefetch_bill_contents(db: Session, budget: int, rate: Optional[float] = None) -> int:
+    """
+    우선순위가 높은 의안부터 상세 내용을 가져와 저장
+
+    공용 속도 제한기와 별도로 미리 가져오기 전용 한도(rate)를 두어, 사용자 요청에 쓸 호출 여유를 남깁니다.
+
+    Args:
+        db: 데이터베이스 세션
+        budget: 이번 실행에서 조회할 최대 의안 수 (API 호출 수)
+        rate: 초당 최대 API 호출 수 (선택, 기본값: settings.CONTENT_PREFETCH_RATE)
+
+    Returns:
+        int: 내용을 채운 의안 수 (응답은 왔지만 내용이 비어 있던 의안은 조회 일시만 기록하여 한동안 후보에서 제외)
+    """
+    targets = rank_prefetch_targets(db, budget)
+    if not targets:
+        return 0
+
+    budget_limiter = AdaptiveRateLimiter.fixed(rate or settings.CONTENT_PREFETCH_RATE)
+    semaphore = asyncio.Semaphore(max(1, settings.ASSEMBLY_API_PROPOSER_CONCURRENCY))
+
+    async def fetch(bill_id: str) -> Dict:
+        async with semaphore:
+            await budget_limiter.acquire_async()
+            # 조회 실패는 예외로 받아, 정상 응답에 내용이 없는 경우와 구분
+            return await async_assembly_api.get_bill_detail(bill_id=bill_id, raise_errors=True)
+
+    filled = 0
+    empty = 0
+    for start in range(0, len(targets), PREFETCH_CHUNK_SIZE):
+        chunk = targets[start:start + PREFETCH_CHUNK_SIZE]
+        details = await asyncio.gather(*(fetch(bill_id) for _, _, bill_id in chunk), return_exceptions=True)
+        checked_at = datetime.now()
+        updates = []
+        checked = []  # 응답은 왔지만 내용이 없는 의안 (조회 실패는 기록하지 않고 다음 실행에서 다시 시도)
+        for (_, id_, _), detail in zip(chunk, details):
+            if not isinstance(detail, dict):
+                continue
+            if detail.get("DETAIL_CONTENT"):
+                updates.append({"id": id_, "content": detail.get("DETAIL_CONTENT"), "content_checked_at": checked_at})
+            else:
+                checked.append({"id": id_, "content_checked_at": checked_at})
+        if updates or checked:
+            try:
+                if updates:
+                    db.execute(update(BillModel), updates)
+                if checked:
+                    db.execute(update(BillModel), checked)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            filled += len(updates)
+            empty += len(checked)
+    logger.info(f"의안 상세 내용 미리 가져오기: 대상 {len(targets)}건 중 {filled}건 저장, {empty}건 내용 없음")
+    return filled
+
+# 웹 서버에서 사용하는 조회 기록 인스턴스
+bill_view_tracker = BillViewTracker(settings.BILL_VIEW_FLUSH_SECONDS, settings.BILL_VIEW_FLUSH_SIZE)
@@ -3,25 +3,279 @@
 
 이 모듈은 국회 의안 정보를 외부 API에서 조회하여 데이터베이스에 저장하고 관리하는 기능을 제공합니다.
 """
-import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+import logging
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.bill import Bill as BillModel
 from app.models.member import Member as MemberModel
-from app.services.assembly_api import assembly_api
+from app.db.upsert import bulk_upsert, increment_column, run_with_lock_retry
+from app.services.assembly_api import async_assembly_api
+from app.services.scoring import mark_dirty
+from app.services.sync_index import SyncIndex, upstream_row_hash
+from app.services.sync_pipeline import StageStats, run_stages, log_stage_report
+from app.services.sync_runs import (
+    find_resumable_run, start_run, checkpoint_run, finish_run, fail_run, bill_no_sort_key, get_watermark, set_watermark
+)
 from app.utils.helpers import parse_date
 
 logger = logging.getLogger(__name__)
 
+# 이미 저장된 의안과 충돌할 때 갱신할 컬럼 (처리 상태/표결 정보, 변경 감지 해시)
+BILL_UPSERT_UPDATE_COLUMNS = ["status", "vote_result", "vote_date", "row_hash", "last_updated"]
+
+# 변경 감지 해시에 넣는 컬럼 (기존 의안에서 실제로 갱신하는 값만)
+BILL_HASH_COLUMNS = ("status", "vote_result", "vote_date")
+
+def bill_row_hash(row: Dict[str, Any]) -> str:
+    """
+    bills 행의 변경 감지용 해시 (변환을 마친 처리 상태/표결 정보만 사용)
+
+    목록 API, ALLBILL 등 원본 응답 형식과 관계없이 같은 의안 상태면 같은 해시가 나옵니다.
+
+    Args:
+        row: _bill_row로 만든 bills 행
+
+    Returns:
+        str: 32자리 16진수 해시 문자열
+    """
+    return upstream_row_hash({column: row.get(column) for column in BILL_HASH_COLUMNS})
+
+def _rep_proposer_from_title(bill_name: str) -> Optional[str]:
+    """
+    의안명 괄호 안의 표기에서 대표 발의자 추출
+    
+    Args:
+        bill_name: 의안명 (예: "OO법 일부개정법률안(홍길동의원 대표발의)")
+        
+    Returns:
+        Optional[str]: 대표 발의자 (예: "홍길동의원", "정부", 위원장명) 또는 None
+    """
+    try:
+        if ")" in bill_name and "(" in bill_name:
+            parts = bill_name.split("(")
+            if len(parts) > 1:
+                proposer_part = parts[-1].split(")")[0]
+                if "의원" in proposer_part:
+                    return proposer_part.split("의원")[0] + "의원"
+                elif "위원장" in proposer_part:
+                    return proposer_part
+                elif "정부" in proposer_part:
+                    return "정부"
+    except Exception:
+        pass
+    return None
+
+def _bill_row(
+    bill_data: Dict,
+    proc_date: Optional[Any],
+    rep_proposer: Optional[str],
+    co_proposers: List[str],
+    term: int,
+    now: datetime
+) -> Dict[str, Any]:
+    """
+    의안 목록 API 응답 한 건을 bills 테이블 행 딕셔너리로 변환
+    
+    Args:
+        bill_data: 의안 목록 API 응답 행
+        proc_date: 변환된 처리일 (PROC_DT)
+        rep_proposer: 대표 발의자
+        co_proposers: 공동 발의자 목록
+        term: 국회 대수
+        now: 최종 업데이트 일시
+        
+    Returns:
+        Dict[str, Any]: bulk_upsert에 넘길 행 (모든 행이 같은 키 구성을 가짐)
+    """
+    # 제안자명 정제
+    proposer_clean = None
+    if rep_proposer:
+        proposer_clean = rep_proposer
+        for suffix in ["의원", "위원장", "위원회"]:
+            proposer_clean = proposer_clean.replace(suffix, "").strip()
+    
+    row = {
+        "bill_id": bill_data.get("BILL_ID", ""),
+        "bill_no": bill_data.get("BILL_NO", ""),
+        "title": bill_data.get("BILL_NAME", ""),
+        "committee": bill_data.get("CURR_COMMITTEE", ""),
+        # 처리 결과가 없으면(ALLBILL 변환 행은 키가 있어도 None) 계류 중
+        "status": bill_data.get("PROC_RESULT_CD") or "계류",
+        "proposal_date": proc_date,
+        "content": "",  # 상세 내용은 별도 API 호출 필요
+        "bill_kind": bill_data.get("BILL_KIND_CD", ""),
+        "vote_result": bill_data.get("PROC_RESULT_CD"),
+        "vote_date": proc_date,
+        "rep_proposer": rep_proposer,
+        "proposer": rep_proposer or (bill_data.get("BILL_KIND_CD") or "").endswith("(정부)") and "정부" or "",
+        "co_proposers": ", ".join(co_proposers) if co_proposers else None,
+        "proposer_clean": proposer_clean,
+        "proposer_id": None,
+        "term": term,
+        "row_hash": None,
+        "last_updated": now,
+    }
+    row["row_hash"] = bill_row_hash(row)
+    return row
+
+def _proc_date(bill_data: Dict[str, Any]) -> Optional[date]:
+    """의안 목록 행의 처리일(PROC_DT, YYYY-MM-DD) 변환 (없거나 형식이 다르면 None)"""
+    if not bill_data.get("PROC_DT"):
+        return None
+    try:
+        return datetime.strptime(bill_data.get("PROC_DT"), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+def upsert_bill_rows(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    _bill_row로 만든 의안 행을 의안ID 기준으로 일괄 저장 (커밋하지 않음)
+
+    이미 저장된 의안은 처리 상태/표결 정보와 해시만 갱신하고, 새 행의 표결일이 비어 있으면 기존 표결일을 유지합니다.
+    의안 동기화와 의원별 발의안 동기화가 같은 규칙으로 저장하도록 함께 사용합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        rows: 저장할 bills 행 목록
+    """
+    bulk_upsert(
+        db, BillModel, rows,
+        index_elements=["bill_id"],
+        update_columns=BILL_UPSERT_UPDATE_COLUMNS,
+        coalesce_columns=["vote_date"]
+    )
+
+def _list_row_from_allbill(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    의안정보 통합(ALLBILL) 응답 행을 대수별 의안 목록(ncocpgfiaoituanbr) 행 형식으로 변환
+    (증분 동기화도 전체 동기화와 같은 파싱 경로를 타도록 키 구성을 맞춤)
+    
+    Args:
+        row: ALLBILL 응답 행
+        
+    Returns:
+        Dict[str, Any]: 의안 목록 행과 같은 키를 가진 딕셔너리
+    """
+    return {
+        "BILL_ID": row.get("BILL_ID"),
+        "BILL_NO": row.get("BILL_NO"),
+        "BILL_NAME": row.get("BILL_NM"),
+        "BILL_KIND_CD": row.get("BILL_KND"),
+        "AGE": row.get("AGE"),
+        "CURR_COMMITTEE": row.get("JRCMIT_NM"),
+        "PROPOSE_DT": row.get("PPSL_DT"),
+        # 본회의 의결일 -> 소관위 처리일 -> 발의일 순으로 처리일 결정 (목록 API와 같은 규칙)
+        "PROC_DT": row.get("RGS_RSLN_DT") or row.get("JRCMIT_PROC_DT") or row.get("PPSL_DT"),
+        "PROC_RESULT_CD": row.get("RGS_CONF_RSLT") or row.get("JRCMIT_PROC_RSLT"),
+        "PROPOSER": row.get("PPSR_NM"),
+        "LINK_URL": row.get("LINK_URL"),
+    }
+
+def bill_row_from_allbill(row: Dict[str, Any], rep_proposer: Optional[str], term: int, now: datetime) -> Tuple[Dict[str, Any], str]:
+    """
+    의안정보 통합(ALLBILL) 응답 행을 bills 테이블 행 딕셔너리로 변환 (의원별 발의안 동기화용)
+    
+    Args:
+        row: ALLBILL 응답 행
+        rep_proposer: 대표 발의자
+        term: 국회 대수
+        now: 최종 업데이트 일시
+        
+    Returns:
+        Tuple[Dict[str, Any], str]: (bulk_upsert에 넘길 행, 변경 감지 해시 - 의안 동기화와 같은 방식으로 계산)
+    """
+    bill_data = _list_row_from_allbill(row)
+    bill_row = _bill_row(bill_data, _proc_date(bill_data), rep_proposer, [], term, now)
+    return bill_row, bill_row["row_hash"]
+
+def bill_sync_job(assembly_term: int) -> str:
+    """대수별 의안 동기화 작업 이름 (실행 기록/워터마크를 대수별로 따로 관리)"""
+    return f"bills:{assembly_term}"
+
+def _oldest_pending_date(db: Session, assembly_term: int) -> Optional[date]:
+    """처리 결과가 없는(계류 중인) 의안 중 가장 오래된 발의일"""
+    return db.query(func.min(BillModel.proposal_date))\
+        .filter(BillModel.term == assembly_term, BillModel.vote_result.is_(None))\
+        .scalar()
+
+def _status_sweep_start(db: Session, job: str, assembly_term: int) -> Optional[date]:
+    """
+    이번 증분 업데이트에서 처리 상태를 다시 확인할 구간의 시작일
+
+    처리 상태 워터마크(가장 오래된 계류 의안 발의일)부터 최근까지 실행마다 일정 기간씩 이어서 확인하고,
+    끝에 닿으면 다시 처음부터 확인합니다. (오래 계류된 의안의 늦은 처리 결과도 한 바퀴 안에 반영)
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        assembly_term: 국회 대수
+
+    Returns:
+        Optional[date]: 점검 시작일 (계류 의안이 없으면 None)
+    """
+    status_mark = get_watermark(db, job, "status") or _oldest_pending_date(db, assembly_term)
+    if status_mark is None:
+        return None
+    cursor = get_watermark(db, job, "status_sweep")
+    return cursor if cursor and cursor > status_mark else status_mark
+
+def _write_bill_page(
+    db: Session,
+    index: SyncIndex,
+    rows: List[Dict[str, Any]],
+    pending_links: Dict[str, str],
+    checkpoint: Optional[Callable[[], None]] = None
+) -> None:
+    """
+    한 페이지의 의안 행을 한 번에 저장하고 의원별 발의안 수 증가 (발의안 수가 바뀐 의원은 점수 재계산 대상으로 표시,
+    DB 잠금으로 실패하면 settings.DB_WRITE_RETRIES회까지 다시 시도, 그 밖의 실패는 롤백 후 예외 발생)
+    
+    Args:
+        db: 데이터베이스 세션
+        index: 동기화용 조회 인덱스 (저장 후 갱신)
+        rows: 저장할 bills 행 목록
+        pending_links: 의안ID -> 연결할 대표 발의자 이름
+        checkpoint: 커밋 직전에 호출할 체크포인트 기록 함수 (선택, 페이지 저장과 같은 트랜잭션으로 커밋됨)
+    """
+    # 대표 발의자 이름을 인덱스에서 의원ID로 연결
+    new_bills_by_member: Dict[int, int] = {}
+    for row in rows:
+        member_id = index.member_id(pending_links.get(row["bill_id"]))
+        if member_id is not None:
+            row["proposer_id"] = member_id
+            new_bills_by_member[member_id] = new_bills_by_member.get(member_id, 0) + 1
+    
+    def write() -> None:
+        upsert_bill_rows(db, rows)
+        increment_column(db, MemberModel, "num_bills", new_bills_by_member)
+        mark_dirty(db, new_bills_by_member.keys())
+        if checkpoint is not None:
+            checkpoint()
+        db.commit()
+    
+    # 백필처럼 여러 프로세스가 같은 DB에 쓰는 경우 잠금 충돌은 롤백 후 다시 시도
+    run_with_lock_retry(db, write, settings.DB_WRITE_RETRIES)
+    
+    # 저장한 행을 인덱스에 반영
+    for row in rows:
+        index.add_bill(row["bill_id"], row["row_hash"])
+
 async def sync_bills_data(
     db: Session, 
     max_pages: int = 10, 
     update_existing: bool = False, 
     incremental: bool = True, 
-    fetch_content: bool = True
+    fetch_content: bool = True,
+    index: Optional[SyncIndex] = None,
+    resume: bool = True,
+    assembly_term: Optional[int] = None
 ) -> int:
     """
     의안 데이터를 API에서 가져와 DB에 동기화하는 비동기 함수
@@ -30,47 +284,200 @@ async def sync_bills_data(
         db: 데이터베이스 세션
         max_pages: 처리할 최대 페이지 수
         update_existing: 기존 의안 정보도 업데이트할지 여부
-        incremental: 증분 업데이트 여부 (최근 의안만 가져올지)
-        fetch_content: 의안 상세 내용을 가져올지 여부
+        incremental: 증분 업데이트 여부 (워터마크 이후 발의된 의안과 차례가 된 계류 의안 구간만 가져올지,
+                     변경분 전체를 가져오므로 max_pages는 적용하지 않음)
+        fetch_content: 동기화 후 우선순위가 높은 의안의 상세 내용을 일부 가져올지 여부 (현재 대수만, 최대 settings.CONTENT_PREFETCH_SYNC_BUDGET건)
+        index: 동기화용 조회 인덱스 (선택, 없으면 시작할 때 DB에서 한 번 로드)
+        resume: 같은 모드의 중단된 실행이 있으면 마지막 체크포인트 다음 페이지부터 이어서 실행할지 여부
+                (증분 업데이트는 워터마크가 완료 시에만 전진하므로 이어서 실행하지 않음)
+        assembly_term: 국회 대수 (선택, 기본값: 현재 대수 settings.ASSEMBLY_TERM, 실행 기록/워터마크는 대수별로 관리)
         
     Returns:
         int: 추가된 신규 의안 수
     """
+    run = None
+    run_base_seconds = 0.0
+    run_started_at = time.perf_counter()
     try:
-        logger.info(f"의안 정보 동기화 시작... (최대 {max_pages} 페이지)")
+        term = assembly_term or settings.ASSEMBLY_TERM
+        job = bill_sync_job(term)
+        # 이전 대수 의안은 발의자를 현재 의원과 연결하지 않음 (동명이인/발의안 수 집계 오염 방지)
+        link_members = term == settings.ASSEMBLY_TERM
+        logger.info(f"{term}대 의안 정보 동기화 시작... (최대 {max_pages} 페이지)")
         
-        # 증분 업데이트 시 가장 최근에 추가된 의안의 발의일 확인
-        latest_date = None
+        # 실행 기록(sync_runs) 생성 또는 중단된 실행 이어받기
+        run = start_run(db, job, "incremental" if incremental else "full", max_pages, resume=resume and not incremental)
+        run_base_seconds = run.duration_seconds or 0.0
+        base_skipped = run.skipped_count or 0
+        start_page = (run.last_completed_page or 0) + 1
+        
+        # 의안ID 존재 여부/의원 ID/상태 해시는 행마다 조회하지 않고 인덱스에서 확인
+        if index is None:
+            index = SyncIndex.load(db)
+        
+        # 증분 업데이트 조회 범위 (발의일 기준 [시작, 끝], 끝이 None이면 최신까지)
+        # - 신규 의안: 발의일 워터마크(겹침 포함) 이후
+        # - 처리 상태 점검: 가장 오래된 계류 의안부터 실행마다 settings.SYNC_STATUS_SWEEP_DAYS일씩 돌아가며 다시 조회
+        delta_ranges: List[Tuple[date, Optional[date]]] = []
+        sweep_next: Optional[date] = None  # 성공하면 저장할 다음 점검 시작일 (None이면 처음부터 다시)
         if incremental:
-            latest_bill = db.query(BillModel).order_by(BillModel.proposal_date.desc()).first()
-            if latest_bill and latest_bill.proposal_date:
-                latest_date = latest_bill.proposal_date
-                logger.info(f"증분 업데이트: {latest_date} 이후 의안만 가져옵니다.")
+            proposed_mark = get_watermark(db, job, "proposed")
+            delta_from = (
+                proposed_mark - timedelta(days=settings.SYNC_WATERMARK_OVERLAP_DAYS) if proposed_mark
+                else parse_date(settings.term_start_date(term))
+            )
+            sweep_from = _status_sweep_start(db, job, term)
+            if sweep_from is not None and sweep_from < delta_from:
+                sweep_to = sweep_from + timedelta(days=max(1, settings.SYNC_STATUS_SWEEP_DAYS) - 1)
+                if sweep_to + timedelta(days=1) >= delta_from:
+                    # 점검 구간이 신규 의안 구간에 닿으면 한 번에 조회하고 다음 실행은 가장 오래된 계류 의안부터
+                    delta_from = sweep_from
+                else:
+                    delta_ranges.append((sweep_from, sweep_to))
+                    sweep_next = sweep_to + timedelta(days=1)
+            delta_ranges.append((delta_from, None))
+            logger.info(
+                f"증분 업데이트: 발의일 워터마크 {proposed_mark} -> 조회 범위 "
+                + ", ".join(f"{start}~{end or ''}" for start, end in delta_ranges)
+            )
+        max_proposed: Optional[date] = None  # 이번 실행에서 본 가장 최근 발의일
         
-        current_page = 1
         page_size = 100
+        prefetch_pages = max(1, settings.SYNC_PREFETCH_PAGES)
         total_bills = 0
         updated_bills = 0
+        unchanged_bills = 0
         skipped_bills = 0
         
-        while current_page <= max_pages:
-            logger.info(f"의안 목록 페이지 {current_page} 조회 중...")
+        # 조회 -> 파싱 -> 저장 단계를 크기가 제한된 큐로 연결
+        page_queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch_pages)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, settings.SYNC_QUEUE_SIZE))
+        stop_event = asyncio.Event()  # 저장에 실패하면 설정
+        write_errors: List[str] = []
+        missing_pages: List[int] = []  # 전체 동기화에서 조회에 실패한 페이지 (다음 실행에서 이어서 진행)
+        completed_pages = set()  # 저장을 마친 페이지 (페이지가 순서 없이 도착해도 연속 구간까지만 체크포인트)
+        fetch_stats = StageStats("fetch")
+        parse_stats = StageStats("parse")
+        write_stats = StageStats("write")
+        
+        async def fetch_page(page: int, with_total: bool = False):
+            """의안 목록 한 페이지 조회 (with_total이면 전체 결과 수도 함께 반환, 응답 캐시를 거치지 않고 최신 데이터 조회)"""
+            logger.info(f"의안 목록 페이지 {page} 조회 중...")
+            started = time.perf_counter()
+            if with_total:
+                bills_data, total_count = await async_assembly_api.get_bill_ids_by_age_with_total(
+                    assembly_term=term, page_index=page, page_size=page_size, use_cache=False
+                )
+            else:
+                bills_data = await async_assembly_api.get_bill_ids_by_age(
+                    assembly_term=term, page_index=page, page_size=page_size, use_cache=False
+                )
+                total_count = None
+            fetch_stats.record(len(bills_data), time.perf_counter() - started)
+            return bills_data, total_count
+        
+        async def fetch_pages_in_order(first_page: int):
+            """다음 페이지들을 미리 요청해 두고 페이지 순서대로 넘김 (전체 결과 수를 모를 때)"""
+            pending = deque()
+            next_page = first_page
+            try:
+                while not stop_event.is_set():
+                    while len(pending) < prefetch_pages and next_page <= max_pages:
+                        pending.append((next_page, asyncio.ensure_future(fetch_page(next_page))))
+                        next_page += 1
+                    if not pending:
+                        break
+                    
+                    page, task = pending.popleft()
+                    bills_data, _ = await task
+                    
+                    if not bills_data:
+                        logger.info(f"더 이상 의안 데이터가 없거나 페이지 {page}에서 데이터를 가져오지 못했습니다.")
+                        break
+                    await fetch_stats.put(page_queue, (page, bills_data))
+            finally:
+                for _, task in pending:
+                    task.cancel()
+        
+        async def fetch_pages_fan_out(last_page: int):
+            """남은 페이지를 정해진 수만큼 동시에 조회하여 도착한 순서대로 넘김 (전체 동기화)"""
+            pages = iter(range(start_page + 1, last_page + 1))
             
-            # API에서 의안 목록 가져오기
-            bills_data = assembly_api.get_bill_ids_by_age(
-                assembly_term=22,
-                page_index=current_page,
-                page_size=page_size
-            )
+            async def worker():
+                # 여러 작업자가 같은 페이지 번호 이터레이터를 나눠 가짐 (호출 속도는 공용 속도 제한기가 조절)
+                for page in pages:
+                    if stop_event.is_set():
+                        return
+                    bills_data, _ = await fetch_page(page)
+                    if not bills_data:
+                        logger.warning(f"페이지 {page}에서 의안 데이터를 가져오지 못했습니다.")
+                        missing_pages.append(page)
+                        continue
+                    await fetch_stats.put(page_queue, (page, bills_data))
             
-            if not bills_data:
-                logger.info(f"더 이상 의안 데이터가 없거나 페이지 {current_page}에서 데이터를 가져오지 못했습니다.")
-                break
+            await asyncio.gather(*(worker() for _ in range(max(1, settings.SYNC_FULL_CONCURRENCY))))
+        
+        async def fetch_delta():
+            """증분 업데이트: 의안정보 통합(ALLBILL)에서 조회 범위별로 발의된 의안을 받아 목록 행 형식으로 넘김"""
+            page = 0
+            batch = []
+            started = time.perf_counter()
+            for range_from, range_to in delta_ranges:
+                params = {"AGE": term, "PROPOSE_FROM": range_from.strftime("%Y%m%d")}
+                if range_to:
+                    params["PROPOSE_TO"] = range_to.strftime("%Y%m%d")
+                # 같은 조회 범위를 하루 종일 반복 요청하므로 캐시된 페이지를 쓰면 워터마크가 보지 못한 데이터를 넘어감
+                async for row in async_assembly_api.iter_rows(
+                    "ALLBILL", params, page_size=settings.SYNC_DELTA_PAGE_SIZE, use_cache=False
+                ):
+                    batch.append(_list_row_from_allbill(row))
+                    if len(batch) >= page_size:
+                        page += 1
+                        fetch_stats.record(len(batch), time.perf_counter() - started)
+                        await fetch_stats.put(page_queue, (page, batch))
+                        batch = []
+                        started = time.perf_counter()
+                    if stop_event.is_set():
+                        return
+            if batch:
+                fetch_stats.record(len(batch), time.perf_counter() - started)
+                await fetch_stats.put(page_queue, (page + 1, batch))
+        
+        async def fetch_pages():
+            """1단계(조회): 증분 업데이트는 워터마크 이후 변경분, 전체 동기화는 첫 페이지의 전체 결과 수로 남은 페이지를 동시에 조회"""
+            if incremental:
+                await fetch_delta()
+            elif start_page > max_pages:
+                await fetch_pages_in_order(start_page)
+            else:
+                bills_data, total_count = await fetch_page(start_page, with_total=True)
+                if not bills_data:
+                    logger.info(f"더 이상 의안 데이터가 없거나 페이지 {start_page}에서 데이터를 가져오지 못했습니다.")
+                else:
+                    await fetch_stats.put(page_queue, (start_page, bills_data))
+                    if total_count is None:
+                        await fetch_pages_in_order(start_page + 1)
+                    else:
+                        last_page = min(max_pages, -(-total_count // page_size))
+                        logger.info(f"전체 {total_count}건: 페이지 {start_page + 1}~{last_page}를 동시에 조회합니다.")
+                        await fetch_pages_fan_out(last_page)
+            await fetch_stats.put(page_queue, None)
+        
+        async def parse_pages():
+            """2단계(파싱): 날짜 변환, 신규/기존 의안 구분, 제안자 정보 조회 후 저장할 행 구성"""
+            nonlocal skipped_bills, max_proposed
+            # 앞 페이지가 아직 저장되기 전이라 인덱스에 없는 의안을 다시 신규로 세지 않도록 기록
+            claimed_ids = set()
+            while True:
+                item = await parse_stats.get(page_queue)
+                if item is None:
+                    break
+                page, bills_data = item
+                started = time.perf_counter()
                 
-            # 각 의안 정보 DB에 저장
-            page_new_bills = 0
-            for i, bill_data in enumerate(bills_data):
-                try:
+                # 페이지에서 처리할 의안 추리기 (중복 의안 제외)
+                page_bills: Dict[str, Tuple[Dict, Optional[Any]]] = {}
+                for bill_data in bills_data:
                     # 의안번호와 의안ID 추출
                     bill_id = bill_data.get("BILL_ID", "")
                     bill_no = bill_data.get("BILL_NO", "")
@@ -80,143 +487,180 @@ async def sync_bills_data(
                         continue
                     
                     # 날짜 변환
-                    proc_date = None
-                    if bill_data.get("PROC_DT"):
-                        try:
-                            proc_date = datetime.strptime(bill_data.get("PROC_DT"), "%Y-%m-%d").date()
-                        except ValueError:
-                            proc_date = None
+                    proc_date = _proc_date(bill_data)
                     
-                    # 증분 업데이트 시 최신 날짜보다 오래된 의안은 건너뜀
-                    if incremental and latest_date and proc_date and proc_date <= latest_date:
+                    # 워터마크 계산용 발의일
+                    propose_date = parse_date(bill_data.get("PROPOSE_DT"))
+                    if propose_date:
+                        max_proposed = max(max_proposed or propose_date, propose_date)
+                    
+                    # 같은 페이지에 중복된 의안은 한 번만 처리
+                    if bill_id in page_bills:
                         skipped_bills += 1
                         continue
-                        
-                    # 이미 저장된 의안인지 확인
-                    existing_bill = db.query(BillModel).filter(BillModel.bill_id == bill_id).first()
-                    
-                    # 기존 데이터가 있는 경우 처리
-                    if existing_bill:
-                        # 업데이트 옵션이 켜져 있으면 기존 데이터 업데이트
-                        if update_existing:
-                            existing_bill.status = bill_data.get("PROC_RESULT_CD", existing_bill.status)
-                            existing_bill.vote_result = bill_data.get("PROC_RESULT_CD")
-                            existing_bill.last_updated = datetime.now()
-                            
-                            # 표결 정보 업데이트
-                            if bill_data.get("PROC_DT"):
-                                try:
-                                    existing_bill.vote_date = proc_date
-                                except ValueError:
-                                    pass
-                                    
-                            updated_bills += 1
-                        else:
+                    page_bills[bill_id] = (bill_data, proc_date)
+                
+                # 이미 저장된(또는 앞 페이지에서 저장 대기 중인) 의안을 인덱스에서 확인
+                new_bills_data = {
+                    bill_id: value for bill_id, value in page_bills.items()
+                    if not index.has_bill(bill_id) and bill_id not in claimed_ids
+                }
+                claimed_ids.update(new_bills_data.keys())
+                
+                # 신규 의안의 제안자 정보를 동시에 조회 (bill_data 자체도 함께 전달)
+                proposers_by_bill = await async_assembly_api.get_bill_proposers_many(
+                    list(new_bills_data.keys()),
+                    {bill_id: bill_data for bill_id, (bill_data, _) in new_bills_data.items()}
+                )
+                
+                # 행 데이터 구성
+                now = datetime.now()
+                rows = []
+                pending_links: Dict[str, str] = {}  # 의안ID -> 연결할 대표 발의자 이름
+                page_updated_bills = 0
+                page_unchanged_bills = 0
+                for bill_id, (bill_data, proc_date) in page_bills.items():
+                    if bill_id not in new_bills_data:
+                        # 기존 의안은 업데이트 옵션이 켜져 있거나 증분 업데이트이고, 처리 상태/표결 정보 해시가 바뀐 경우에만 갱신
+                        # (충돌 시 처리 상태/표결 정보와 해시만 갱신되므로 나머지 컬럼은 비워 둠)
+                        if not (update_existing or incremental):
                             skipped_bills += 1
+                        else:
+                            row = _bill_row(bill_data, proc_date, None, [], term, now)
+                            if index.bill_changed(bill_id, row["row_hash"]):
+                                rows.append(row)
+                                page_updated_bills += 1
+                            else:
+                                page_unchanged_bills += 1
                         continue
                     
-                    # 제안자 정보 조회 및 설정 (bill_data 자체도 함께 전달)
-                    proposers_info = assembly_api.get_bill_proposers(bill_id, bill_data)
+                    proposers_info = proposers_by_bill.get(bill_id, {})
                     rep_proposer = proposers_info.get("rep_proposer")
                     co_proposers = proposers_info.get("co_proposers", [])
                     
                     # 의안명에서 발의자 정보 추출 시도 (이미 get_bill_proposers에서 시도했지만 실패한 경우 여기서 재시도)
                     if not rep_proposer:
-                        bill_name = bill_data.get("BILL_NAME", "")
-                        try:
-                            if ")" in bill_name and "(" in bill_name:
-                                parts = bill_name.split("(")
-                                if len(parts) > 1:
-                                    proposer_part = parts[-1].split(")")[0]
-                                    if "의원" in proposer_part:
-                                        rep_proposer = proposer_part.split("의원")[0] + "의원"
-                                    elif "위원장" in proposer_part:
-                                        rep_proposer = proposer_part
-                                    elif "정부" in proposer_part:
-                                        rep_proposer = "정부"
-                        except:
-                            pass
+                        rep_proposer = _rep_proposer_from_title(bill_data.get("BILL_NAME", ""))
                     
-                    # 새 의안 데이터 생성
-                    new_bill = BillModel(
-                        bill_id=bill_id,
-                        bill_no=bill_no,
-                        title=bill_data.get("BILL_NAME", ""),
-                        committee=bill_data.get("CURR_COMMITTEE", ""),
-                        status=bill_data.get("PROC_RESULT_CD", "계류"),
-                        proposal_date=proc_date,
-                        content="",  # 상세 내용은 별도 API 호출 필요
-                        bill_kind=bill_data.get("BILL_KIND_CD", ""),
-                        vote_result=bill_data.get("PROC_RESULT_CD"),
-                        vote_date=proc_date,
-                        rep_proposer=rep_proposer,
-                        proposer=rep_proposer or bill_data.get("BILL_KIND_CD", "").endswith("(정부)") and "정부" or "",
-                        co_proposers=", ".join(co_proposers) if co_proposers else None
-                    )
-
-                    # 제안자명 정제
-                    if rep_proposer:
-                        clean_name = rep_proposer
-                        for suffix in ["의원", "위원장", "위원회"]:
-                            clean_name = clean_name.replace(suffix, "").strip()
-                        new_bill.proposer_clean = clean_name
-                    
-                    # 대표 발의자가 있으면 의원 테이블에서 조회하여 연결
-                    if rep_proposer and "위원장" not in rep_proposer and rep_proposer != "정부":
-                        # 정제된 이름으로 조회
-                        clean_name = new_bill.proposer_clean if new_bill.proposer_clean else rep_proposer.replace("의원", "").strip()
-                        
-                        proposer_member = db.query(MemberModel).filter(
-                            MemberModel.name == clean_name
-                        ).first()
-                        
-                        if proposer_member:
-                            new_bill.proposer_id = proposer_member.id
-                            
-                            # 의원의 발의안 수 증가
-                            proposer_member.num_bills += 1
-                    
-                    db.add(new_bill)
-                    total_bills += 1
-                    page_new_bills += 1
-                    
-                    # 20건마다 커밋
-                    if total_bills > 0 and total_bills % 20 == 0:
-                        db.commit()
-                        logger.info(f"현재까지 {total_bills}개 신규 의안, {updated_bills}개 업데이트, {skipped_bills}개 건너뜀")
-                    
-                    # API 과부하 방지를 위한 대기 - 제안자 정보 API 실패 횟수가 임계값에 도달하면 대기 시간 단축
-                    if assembly_api.proposer_api_fail_count >= assembly_api.max_proposer_api_fails:
-                        # 연속 실패가 많으면 대기 시간 단축
-                        if i > 0 and i % 10 == 0:
-                            await asyncio.sleep(0.2)
-                    else:
-                        # 일반적인 대기 시간
-                        if i > 0 and i % 5 == 0:
-                            await asyncio.sleep(0.5)
+                    row = _bill_row(bill_data, proc_date, rep_proposer, co_proposers, term, now)
+                    rows.append(row)
                     
+                    # 대표 발의자가 있으면 의원 테이블에서 조회하여 연결 (의원 테이블은 현재 대수 기준이므로 현재 대수 의안만)
+                    if link_members and rep_proposer and "위원장" not in rep_proposer and rep_proposer != "정부":
+                        pending_links[bill_id] = row["proposer_clean"] or rep_proposer.replace("의원", "").strip()
+                
+                parse_stats.record(len(rows), time.perf_counter() - started)
+                page_new_bills = len(new_bills_data)
+                await parse_stats.put(write_queue, (page, rows, pending_links, page_new_bills, page_updated_bills, page_unchanged_bills))
+            await parse_stats.put(write_queue, None)
+        
+        async def write_pages():
+            """3단계(저장): 단일 작성자가 페이지 단위로 한 번에 저장 (DB 작업은 스레드에서 실행하여 조회와 겹침)"""
+            nonlocal total_bills, updated_bills, unchanged_bills
+            while True:
+                item = await write_stats.get(write_queue)
+                if item is None:
+                    break
+                page, rows, pending_links, page_new_bills, page_updated_bills, page_unchanged_bills = item
+                started = time.perf_counter()
+                
+                def checkpoint():
+                    """페이지 저장과 같은 트랜잭션으로 실행 기록 갱신"""
+                    proposal_dates = [row["proposal_date"] for row in rows if row.get("proposal_date")]
+                    # 앞 페이지가 모두 저장된 연속 구간의 끝까지만 완료 페이지로 기록
+                    contiguous_page = start_page - 1
+                    while contiguous_page + 1 in completed_pages or contiguous_page + 1 == page:
+                        contiguous_page += 1
+                    checkpoint_run(
+                        db, run, contiguous_page,
+                        new_count=page_new_bills,
+                        updated_count=page_updated_bills,
+                        unchanged_count=page_unchanged_bills,
+                        skipped_total=base_skipped + skipped_bills,
+                        high_water_date=max(proposal_dates) if proposal_dates else None,
+                        high_water_bill_no=max((row["bill_no"] for row in rows), key=bill_no_sort_key, default=None),
+                        duration_seconds=run_base_seconds + time.perf_counter() - run_started_at
+                    )
+                
+                try:
+                    await asyncio.to_thread(_write_bill_page, db, index, rows, pending_links, checkpoint)
+                    completed_pages.add(page)
+                    total_bills += page_new_bills
+                    updated_bills += page_updated_bills
+                    unchanged_bills += page_unchanged_bills
                 except Exception as e:
-                    logger.error(f"의안 ID {bill_id} 처리 중 오류: {e}")
-                    continue
-            
-            # 커밋
-            db.commit()
-            logger.info(f"페이지 {current_page} 처리 완료. 페이지 내 신규 의안: {page_new_bills}개, 전체: {total_bills}개 신규, {updated_bills}개 업데이트, {skipped_bills}개 건너뜀")
-            
-            # 증분 업데이트 시 한 페이지에서 새 의안이 없으면 더 이상 진행할 필요 없음
-            if incremental and page_new_bills == 0:
-                logger.info("증분 업데이트: 이 페이지에서 새 의안이 없으므로 동기화를 종료합니다.")
-                break
-            
-            # 다음 페이지로
-            current_page += 1
-            
-            # API 과부하 방지
-            await asyncio.sleep(1)
+                    # 체크포인트를 건너뛰지 않도록 여기서 멈춤 (다음 실행은 이 페이지부터 이어서 진행)
+                    logger.error(f"페이지 {page} 의안 저장 중 오류: {e}")
+                    write_errors.append(f"페이지 {page}: {e}")
+                    stop_event.set()
+                    break
+                write_stats.record(len(rows), time.perf_counter() - started)
+                
+                logger.info(f"페이지 {page} 처리 완료. 페이지 내 신규 의안: {page_new_bills}개, 전체: {total_bills}개 신규, {updated_bills}개 업데이트, {unchanged_bills}개 변경 없음, {skipped_bills}개 건너뜀")
+        
+        started_at = time.perf_counter()
+        await run_stages(fetch_pages(), parse_pages(), write_pages())
+        log_stage_report("의안 정보 동기화", [fetch_stats, parse_stats, write_stats], time.perf_counter() - started_at)
+        
+        duration = run_base_seconds + time.perf_counter() - run_started_at
+        if missing_pages:
+            write_errors.append(f"조회 실패 페이지: {sorted(missing_pages)}")
+        if write_errors:
+            fail_run(db, run, "; ".join(write_errors), duration)
+            logger.warning(f"의안 정보 동기화 중단 (실행 ID {run.id}, 마지막 완료 페이지 {run.last_completed_page}). 다음 실행에서 이어서 진행합니다.")
+        else:
+            # 워터마크는 실행이 끝까지 성공했을 때만 전진 (실패하면 다음 증분 업데이트가 같은 범위를 다시 조회)
+            if max_proposed:
+                proposed_mark = get_watermark(db, job, "proposed")
+                set_watermark(db, job, "proposed", max(proposed_mark or max_proposed, max_proposed))
+            set_watermark(db, job, "status", _oldest_pending_date(db, term))
+            if incremental:
+                set_watermark(db, job, "status_sweep", sweep_next)
+            finish_run(db, run, duration, skipped_total=base_skipped + skipped_bills)
+        
+        if fetch_content and term == settings.ASSEMBLY_TERM and not write_errors:
+            # 상세 내용은 동기화 후 우선순위(조회 수, 발의일, 홈 화면 노출)가 높은 의안부터 일부만 채움
+            # (나머지는 동기화 워커의 contents 작업이 호출 속도 한도 안에서 계속 채움)
+            from app.services.bill_prefetch import prefetch_bill_contents
+            try:
+                await prefetch_bill_contents(db, settings.CONTENT_PREFETCH_SYNC_BUDGET)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"의안 상세 내용 미리 가져오기 중 오류: {e}")
         
-        logger.info(f"의안 정보 동기화 완료. 총 {total_bills}개 신규 의안, {updated_bills}개 업데이트, {skipped_bills}개 건너뜀")
+        logger.info(f"의안 정보 동기화 완료. 총 {total_bills}개 신규 의안, {updated_bills}개 업데이트(변경됨), {unchanged_bills}개 변경 없음, {skipped_bills}개 건너뜀")
         return total_bills
     except Exception as e:
           db.rollback()
           logger.error(f"의안 정보 동기화 중 오류 발생: {e}")
-          return 0
\ No newline at end of file
+          if run is not None:
+              fail_run(db, run, str(e), run_base_seconds + time.perf_counter() - run_started_at)
+          return 0
+
+async def auto_sync_bills(db: Session) -> int:
+    """
+    현재 대수 의안을 상황에 맞는 방식으로 동기화 (서버 시작 시/동기화 워커의 정기 실행에서 사용)
+    
+    중단된 전체 동기화가 있으면 이어서 실행하고, 저장된 의안이 적으면 전체 동기화,
+    그 밖에는 워터마크 기반 증분 동기화를 실행합니다.
+    (오래된 계류 의안의 처리 상태는 증분 동기화가 발의일 구간을 돌아가며 다시 확인하므로 전체 동기화를 반복하지 않음)
+    
+    Args:
+        db: 데이터베이스 세션
+        
+    Returns:
+        int: 추가된 신규 의안 수
+    """
+    bills_count = db.query(BillModel).filter(BillModel.term == settings.ASSEMBLY_TERM).count()
+    
+    if find_resumable_run(db, bill_sync_job(settings.ASSEMBLY_TERM), "full"):
+        # 중단된 전체 동기화가 있는 경우 - 마지막 체크포인트부터 이어서 실행
+        logger.info(f"중단된 전체 동기화가 있습니다 (현재 {bills_count}개). 이어서 동기화합니다.")
+        return await sync_bills_data(db, max_pages=20, incremental=False, fetch_content=True)
+    if bills_count < 100:
+        # 데이터가 적은 경우 - 전체 동기화
+        logger.info(f"의안 데이터 부족 (현재 {bills_count}개). 전체 동기화를 시작합니다.")
+        return await sync_bills_data(db, max_pages=20, incremental=False, fetch_content=True)
+    # 데이터가 이미 있는 경우 - 증분 동기화만 수행
+    logger.info(f"의안 데이터가 있습니다 (현재 {bills_count}개). 증분 동기화를 시작합니다.")
+    return await sync_bills_data(db, max_pages=5, incremental=True, fetch_content=True)
@@ -0,0 +1,181 @@
+"""
+국회정보 Open API 엔드포인트별 서킷 브레이커 모듈
+
+엔드포인트마다 연속 실패 횟수를 추적하여 임계값을 넘으면 호출을 즉시 차단(open)하고,
+일정 시간이 지나면 소수의 시험 호출(half-open)로 회복 여부를 확인한 뒤 정상 상태(closed)로 되돌립니다.
+"""
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 API 호출을 건너뛴 경우 발생하는 예외"""
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"서킷 브레이커 열림: {endpoint} ({retry_after:.1f}초 후 재시도)")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """
+    단일 엔드포인트용 서킷 브레이커
+
+    상태:
+    - closed: 정상 호출
+    - open: 호출 차단 (recovery_timeout 동안)
+    - half_open: 시험 호출만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self,
+                 name: str,
+                 failure_threshold: int,
+                 recovery_timeout: float,
+                 half_open_max_calls: int = 1):
+        """
+        CircuitBreaker 클래스 초기화
+
+        Args:
+            name: 엔드포인트 이름
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            recovery_timeout: 서킷을 연 뒤 시험 호출까지 기다릴 시간 (초)
+            half_open_max_calls: half-open 상태에서 동시에 허용할 시험 호출 수
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_started_at = 0.0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.total_successes = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    def before_call(self) -> None:
+        """
+        호출 전 서킷 상태 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 시험 호출 한도를 넘은 경우
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if self.state == self.OPEN:
+                remaining = self.recovery_timeout - (now - self._opened_at)
+                if remaining > 0:
+                    self.rejected_calls += 1
+                    raise CircuitOpenError(self.name, remaining)
+                # 회복 대기 시간이 지나면 시험 호출 허용
+                self.state = self.HALF_OPEN
+                self._probes_in_flight = 0
+                logger.info(f"서킷 브레이커 half-open 전환: {self.name}")
+
+            if self.state == self.HALF_OPEN:
+                # 응답 없이 끝난(취소된) 시험 호출이 자리를 계속 차지하지 않도록 오래된 시험은 무시
+                if self._probes_in_flight and now - self._probe_started_at > self.recovery_timeout:
+                    self._probes_in_flight = 0
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    self.rejected_calls += 1
+                    raise CircuitOpenError(self.name, self.recovery_timeout)
+                self._probes_in_flight += 1
+                self._probe_started_at = now
+
+    def record_success(self) -> None:
+        """호출 성공 기록 - half-open 상태였다면 서킷을 닫음"""
+        with self._lock:
+            self.total_successes += 1
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                logger.info(f"서킷 브레이커 closed 전환 (회복 확인): {self.name}")
+            self.state = self.CLOSED
+            self._probes_in_flight = 0
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 - 연속 실패가 임계값을 넘거나 시험 호출이 실패하면 서킷을 엶"""
+        with self._lock:
+            self.total_failures += 1
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                    logger.warning(
+                        f"서킷 브레이커 open 전환: {self.name} "
+                        f"(연속 실패 {self.consecutive_failures}회, {self.recovery_timeout}초 후 시험 호출)"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        서킷 브레이커 통계 조회
+
+        Returns:
+            Dict[str, Any]: 상태, 연속 실패 횟수, 누적 성공/실패/차단 횟수
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "successes": self.total_successes,
+            "failures": self.total_failures,
+            "rejected": self.rejected_calls,
+            "times_opened": self.times_opened,
+        }
+
+class CircuitBreakerRegistry:
+    """
+    엔드포인트별 서킷 브레이커 모음 (처음 호출되는 엔드포인트는 자동 생성)
+    """
+    def __init__(self, failure_threshold: int, recovery_timeout: float, half_open_max_calls: int = 1):
+        """
+        CircuitBreakerRegistry 클래스 초기화
+
+        Args:
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            recovery_timeout: 서킷을 연 뒤 시험 호출까지 기다릴 시간 (초)
+            half_open_max_calls: half-open 상태에서 동시에 허용할 시험 호출 수
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """엔드포인트의 서킷 브레이커 조회 (없으면 생성)"""
+        breaker: Optional[CircuitBreaker] = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(endpoint, CircuitBreaker(
+                    endpoint,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls
+                ))
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 서킷 브레이커 통계 조회"""
+        return {name: breaker.stats() for name, breaker in self._breakers.items()}
+
+# 두 API 클라이언트(동기/비동기)가 함께 사용하는 서킷 브레이커 모음
+circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.ASSEMBLY_API_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.ASSEMBLY_API_BREAKER_RECOVERY_TIMEOUT,
+    half_open_max_calls=settings.ASSEMBLY_API_BREAKER_HALF_OPEN_MAX_CALLS
+)
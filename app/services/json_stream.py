@@ -0,0 +1,184 @@
+"""
+국회정보 Open API 응답 스트리밍 파싱 모듈
+
+응답 본문 전체를 json.loads로 한 번에 읽지 않고, 청크 단위로 받으면서
+{"<엔드포인트>": [{"head": [...]}, {"row": [{...}, {...}]}]} 구조의 row를 한 건씩 꺼냅니다.
+메모리에는 현재 읽고 있는 row 하나와 아직 처리하지 않은 청크만 남습니다.
+"""
+import json
+from typing import Any, List, Tuple
+
+_WHITESPACE = " \t\n\r"
+# 처리한 위치가 이 길이를 넘으면 버퍼 앞부분을 잘라냄
+_COMPACT_THRESHOLD = 64 * 1024
+
+class StreamParseError(ValueError):
+    """응답 본문이 예상한 JSON 구조가 아닌 경우 발생하는 예외"""
+
+class RowStreamParser:
+    """
+    청크를 넣을 때마다 완성된 값을 이벤트로 돌려주는 점진적 파서
+
+    이벤트 (종류, 값):
+    - ("RESULT", dict): 최상위 RESULT (오류 또는 데이터 없음 응답)
+    - ("head", list): 목록 헤더 (list_total_count, RESULT 포함)
+    - ("row", dict): 결과 행 한 건
+    - (기타 키, 값): 그 밖의 최상위/목록 항목 값
+    """
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        # 현재 항목이 목록([...]) 안에 있는지 여부
+        self._in_list = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        응답 본문 청크를 추가하고 새로 완성된 이벤트 반환
+
+        Args:
+            chunk: 디코딩된 응답 본문 조각
+
+        Returns:
+            List[Tuple[str, Any]]: (이벤트 종류, 값) 목록
+        """
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += chunk
+
+        events: List[Tuple[str, Any]] = []
+        while self._step(events):
+            pass
+        return events
+
+    def close(self) -> None:
+        """
+        본문을 모두 넣은 뒤 호출하여 응답이 끝까지 완성되었는지 확인
+
+        Raises:
+            StreamParseError: 응답이 중간에 끊긴 경우
+        """
+        self._skip_whitespace()
+        if self._state != "done" or self._pos < len(self._buffer):
+            raise StreamParseError(f"응답 본문이 완전하지 않습니다 (상태: {self._state})")
+
+    def _skip_whitespace(self) -> None:
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+
+    def _peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (데이터가 더 필요하면 빈 문자열)"""
+        self._skip_whitespace()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else ""
+
+    def _decode(self) -> Tuple[bool, Any]:
+        """
+        현재 위치의 JSON 값 하나를 디코딩
+
+        Returns:
+            Tuple[bool, Any]: (완성 여부, 값) - 값이 아직 다 도착하지 않았으면 (False, None)
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            # 객체/배열/문자열은 닫는 기호가 도착해야 디코딩되므로 다음 청크를 기다림
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._pos] != char:
+            raise StreamParseError(f"'{char}' 위치에 '{self._buffer[self._pos]}'가 있습니다 (위치 {self._pos})")
+        self._pos += 1
+
+    def _step(self, events: List[Tuple[str, Any]]) -> bool:
+        """
+        상태 하나를 진행
+
+        Returns:
+            bool: 진행했으면 True, 데이터가 더 필요하거나 끝났으면 False
+        """
+        char = self._peek()
+        if not char or self._state == "done":
+            return False
+
+        state = self._state
+        if state == "start":
+            self._expect("{")
+            self._state = "top_key"
+
+        elif state in ("top_key", "item_key"):
+            if char == ",":
+                self._pos += 1
+            elif char == "}":
+                self._pos += 1
+                if state == "top_key":
+                    self._state = "done"
+                else:
+                    self._state = "items" if self._in_list else "top_key"
+            else:
+                done, key = self._decode()
+                if not done:
+                    return False
+                self._key = key
+                self._state = "top_colon" if state == "top_key" else "item_colon"
+
+        elif state in ("top_colon", "item_colon"):
+            self._expect(":")
+            self._state = "top_value" if state == "top_colon" else "item_value"
+
+        elif state == "top_value":
+            # {"<엔드포인트>": [...]} 형태는 목록 항목을 하나씩 처리
+            if char == "[" and self._key != "RESULT":
+                self._pos += 1
+                self._state = "items"
+            elif char == "{" and self._key != "RESULT":
+                # {"<엔드포인트>": {"row": [...]}} 형태
+                self._pos += 1
+                self._state = "item_key"
+                self._in_list = False
+            else:
+                done, value = self._decode()
+                if not done:
+                    return False
+                events.append((self._key, value))
+                self._state = "top_key"
+
+        elif state == "items":
+            if char == ",":
+                self._pos += 1
+            elif char == "]":
+                self._pos += 1
+                self._state = "top_key"
+            else:
+                self._expect("{")
+                self._state = "item_key"
+                self._in_list = True
+
+        elif state == "item_value":
+            if char == "[" and self._key == "row":
+                self._pos += 1
+                self._state = "rows"
+            else:
+                done, value = self._decode()
+                if not done:
+                    return False
+                events.append((self._key, value))
+                self._state = "item_key"
+
+        elif state == "rows":
+            if char == ",":
+                self._pos += 1
+            elif char == "]":
+                self._pos += 1
+                self._state = "item_key"
+            else:
+                done, row = self._decode()
+                if not done:
+                    return False
+                events.append(("row", row))
+
+        return True
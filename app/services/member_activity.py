@@ -0,0 +1,199 @@
+"""
+국회의원 출석률/발언 횟수 수집 모듈
+
+대수 전체의 본회의 표결정보와 영상회의록(발언)을 페이지 단위로 읽으면서 의원별 건수만 집계하고
+(원본 행은 집계 후 바로 버림), 바뀐 의원의 출석률과 발언 횟수만 한 번에 저장합니다.
+- 출석률: 본회의 표결 중 불참하지 않은 비율 (%)
+- 발언 횟수: 영상회의록에 발언자로 기록된 횟수 (영상회의록은 회의일자(TAKING_DATE) 하루 단위로만 조회되므로 임기 첫날부터 하루씩 조회)
+"""
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.member import Member as MemberModel
+from app.services.assembly_api import async_assembly_api
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.services.scoring import mark_dirty
+from app.utils.helpers import parse_date
+
+logger = logging.getLogger(__name__)
+
+VOTE_ENDPOINT = "nzmimeepazxkubdpq"    # 국회의원 본회의 표결정보 API 엔드포인트
+SPEECH_ENDPOINT = "npeslxqbanwkimebr"  # 국회의원 영상회의록 API 엔드포인트
+
+# 표결정보의 표결 결과(RESULT_VOTE_MOD) 중 불참
+ABSENT_VOTE = "불참"
+
+def _member_key(code: Optional[str], name: Optional[str]) -> Optional[str]:
+    """집계 키 (국회의원코드가 있으면 코드, 없으면 '의원'을 뗀 이름)"""
+    if code:
+        return code.strip()
+    if name:
+        name = name.strip()
+        return name[:-2].strip() if name.endswith("의원") else name
+    return None
+
+class ActivityTally:
+    """
+    의원별 표결/발언 건수 집계
+
+    행을 받는 즉시 건수만 더하므로 메모리 사용량은 행 수가 아니라 의원 수에 비례합니다.
+    """
+    def __init__(self):
+        self.votes: Counter = Counter()     # 의원 -> 표결 대상 건수
+        self.present: Counter = Counter()   # 의원 -> 표결에 참여한 건수
+        self.speeches: Counter = Counter()  # 의원 -> 발언 건수
+        self.vote_rows = 0
+        self.speech_rows = 0
+
+    def add_vote(self, row: Dict[str, Any]) -> None:
+        """본회의 표결정보 행 하나를 집계"""
+        self.vote_rows += 1
+        key = _member_key(row.get("MONA_CD"), row.get("HG_NM"))
+        if key is None:
+            return
+        self.votes[key] += 1
+        if (row.get("RESULT_VOTE_MOD") or "").strip() != ABSENT_VOTE:
+            self.present[key] += 1
+
+    def add_speech(self, row: Dict[str, Any]) -> None:
+        """영상회의록 발언 행 하나를 집계"""
+        self.speech_rows += 1
+        key = _member_key(None, row.get("ESSENTIAL_PERSON"))
+        if key is not None:
+            self.speeches[key] += 1
+
+    def attendance_rate(self, key: str) -> Optional[float]:
+        """의원의 출석률 (%, 표결 기록이 없으면 None)"""
+        total = self.votes.get(key)
+        if not total:
+            return None
+        return round(self.present[key] / total * 100, 1)
+
+async def _consume(endpoint: str,
+                   params: Dict[str, Any],
+                   add: Callable[[Dict[str, Any]], None],
+                   budget: AdaptiveRateLimiter) -> None:
+    """엔드포인트의 모든 페이지를 한 행씩 읽어 집계 함수에 넘김 (페이지마다 호출 예산 사용, 응답 캐시는 거치지 않음)"""
+    async for row in async_assembly_api.iter_rows(
+        endpoint, params, page_size=settings.SYNC_ACTIVITY_PAGE_SIZE, budget=budget, use_cache=False
+    ):
+        add(row)
+
+def term_days(assembly_term: int, today: Optional[date] = None) -> List[date]:
+    """
+    대수 임기 중 오늘까지의 날짜 목록 (영상회의록 조회 대상 회의일자)
+
+    Args:
+        assembly_term: 국회 대수
+        today: 기준일 (선택, 기본값: 오늘)
+
+    Returns:
+        List[date]: 임기 시작일부터 임기 마지막 날과 기준일 중 이른 날까지
+    """
+    start = parse_date(settings.term_start_date(assembly_term))
+    end = min(today or date.today(), parse_date(settings.term_start_date(assembly_term + 1)) - timedelta(days=1))
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+async def _consume_speeches(assembly_term: int, tally: ActivityTally, budget: AdaptiveRateLimiter) -> None:
+    """
+    임기 중 하루씩 영상회의록을 조회하여 발언 건수 집계 (settings.SYNC_ACTIVITY_CONCURRENCY일씩 동시에)
+
+    Raises:
+        Exception: 하루라도 조회에 실패하면 (일부 날짜만 집계한 발언 횟수로 덮어쓰지 않도록)
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.SYNC_ACTIVITY_CONCURRENCY))
+
+    async def consume_day(day: date) -> None:
+        async with semaphore:
+            params = {"CT1": str(assembly_term), "TAKING_DATE": day.strftime("%Y%m%d")}
+            await _consume(SPEECH_ENDPOINT, params, tally.add_speech, budget)
+
+    days = term_days(assembly_term)
+    results = await asyncio.gather(*(consume_day(day) for day in days), return_exceptions=True)
+    failed = [day for day, result in zip(days, results) if isinstance(result, Exception)]
+    if failed:
+        raise Exception(f"영상회의록 조회 실패 {len(failed)}일 (첫 실패일 {failed[0]}): {results[days.index(failed[0])]}")
+
+async def sync_member_activity(db: Session, assembly_term: int = settings.ASSEMBLY_TERM) -> int:
+    """
+    대수 전체의 표결정보/영상회의록으로 국회의원 출석률과 발언 횟수 갱신
+
+    표결정보는 대수 전체를, 영상회의록은 임기 중 하루씩 모두 조회하면서 집계하고(호출 예산 settings.SYNC_ACTIVITY_RATE),
+    끝까지 읽은 항목만 저장합니다. (한쪽 조회가 하루라도 실패하면 그 항목은 기존 값을 유지,
+    값이 바뀐 의원은 활동 점수 재계산 대상으로 표시)
+
+    Args:
+        db: 데이터베이스 세션
+        assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+
+    Returns:
+        int: 출석률 또는 발언 횟수가 바뀐 의원 수
+    """
+    try:
+        logger.info("국회의원 출석률/발언 횟수 수집 시작...")
+        started = time.perf_counter()
+
+        tally = ActivityTally()
+        budget = AdaptiveRateLimiter.fixed(settings.SYNC_ACTIVITY_RATE)
+        vote_result, speech_result = await asyncio.gather(
+            _consume(VOTE_ENDPOINT, {"ASSEMBLY": assembly_term}, tally.add_vote, budget),
+            _consume_speeches(assembly_term, tally, budget),
+            return_exceptions=True
+        )
+        votes_ok = not isinstance(vote_result, Exception)
+        # 발언이 한 건도 없으면 응답 이상으로 보고 모든 의원을 0회로 덮어쓰지 않음
+        speeches_ok = not isinstance(speech_result, Exception) and tally.speech_rows > 0
+        if not votes_ok:
+            logger.warning(f"본회의 표결정보 조회 중 오류로 출석률은 갱신하지 않습니다: {vote_result}")
+        if not speeches_ok:
+            logger.warning(f"영상회의록 조회 결과가 없거나 오류가 발생하여 발언 횟수는 갱신하지 않습니다: {speech_result}")
+        fetched = time.perf_counter()
+
+        # 저장된 값과 비교하여 바뀐 의원만 모아 한 번에 UPDATE
+        members = db.query(
+            MemberModel.id, MemberModel.member_code, MemberModel.name,
+            MemberModel.attendance_rate, MemberModel.speech_count
+        ).filter(MemberModel.term == assembly_term).all()
+        updates = []
+        matched = set()
+        for member_id, member_code, name, attendance_rate, speech_count in members:
+            values = {}
+            if votes_ok:
+                # 표결정보는 국회의원코드로, 코드가 없는 행은 이름으로 집계되어 있음
+                key = member_code if member_code in tally.votes else _member_key(None, name)
+                rate = tally.attendance_rate(key)
+                if rate is not None:
+                    matched.add(key)
+                    if rate != attendance_rate:
+                        values["attendance_rate"] = rate
+            if speeches_ok:
+                # 임기 중 모든 날짜를 읽었으므로 기록이 없는 의원은 0회
+                count = tally.speeches.get(_member_key(None, name), 0)
+                if count != (speech_count or 0):
+                    values["speech_count"] = count
+            if values:
+                updates.append({"id": member_id, **values})
+
+        if updates:
+            db.execute(update(MemberModel), updates)
+            mark_dirty(db, [item["id"] for item in updates])
+        db.commit()
+
+        logger.info(
+            f"국회의원 출석률/발언 횟수 수집 완료 (조회 {fetched - started:.2f}초, 저장 {time.perf_counter() - fetched:.2f}초): "
+            f"표결 {tally.vote_rows}건 (의원 {len(tally.votes)}명, 매칭 {len(matched)}명), "
+            f"발언 {tally.speech_rows}건 (의원 {len(tally.speeches)}명), 변경 {len(updates)}명"
+        )
+        return len(updates)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"국회의원 출석률/발언 횟수 수집 중 오류 발생: {e}")
+        return 0
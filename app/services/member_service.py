@@ -3,243 +3,323 @@
 
 이 모듈은 국회의원 정보를 외부 API에서 조회하여 데이터베이스에 저장하고 관리하는 기능을 제공합니다.
 """
+import asyncio
 import logging
 import time
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.member import Member as MemberModel
 from app.models.bill import Bill as BillModel
-from app.services.assembly_api import assembly_api
-from app.utils.helpers import parse_date, calculate_activity_score
+from app.services.assembly_api import assembly_api, async_assembly_api
+from app.services.bill_service import bill_row_from_allbill, upsert_bill_rows
+from app.services.rate_limiter import AdaptiveRateLimiter
+from app.db.upsert import bulk_upsert
+from app.services.sync_index import SyncIndex, upstream_row_hash
+from app.services.scoring import mark_dirty, rescore_members
+from app.utils.helpers import parse_date
 
 logger = logging.getLogger(__name__)
 
-def sync_members_from_api(db: Session, assembly_term: int = 22) -> int:
+# 이미 저장된 의원과 국회의원코드가 겹칠 때 갱신할 컬럼 (인적사항, 대수, 원본 행 해시 - 발의안 수/점수 등 통계는 유지)
+MEMBER_UPSERT_UPDATE_COLUMNS = [
+    "name", "hanja_name", "eng_name", "birth_date", "birth_gbn", "party", "district", "position",
+    "committee", "committees", "reele_gbn", "units", "tel_no", "email", "homepage",
+    "term", "row_hash", "last_updated",
+]
+
+def _member_row(member_data: Dict[str, Any], assembly_term: int, row_hash: str) -> Dict[str, Any]:
+    """
+    API 국회의원 행을 members 테이블 저장용 딕셔너리로 변환
+
+    Args:
+        member_data: 국회의원 인적사항 API 응답 행
+        assembly_term: 국회 대수
+        row_hash: 원본 행 해시
+
+    Returns:
+        Dict[str, Any]: members 테이블 컬럼 딕셔너리 (통계 컬럼은 새로 추가할 때만 쓰는 기본값)
+    """
+    return {
+        "member_code": member_data.get("MONA_CD"),  # 국회의원코드
+        "name": member_data.get("HG_NM", ""),  # 이름
+        "hanja_name": member_data.get("HJ_NM", ""),  # 한자명
+        "eng_name": member_data.get("ENG_NM", ""),  # 영문명
+        "birth_date": parse_date(member_data.get("BTH_DATE")) if member_data.get("BTH_DATE") else None,  # 생년월일
+        "birth_gbn": member_data.get("BTH_GBN_NM", ""),  # 음/양력
+        "party": member_data.get("POLY_NM", ""),  # 정당명
+        "district": member_data.get("ORIG_NM", ""),  # 선거구
+        "position": member_data.get("JOB_RES_NM", ""),  # 직책명
+        "committee": member_data.get("CMIT_NM", ""),  # 대표 위원회
+        "committees": member_data.get("CMITS", ""),  # 소속 위원회 목록
+        "reele_gbn": member_data.get("REELE_GBN_NM", ""),  # 재선 구분
+        "units": member_data.get("UNITS", ""),  # 당선 수
+        "tel_no": member_data.get("TEL_NO", ""),  # 전화번호
+        "email": member_data.get("E_MAIL", ""),  # 이메일
+        "homepage": member_data.get("HOMEPAGE", ""),  # 홈페이지
+
+        # 기본값 (이미 있는 의원은 갱신하지 않음)
+        "num_bills": 0,
+        "attendance_rate": 0.0,
+        "speech_count": 0,
+        "activity_score": 0.0,
+        "is_active": True,
+
+        "term": assembly_term,
+        "row_hash": row_hash,
+        "last_updated": datetime.now().date(),
+    }
+
+def sync_members_from_api(db: Session, assembly_term: int = settings.ASSEMBLY_TERM, index: Optional[SyncIndex] = None) -> Dict[str, int]:
     """
     국회의원 정보를 API에서 조회하여 데이터베이스에 저장
 
+    국회의원코드(MONA_CD)를 키로 변경된 의원만 골라 한 번의 upsert 문으로 저장합니다.
+    (원본 행 해시가 같으면 건너뛰므로 정기 실행마다 호출해도 쓰기가 거의 없음)
+
     Args:
         db: 데이터베이스 세션
-        assembly_term: 국회 대수 (기본값: 22)
+        assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+        index: 동기화용 조회 인덱스 (선택, 새 의원이 추가되면 함께 갱신)
 
     Returns:
-        int: 추가/업데이트된 국회의원 수
+        Dict[str, int]: 추가(inserted)/업데이트(updated)/변경 없음(unchanged) 의원 수와 전체(total) 처리 수
     """
+    result = {"inserted": 0, "updated": 0, "unchanged": 0, "total": 0}
     try:
         logger.info(f"{assembly_term}대 국회의원 정보 동기화 시작...")
+        started = time.perf_counter()
         
         # API에서 국회의원 목록 조회
-        members_data = assembly_api.get_members(assembly_term=assembly_term)
+        members_data = assembly_api.get_members(assembly_term=assembly_term, use_cache=False)
         
         if not members_data:
             logger.warning("API에서 국회의원 정보를 가져오지 못했습니다.")
-            return 0
-            
-        # API 데이터 추가
-        member_count = 0
+            return result
+        
+        # 국회의원코드 -> (ID, 대수, 원본 행 해시)를 한 번의 쿼리로 읽어 둠
+        existing = {
+            code: (member_id, term, row_hash)
+            for member_id, code, term, row_hash in db.query(
+                MemberModel.id, MemberModel.member_code, MemberModel.term, MemberModel.row_hash
+            ).filter(MemberModel.member_code.isnot(None))
+        }
+        # 국회의원코드가 생기기 전에 이름으로 저장된 의원은 이름이 같으면 코드를 채워 같은 의원으로 이어감
+        codeless = {}
+        for member_id, name, term in db.query(MemberModel.id, MemberModel.name, MemberModel.term)\
+                .filter(MemberModel.member_code.is_(None)).order_by(MemberModel.id):
+            codeless.setdefault(name, (member_id, term))
+        
+        rows = []
+        adopted = []
+        seen_codes = set()
         for member_data in members_data:
-            try:
-                # 생년월일 변환
-                birth_date = None
-                if member_data.get("BTH_DATE"):
-                    birth_date = parse_date(member_data.get("BTH_DATE"))
-                
-                # 이미 존재하는 의원인지 확인
-                existing_member = db.query(MemberModel).filter(
-                    MemberModel.name == member_data.get("HG_NM", "")
-                ).first()
-                
-                if existing_member:
-                    # 기존 의원 정보 업데이트
-                    existing_member.party = member_data.get("POLY_NM", existing_member.party)
-                    existing_member.district = member_data.get("ORIG_NM", existing_member.district)
-                    existing_member.position = member_data.get("JOB_RES_NM", existing_member.position)
-                    existing_member.committee = member_data.get("CMIT_NM", existing_member.committee)
-                    existing_member.committees = member_data.get("CMITS", existing_member.committees)
-                    existing_member.tel_no = member_data.get("TEL_NO", existing_member.tel_no)
-                    existing_member.email = member_data.get("E_MAIL", existing_member.email)
-                    existing_member.homepage = member_data.get("HOMEPAGE", existing_member.homepage)
-                    existing_member.last_updated = datetime.now().date()
-                    
-                    logger.debug(f"국회의원 {existing_member.name} 정보 업데이트")
-                else:
-                    # 새 국회의원 데이터 생성
-                    new_member = MemberModel(
-                        name=member_data.get("HG_NM", ""),  # 이름
-                        hanja_name=member_data.get("HJ_NM", ""),  # 한자명
-                        eng_name=member_data.get("ENG_NM", ""),  # 영문명
-                        birth_date=birth_date,  # 생년월일
-                        birth_gbn=member_data.get("BTH_GBN_NM", ""),  # 음/양력
-                        party=member_data.get("POLY_NM", ""),  # 정당명
-                        district=member_data.get("ORIG_NM", ""),  # 선거구
-                        position=member_data.get("JOB_RES_NM", ""),  # 직책명
-                        
-                        # 추가 필드
-                        committee=member_data.get("CMIT_NM", ""),  # 대표 위원회
-                        committees=member_data.get("CMITS", ""),  # 소속 위원회 목록
-                        reele_gbn=member_data.get("REELE_GBN_NM", ""),  # 재선 구분
-                        units=member_data.get("UNITS", ""),  # 당선 수
-                        
-                        # 연락처 정보
-                        tel_no=member_data.get("TEL_NO", ""),  # 전화번호
-                        email=member_data.get("E_MAIL", ""),  # 이메일
-                        homepage=member_data.get("HOMEPAGE", ""),  # 홈페이지
-                        
-                        # 기본값
-                        num_bills=0,
-                        attendance_rate=0.0,
-                        speech_count=0,
-                        activity_score=0.0,
-                        is_active=True,
-                        last_updated=datetime.now().date()
-                    )
-                    db.add(new_member)
-                    logger.debug(f"새 국회의원 {new_member.name} 추가")
-                
-                member_count += 1
-            except Exception as e:
-                logger.error(f"국회의원 데이터 처리 중 오류: {e}")
+            code = member_data.get("MONA_CD")
+            if not code or code in seen_codes:
+                logger.warning(f"국회의원코드가 없거나 중복된 행은 건너뜁니다: {member_data.get('HG_NM')} ({code})")
+                continue
+            seen_codes.add(code)
+            
+            row_hash = upstream_row_hash(member_data)
+            if code not in existing and member_data.get("HG_NM") in codeless:
+                member_id, term = codeless.pop(member_data.get("HG_NM"))
+                adopted.append({"id": member_id, "member_code": code})
+                existing[code] = (member_id, term, None)
+            
+            if code in existing:
+                _, term, stored_hash = existing[code]
+                if stored_hash == row_hash:
+                    result["unchanged"] += 1
+                    continue
+                result["updated"] += 1
+            else:
+                term = None
+                result["inserted"] += 1
+            
+            # 여러 대수에 걸친 의원은 가장 최근 대수로 기록
+            rows.append(_member_row(member_data, max(term or 0, assembly_term), row_hash))
         
-        # 커밋
+        if adopted:
+            db.execute(update(MemberModel), adopted)
+        bulk_upsert(db, MemberModel, rows, index_elements=["member_code"], update_columns=MEMBER_UPSERT_UPDATE_COLUMNS)
+        inserted_members = []
+        if result["inserted"]:
+            inserted_codes = [row["member_code"] for row in rows if row["member_code"] not in existing]
+            inserted_members = db.query(MemberModel.id, MemberModel.name).filter(MemberModel.member_code.in_(inserted_codes)).all()
+            # 새 의원은 아직 점수가 없으므로 재계산 대상으로 표시 (인적사항 변경은 점수에 영향을 주지 않음)
+            mark_dirty(db, [member_id for member_id, _ in inserted_members])
         db.commit()
-        logger.info(f"총 {member_count}명의 국회의원 정보를 처리했습니다.")
+        result["total"] = result["inserted"] + result["updated"] + result["unchanged"]
+        
+        # 새로 추가된 의원을 인덱스에 반영
+        if index is not None:
+            for member_id, name in inserted_members:
+                index.add_member(name, member_id)
+        
+        logger.info(
+            f"국회의원 정보 동기화 완료 ({time.perf_counter() - started:.3f}초): "
+            f"{result['inserted']}명 추가, {result['updated']}명 업데이트, {result['unchanged']}명 변경 없음"
+            + (f" (이름으로 연결한 기존 의원 {len(adopted)}명)" if adopted else "")
+        )
         
-        # 활동 점수 업데이트
-        update_activity_scores(db)
+        # 새 의원의 활동 점수 계산
+        if result["inserted"]:
+            update_activity_scores(db)
         
-        return member_count
+        return result
     except Exception as e:
         db.rollback()
         logger.error(f"국회의원 정보 동기화 중 오류: {e}")
-        return 0
+        return {"inserted": 0, "updated": 0, "unchanged": 0, "total": 0}
+
+def _rep_proposer_name(row: Dict[str, Any]) -> Optional[str]:
+    """ALLBILL 행의 제안자(PPSR_NM, 예: "홍길동의원 등 10인")에서 대표발의 의원 이름 추출 (의원 발의가 아니면 None)"""
+    proposer = (row.get("PPSR_NM") or "").strip()
+    if "의원" not in proposer:
+        return None
+    return proposer.split("의원")[0].strip()
 
-async def sync_member_bills(db: Session) -> int:
+async def sync_member_bills(db: Session, assembly_term: int = settings.ASSEMBLY_TERM) -> int:
     """
     국회의원별 발의안 정보를 API에서 가져와 DB에 저장
 
+    의원별 대표발의 의안 목록을 호출 예산(settings.SYNC_MEMBER_BILLS_RATE) 안에서 동시에 조회하고,
+    저장된 의안과 비교하여 새 의안 추가/원본이 바뀐 의안 갱신/발의자 연결/의원별 발의안 수 변경만 모아 한 번에 저장합니다.
+    (대표발의자 조건이 이름뿐이라 같은 대수에 동명이인이 있으면 그 의원들은 건너뜀)
+
     Args:
         db: 데이터베이스 세션
+        assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
 
     Returns:
-        int: 처리된 발의안 수
+        int: 추가/갱신/발의자 연결된 발의안 수
     """
     try:
         logger.info("국회의원 발의안 정보 동기화 시작...")
+        started = time.perf_counter()
         
-        # 현재 데이터베이스의 모든 국회의원 조회
-        members = db.query(MemberModel).all()
+        members = db.query(MemberModel.id, MemberModel.name, MemberModel.num_bills)\
+            .filter(MemberModel.term == assembly_term).all()
         
-        # 총 처리된 발의안 수 카운터
-        total_bills = 0
+        # 대표발의자 조건(PPSR_NM)은 이름뿐이므로 동명이인 의원은 발의안을 구분할 수 없어 건너뜀
+        name_counts = Counter(name for _, name, _ in members)
+        ambiguous = sorted(name for name, count in name_counts.items() if count > 1)
+        if ambiguous:
+            logger.warning(f"동명이인 의원은 발의안 동기화에서 제외합니다: {', '.join(ambiguous)}")
+            members = [member for member in members if name_counts[member[1]] == 1]
         
-        for member in members:
-            logger.info(f"{member.name} 의원의 발의안 정보 조회 중...")
-            
-            # 기존 발의안 삭제 (재동기화)
-            db.query(BillModel).filter(BillModel.proposer_id == member.id).delete()
-            
-            # API에서 해당 의원이 발의한 법안 조회
-            try:
-                # API 호출 방식 수정 - PPSR_NM 파라미터 사용
-                bills_data = []
-                
-                # 모든 국회의원에게 발의안이 없을 수 있으므로 에러 발생 시에도 진행
+        budget_limiter = AdaptiveRateLimiter.fixed(settings.SYNC_MEMBER_BILLS_RATE)
+        semaphore = asyncio.Semaphore(max(1, settings.SYNC_MEMBER_BILLS_CONCURRENCY))
+        params_base = {"AGE": assembly_term, "PROPOSE_FROM": settings.term_start_date(assembly_term)}
+        
+        async def fetch(name: str) -> Optional[List[Dict]]:
+            """
+            의원 한 명의 대표발의 의안 전체 조회 (페이지마다 호출 예산 사용, 실패하면 None - 해당 의원은 이번 실행에서 건너뜀)
+
+            제안자(PPSR_NM)에서 뽑은 대표발의 의원 이름이 정확히 같은 행만 남김 (정부/위원장 제안이나 다른 의원 의안은 제외)
+            """
+            async with semaphore:
                 try:
-                    # 22대 국회 시작일부터 현재까지 기간 설정
-                    start_date = "20240530"  # 22대 국회 시작일
-                    end_date = datetime.now().strftime("%Y%m%d")
-                    
-                    # API 호출 - 의원 이름으로 검색
-                    bills_data = assembly_api.get_bills(
-                        bill_name="",  # 빈 값으로 설정
-                        proposer=member.name,  # 제안자 이름
-                        start_date=start_date,
-                        end_date=end_date
-                    )
-                except Exception as api_error:
-                    logger.warning(f"{member.name} 의원의 발의안 조회 중 API 오류: {api_error}")
-                    bills_data = []  # 오류 발생 시 빈 리스트로 설정
-                
-                # 발의안 수 업데이트
-                member.num_bills = len(bills_data)
-                
-                # 각 발의안 데이터 처리
-                for bill_data in bills_data[:10]:  # 최근 10개만 저장
-                    try:
-                        # 날짜 포맷 변환
-                        proposal_date = None
-                        if bill_data.get("PPSL_DT"):
-                            try:
-                                proposal_date = datetime.strptime(
-                                    bill_data.get("PPSL_DT"), "%Y-%m-%d"
-                                ).date()
-                            except ValueError:
-                                proposal_date = datetime.now().date()
-                        
-                        # 발의안 저장
-                        new_bill = BillModel(
-                            bill_id=bill_data.get("BILL_ID", ""),
-                            bill_no=bill_data.get("BILL_NO", ""),
-                            title=bill_data.get("BILL_NM", "제목 없음"),
-                            proposer=member.name,
-                            status=bill_data.get("PROC_RESULT", "계류"),
-                            committee=bill_data.get("COMMITTEE", "정보 없음"),
-                            proposal_date=proposal_date or datetime.now().date(),
-                            content=bill_data.get("DETAIL_CONTENT", "내용 없음"),
-                            co_proposers=bill_data.get("PUBL_PROPOSER", ""),
-                            proposer_id=member.id
+                    params = {**params_base, "PPSR_NM": name}
+                    return [
+                        row async for row in async_assembly_api.iter_rows(
+                            "ALLBILL", params, page_size=settings.SYNC_DELTA_PAGE_SIZE, budget=budget_limiter, use_cache=False
                         )
-                        db.add(new_bill)
-                        total_bills += 1
-                    except Exception as e:
-                        logger.error(f"발의안 데이터 처리 중 오류: {e}")
-                
-            except Exception as e:
-                logger.error(f"{member.name} 의원의 발의안 조회 중 오류: {e}")
-                # 오류 발생 시에도 계속 진행
+                        if _rep_proposer_name(row) == name
+                    ]
+                except Exception as api_error:
+                    logger.warning(f"{name} 의원의 발의안 조회 중 API 오류: {api_error}")
+                    return None
+        
+        results = await asyncio.gather(*(fetch(name) for _, name, _ in members))
+        fetched = time.perf_counter()
+        
+        # 저장된 의안을 한 번에 읽어 두고 비교
+        stored = {
+            bill_id: (id_, row_hash, proposer_id)
+            for id_, bill_id, row_hash, proposer_id in db.query(
+                BillModel.id, BillModel.bill_id, BillModel.row_hash, BillModel.proposer_id
+            )
+        }
+        now = datetime.now()
+        upsert_rows = []
+        links = []
+        num_bills_updates = []
+        inserted = updated = unchanged = failed = 0
+        seen = set()
+        for (member_id, name, num_bills), bills_data in zip(members, results):
+            if bills_data is None:
+                failed += 1
                 continue
             
-            # API 호출 간 지연
-            time.sleep(0.5)
+            if num_bills != len(bills_data):
+                num_bills_updates.append({"id": member_id, "num_bills": len(bills_data)})
+            
+            for bill_data in bills_data:
+                bill_id = bill_data.get("BILL_ID")
+                if not bill_id or bill_id in seen:
+                    continue
+                seen.add(bill_id)
+                
+                row, row_hash = bill_row_from_allbill(bill_data, name, assembly_term, now)
+                if bill_id not in stored:
+                    row["proposer_id"] = member_id
+                    upsert_rows.append(row)
+                    inserted += 1
+                    continue
+                
+                id_, stored_hash, proposer_id = stored[bill_id]
+                if stored_hash != row_hash:
+                    upsert_rows.append(row)
+                    updated += 1
+                else:
+                    unchanged += 1
+                if proposer_id != member_id:
+                    links.append({"id": id_, "proposer_id": member_id})
         
-        # 모든 국회의원 처리 후 커밋
+        # 모든 변경을 한 트랜잭션으로 저장
+        # (의안은 의안 동기화와 같은 규칙으로 저장, 발의자 연결/발의안 수는 기본키 기준 일괄 UPDATE)
+        upsert_bill_rows(db, upsert_rows)
+        if links:
+            db.execute(update(BillModel), links)
+        if num_bills_updates:
+            db.execute(update(MemberModel), num_bills_updates)
+            mark_dirty(db, [item["id"] for item in num_bills_updates])
         db.commit()
-        logger.info(f"국회의원 발의안 정보 동기화 완료. 총 {total_bills}개 발의안 처리됨.")
         
-        return total_bills
+        logger.info(
+            f"국회의원 발의안 정보 동기화 완료 (조회 {fetched - started:.2f}초, 저장 {time.perf_counter() - fetched:.2f}초): "
+            f"의원 {len(members) - failed}명 (실패 {failed}명), 신규 {inserted}건, 갱신 {updated}건, 변경 없음 {unchanged}건, "
+            f"발의자 연결 {len(links)}건, 발의안 수 변경 {len(num_bills_updates)}명"
+        )
+        return inserted + updated + len(links)
     except Exception as e:
         db.rollback()
         logger.error(f"발의안 정보 동기화 중 오류 발생: {e}")
         return 0
 
-def update_activity_scores(db: Session) -> int:
+def update_activity_scores(db: Session, full: bool = False) -> int:
     """
-    모든 국회의원의 활동 점수를 계산하여 업데이트
+    국회의원 활동 점수를 계산하여 업데이트 (app.services.scoring으로 한 번에 계산)
+
+    지표가 바뀌어 재계산 대상으로 표시된 의원만 계산하며, 정규화 상한이 바뀌었으면 전체를 계산합니다.
 
     Args:
         db: 데이터베이스 세션
+        full: 표시 여부와 관계없이 전체 의원을 계산할지 여부
 
     Returns:
-        int: 업데이트된 국회의원 수
+        int: 점수를 계산한 국회의원 수
     """
     try:
-        members = db.query(MemberModel).all()
-        count = 0
-        
-        for member in members:
-            try:
-                # 활동 점수 계산 및 업데이트
-                member.activity_score = calculate_activity_score(member)
-                count += 1
-            except Exception as e:
-                logger.error(f"{member.name} 의원의 활동 점수 계산 중 오류: {e}")
-        
-        db.commit()
-        logger.info(f"총 {count}명의 국회의원 활동 점수를 업데이트했습니다.")
-        return count
+        result = rescore_members(db, full=full)
+        logger.info(f"총 {result['scored']}명의 국회의원 활동 점수를 업데이트했습니다. (변경 {result['changed']}명)")
+        return result["scored"]
     except Exception as e:
         db.rollback()
         logger.error(f"활동 점수 업데이트 중 오류: {e}")
-        return 0
\ No newline at end of file
+        return 0
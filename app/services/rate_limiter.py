@@ -0,0 +1,165 @@
+"""
+국회정보 Open API 호출 속도 제한 모듈
+
+토큰 버킷 방식으로 초당 요청 수를 제한하고,
+API가 과부하 신호(HTTP 429/5xx, 트래픽 초과 오류 코드, 타임아웃)를 보내면 속도를 줄이고
+연속으로 성공하면 다시 속도를 높입니다(AIMD).
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveRateLimiter:
+    """
+    성공/실패에 따라 허용 속도를 조절하는 토큰 버킷 속도 제한기
+
+    동기 클라이언트(스레드)와 비동기 클라이언트(이벤트 루프)가 하나의 인스턴스를 공유할 수 있습니다.
+    """
+    def __init__(self,
+                 rate: float,
+                 burst: float,
+                 min_rate: float,
+                 max_rate: float,
+                 increase_step: float,
+                 decrease_factor: float,
+                 success_threshold: int):
+        """
+        AdaptiveRateLimiter 클래스 초기화
+
+        Args:
+            rate: 시작 허용 속도 (초당 요청 수)
+            burst: 버킷 크기 (순간적으로 허용하는 최대 요청 수)
+            min_rate: 최저 허용 속도
+            max_rate: 최고 허용 속도
+            increase_step: 연속 성공 시 증가시킬 속도 (초당 요청 수)
+            decrease_factor: 과부하 신호 시 곱할 감속 비율 (0~1)
+            success_threshold: 속도를 높이기 위해 필요한 연속 성공 횟수
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.success_threshold = success_threshold
+
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._success_streak = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+        self.throttle_count = 0
+
+    @classmethod
+    def fixed(cls, rate: float) -> "AdaptiveRateLimiter":
+        """
+        속도가 바뀌지 않는 제한기 생성 (작업별 호출 예산용, 공용 제한기와 함께 사용)
+
+        Args:
+            rate: 허용 속도 (초당 요청 수)
+
+        Returns:
+            AdaptiveRateLimiter: 버킷 크기 1, 최저/최고 속도가 같은 제한기
+        """
+        return cls(rate=rate, burst=1, min_rate=rate, max_rate=rate,
+                   increase_step=0, decrease_factor=1, success_threshold=1)
+
+    def _reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 대기해야 할 시간 계산
+
+        토큰이 부족하면 잔량을 음수로 만들어 먼저 예약한 호출자부터 순서대로 대기하게 합니다.
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            self.total_acquired += 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.total_wait_seconds += wait
+            return wait
+
+    def acquire(self) -> None:
+        """요청 전 토큰 획득 (필요하면 현재 스레드를 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """요청 전 토큰 획득 (필요하면 이벤트 루프를 막지 않고 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_success(self) -> None:
+        """정상 응답 기록 - 연속 성공이 쌓이면 허용 속도 증가"""
+        with self._lock:
+            self._success_streak += 1
+            if self._success_streak >= self.success_threshold and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+                self._success_streak = 0
+                logger.debug(f"API 호출 속도 증가: 초당 {self.rate:.2f}건")
+
+    def record_throttle(self) -> None:
+        """과부하 신호 기록 - 허용 속도를 줄이고 남은 토큰을 비움"""
+        with self._lock:
+            self._success_streak = 0
+            self.throttle_count += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            logger.info(f"API 과부하 신호 감지 - 호출 속도 감소: 초당 {self.rate:.2f}건")
+
+    def scale(self, share: float) -> None:
+        """
+        허용 속도 한도를 비율만큼 줄임 (여러 프로세스가 전체 호출 한도를 나눠 쓸 때 각 프로세스에서 호출)
+
+        Args:
+            share: 이 프로세스가 사용할 비율 (0~1, 예: 프로세스 3개면 1/3)
+        """
+        with self._lock:
+            self.rate *= share
+            self.min_rate *= share
+            self.max_rate *= share
+            self.increase_step *= share
+            self.burst = max(1.0, self.burst * share)
+            self._tokens = min(self._tokens, self.burst)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        속도 제한기 통계 조회
+
+        Returns:
+            Dict[str, Any]: 현재 허용 속도, 누적 대기 시간, 과부하 신호 횟수 등
+        """
+        return {
+            "rate_per_sec": round(self.rate, 3),
+            "min_rate_per_sec": self.min_rate,
+            "max_rate_per_sec": self.max_rate,
+            "acquired": self.total_acquired,
+            "total_wait_sec": round(self.total_wait_seconds, 3),
+            "throttle_count": self.throttle_count,
+        }
+
+# 두 API 클라이언트(동기/비동기)가 함께 사용하는 속도 제한기 인스턴스
+rate_limiter = AdaptiveRateLimiter(
+    rate=settings.ASSEMBLY_API_RATE_LIMIT,
+    burst=settings.ASSEMBLY_API_RATE_BURST,
+    min_rate=settings.ASSEMBLY_API_RATE_MIN,
+    max_rate=settings.ASSEMBLY_API_RATE_MAX,
+    increase_step=settings.ASSEMBLY_API_RATE_INCREASE_STEP,
+    decrease_factor=settings.ASSEMBLY_API_RATE_DECREASE_FACTOR,
+    success_threshold=settings.ASSEMBLY_API_RATE_SUCCESS_THRESHOLD
+)
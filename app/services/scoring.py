@@ -0,0 +1,298 @@
+"""
+국회의원 활동 점수 계산 모듈
+
+의원별 지표(발의안 수, 출석률, 발언 횟수, 법안 통과율)를 한 번의 쿼리로 배열에 읽어
+전체 의원의 점수를 numpy로 한 번에 계산하고, 바뀐 점수만 한 번의 UPDATE로 저장합니다.
+동기화 경로는 지표를 바꾼 의원을 mark_dirty로 표시하고, 점수 계산은 표시된 의원만 다시 계산합니다.
+(정규화 상한이나 점수 설정이 바뀌면 모든 의원의 점수가 달라지므로 전체를 다시 계산,
+ 마지막으로 적용한 설정/상한은 sync_watermarks에 저장하여 프로세스 재시작이나 여러 프로세스 사이에서도 공유)
+- 가중치: settings.SCORE_WEIGHTS
+- 건수 항목 정규화: settings.SCORE_NORMALIZATION (fixed / max / percentile / rank)
+- 비율 항목(출석률, 법안 통과율)은 이미 0~100 범위이므로 그대로 사용
+"""
+import json
+import logging
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.member import Member as MemberModel
+from app.services.sync_runs import get_watermark_state, set_watermark_state
+
+logger = logging.getLogger(__name__)
+
+# 점수 항목 -> members 컬럼
+METRIC_COLUMNS = {
+    "bills": "num_bills",
+    "attendance": "attendance_rate",
+    "speech": "speech_count",
+    "pass_rate": "bill_pass_rate",
+}
+
+# 0~100 범위로 정규화해야 하는 건수 항목
+COUNT_METRICS = ("bills", "speech")
+
+NORMALIZATION_MODES = ("fixed", "max", "percentile", "rank")
+
+# 마지막으로 점수를 맞춰 둔 점수 설정과 정규화 상한을 저장하는 워터마크 (다르면 전체 재계산)
+SCORE_WATERMARK_JOB = "scores"
+SCORE_WATERMARK_NAME = "fingerprint"
+
+# 상세 페이지 지표용 정규화 결과 캐시: 대수 -> (적용된 점수 fingerprint, 계산 시각, 의원 ID 배열, 항목별 정규화 배열, 항목별 평균)
+_profile_cache: Dict[int, Tuple[Optional[str], float, np.ndarray, Dict[str, np.ndarray], Dict[str, float]]] = {}
+
+def mark_dirty(db: Session, member_ids: Iterable[int]) -> int:
+    """
+    점수 지표가 바뀐 의원을 재계산 대상으로 표시 (지표를 바꾸는 쓰기와 같은 트랜잭션에서 호출, 커밋은 호출자가 수행)
+
+    Args:
+        db: 데이터베이스 세션
+        member_ids: 의원 ID 목록
+
+    Returns:
+        int: 표시한 의원 수
+    """
+    member_ids = list(set(member_ids))
+    if not member_ids:
+        return 0
+    stmt = update(MemberModel)\
+        .where(MemberModel.id.in_(member_ids))\
+        .values(score_dirty=True)\
+        .execution_options(synchronize_session=False)
+    return db.execute(stmt).rowcount
+
+def load_metrics(db: Session,
+                 assembly_term: int = settings.ASSEMBLY_TERM) -> Tuple[np.ndarray, Dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """
+    대수 의원 전체의 점수 지표를 배열로 읽기 (다른 대수 의원은 정규화 상한/평균에 섞이지 않도록 제외)
+
+    Args:
+        db: 데이터베이스 세션
+        assembly_term: 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+
+    Returns:
+        Tuple: (의원 ID 배열, 항목별 지표 배열 - NULL은 0, 저장된 활동 점수 배열, 재계산 대상 여부 배열)
+    """
+    columns = [getattr(MemberModel, column) for column in METRIC_COLUMNS.values()]
+    rows = db.query(MemberModel.id, MemberModel.activity_score, MemberModel.score_dirty, *columns)\
+        .filter(MemberModel.term == assembly_term)\
+        .order_by(MemberModel.id).all()
+    data = np.array(
+        [[value if value is not None else 0 for value in row] for row in rows],
+        dtype=float
+    ).reshape(len(rows), len(METRIC_COLUMNS) + 3)
+    ids = data[:, 0].astype(np.int64)
+    metrics = {name: data[:, 3 + i] for i, name in enumerate(METRIC_COLUMNS)}
+    return ids, metrics, data[:, 1], data[:, 2] > 0
+
+def normalization_bounds(metrics: Dict[str, np.ndarray],
+                         mode: Optional[str] = None,
+                         percentile: Optional[float] = None) -> Dict[str, float]:
+    """
+    건수 항목별 정규화 상한 계산 (이 값이 100점에 해당)
+
+    Args:
+        metrics: 항목별 지표 배열
+        mode: 정규화 방식 (선택, 기본값: settings.SCORE_NORMALIZATION, rank는 상한을 쓰지 않으므로 빈 딕셔너리)
+        percentile: percentile 방식의 백분위 (선택, 기본값: settings.SCORE_PERCENTILE)
+
+    Returns:
+        Dict[str, float]: 항목 -> 상한
+    """
+    mode = mode or settings.SCORE_NORMALIZATION
+    if mode not in NORMALIZATION_MODES:
+        raise ValueError(f"알 수 없는 정규화 방식: {mode} (사용 가능: {', '.join(NORMALIZATION_MODES)})")
+
+    bounds = {}
+    for name in COUNT_METRICS:
+        values = metrics[name]
+        if mode == "fixed":
+            bounds[name] = float(settings.SCORE_FIXED_CAPS.get(name, 0) or 0)
+        elif mode == "max":
+            bounds[name] = float(values.max()) if values.size else 0.0
+        elif mode == "percentile":
+            bounds[name] = float(np.percentile(values, percentile or settings.SCORE_PERCENTILE)) if values.size else 0.0
+    return bounds
+
+def _percentile_rank(values: np.ndarray) -> np.ndarray:
+    """백분위 순위 (0~100, 같은 값은 같은 순위)"""
+    if values.size <= 1:
+        return np.where(values > 0, 100.0, 0.0)
+    sorted_values = np.sort(values)
+    below = np.searchsorted(sorted_values, values, side="left")
+    return below / (values.size - 1) * 100
+
+def normalize_metrics(metrics: Dict[str, np.ndarray],
+                      bounds: Dict[str, float],
+                      mode: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    항목별 지표를 0~100 범위로 변환
+
+    Args:
+        metrics: 항목별 지표 배열
+        bounds: 건수 항목별 정규화 상한 (normalization_bounds)
+        mode: 정규화 방식 (선택, 기본값: settings.SCORE_NORMALIZATION)
+
+    Returns:
+        Dict[str, np.ndarray]: 항목 -> 0~100 사이 값 배열
+    """
+    mode = mode or settings.SCORE_NORMALIZATION
+    normalized = {}
+    for name, values in metrics.items():
+        if name in COUNT_METRICS:
+            if mode == "rank":
+                values = _percentile_rank(values)
+            else:
+                cap = bounds.get(name) or 0
+                values = values / cap * 100 if cap > 0 else np.zeros(len(values))
+        normalized[name] = np.clip(values, 0, 100)
+    return normalized
+
+def compute_scores(metrics: Dict[str, np.ndarray],
+                   bounds: Dict[str, float],
+                   weights: Optional[Dict[str, float]] = None,
+                   mode: Optional[str] = None) -> np.ndarray:
+    """
+    전체 의원의 활동 점수를 한 번에 계산
+
+    Args:
+        metrics: 항목별 지표 배열
+        bounds: 건수 항목별 정규화 상한 (normalization_bounds)
+        weights: 항목별 가중치 (선택, 기본값: settings.SCORE_WEIGHTS)
+        mode: 정규화 방식 (선택, 기본값: settings.SCORE_NORMALIZATION)
+
+    Returns:
+        np.ndarray: 0~100 사이 활동 점수 (소수점 첫째 자리 반올림)
+    """
+    weights = weights or settings.SCORE_WEIGHTS
+    normalized = normalize_metrics(metrics, bounds, mode)
+    size = len(next(iter(metrics.values()))) if metrics else 0
+    total = np.zeros(size)
+    for name, weight in weights.items():
+        if weight and name in normalized:
+            total += normalized[name] * weight
+    return np.round(total, 1)
+
+def _normalized_profiles(db: Session, assembly_term: int) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, float]]:
+    """
+    대수 의원 전체의 항목별 정규화 지표와 평균 (캐시 사용)
+
+    DB에 기록된 점수 fingerprint가 같고 settings.SCORE_PROFILE_CACHE_SECONDS가 지나지 않았으면
+    테이블 전체를 다시 읽지 않고 이전 결과를 씁니다. (그 사이 바뀐 지표는 유효 시간이 지나면 반영)
+
+    Returns:
+        Tuple: (의원 ID 배열, 항목별 정규화 배열, 항목별 평균)
+    """
+    applied = get_watermark_state(db, SCORE_WATERMARK_JOB, SCORE_WATERMARK_NAME)
+    cached = _profile_cache.get(assembly_term)
+    now = time.monotonic()
+    if cached is not None and cached[0] == applied and now - cached[1] < settings.SCORE_PROFILE_CACHE_SECONDS:
+        return cached[2], cached[3], cached[4]
+
+    ids, metrics, _, _ = load_metrics(db, assembly_term)
+    normalized = normalize_metrics(metrics, normalization_bounds(metrics))
+    average = {name: round(float(values.mean()), 1) if values.size else 0.0 for name, values in normalized.items()}
+    _profile_cache[assembly_term] = (applied, now, ids, normalized, average)
+    return ids, normalized, average
+
+def member_metric_profile(db: Session,
+                          member_id: int,
+                          assembly_term: int = settings.ASSEMBLY_TERM) -> Optional[Dict[str, Dict[str, float]]]:
+    """
+    의원 한 명의 항목별 정규화 지표와 같은 대수 의원 평균 (상세 페이지 차트용, 점수 계산과 같은 정규화 사용,
+    대수별 정규화 결과는 _normalized_profiles에서 재사용)
+
+    Args:
+        db: 데이터베이스 세션
+        member_id: 의원 ID
+        assembly_term: 의원의 국회 대수 (기본값: 현재 대수 settings.ASSEMBLY_TERM)
+
+    Returns:
+        Optional[Dict[str, Dict[str, float]]]: {"member": 항목 -> 값, "average": 항목 -> 값} (해당 대수에 의원이 없으면 None)
+    """
+    ids, normalized, average = _normalized_profiles(db, assembly_term)
+    position = np.flatnonzero(ids == member_id)
+    if not position.size:
+        return None
+    return {
+        "member": {name: round(float(values[position[0]]), 1) for name, values in normalized.items()},
+        "average": dict(average),
+    }
+
+def write_scores(db: Session, ids: np.ndarray, scores: np.ndarray, stored: np.ndarray) -> int:
+    """
+    저장된 값과 달라진 점수만 한 번의 UPDATE로 저장 (커밋은 호출자가 수행)
+
+    Args:
+        db: 데이터베이스 세션
+        ids: 의원 ID 배열
+        scores: 새 활동 점수 배열
+        stored: 저장된 활동 점수 배열
+
+    Returns:
+        int: 점수가 바뀐 의원 수
+    """
+    changed = np.flatnonzero(~np.isclose(scores, stored))
+    if changed.size:
+        db.execute(
+            update(MemberModel),
+            [{"id": int(ids[i]), "activity_score": float(scores[i])} for i in changed]
+        )
+    return int(changed.size)
+
+def _fingerprint(bounds: Dict[str, float]) -> str:
+    """점수 설정과 정규화 상한 문자열 (같으면 지표가 바뀌지 않은 의원의 점수도 그대로임)"""
+    return json.dumps({
+        "mode": settings.SCORE_NORMALIZATION,
+        "weights": settings.SCORE_WEIGHTS,
+        "bounds": bounds,
+    }, sort_keys=True)
+
+def rescore_members(db: Session, full: bool = False) -> Dict[str, object]:
+    """
+    활동 점수를 다시 계산하여 저장
+
+    현재 대수(settings.ASSEMBLY_TERM) 의원만 대상으로, 재계산 대상으로 표시된 의원만 계산하고, 정규화 상한/점수 설정이 DB에 기록된 마지막 계산 때와
+    다르면(기록이 없는 첫 실행 포함) 전체 의원을 계산합니다. (rank 방식은 한 명의 지표만 바뀌어도 순위가 바뀌므로 항상 전체)
+
+    Args:
+        db: 데이터베이스 세션
+        full: 표시 여부와 관계없이 전체 의원을 계산할지 여부
+
+    Returns:
+        Dict[str, object]: 계산한 의원 수(scored), 점수가 바뀐 의원 수(changed), 전체 계산 여부(full), 사용한 정규화 상한(bounds)
+    """
+    ids, metrics, stored, dirty = load_metrics(db)
+    bounds = normalization_bounds(metrics)
+    fingerprint = _fingerprint(bounds)
+    applied = get_watermark_state(db, SCORE_WATERMARK_JOB, SCORE_WATERMARK_NAME)
+    full = full or settings.SCORE_NORMALIZATION == "rank" or fingerprint != applied
+
+    targets = np.ones(len(ids), dtype=bool) if full else dirty
+    changed = 0
+    if targets.any():
+        scores = compute_scores({name: values[targets] for name, values in metrics.items()}, bounds)
+        changed = write_scores(db, ids[targets], scores, stored[targets])
+    if dirty.any():
+        stmt = update(MemberModel)\
+            .where(MemberModel.id.in_([int(member_id) for member_id in ids[dirty]]))\
+            .values(score_dirty=False)\
+            .execution_options(synchronize_session=False)
+        db.execute(stmt)
+    if fingerprint != applied:
+        set_watermark_state(db, SCORE_WATERMARK_JOB, SCORE_WATERMARK_NAME, fingerprint)
+    db.commit()
+    # 같은 프로세스의 상세 페이지 지표는 바로 다시 계산 (다른 프로세스는 fingerprint 변경 또는 유효 시간으로 반영)
+    if targets.any() or fingerprint != applied:
+        _profile_cache.clear()
+
+    scored = int(targets.sum())
+    logger.info(
+        f"활동 점수 계산({'전체' if full else '변경분'}): {scored}명 계산, {changed}명 변경 "
+        f"(정규화 {settings.SCORE_NORMALIZATION}, 상한 {bounds})"
+    )
+    return {"scored": scored, "changed": changed, "full": full, "bounds": bounds}
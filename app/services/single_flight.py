@@ -0,0 +1,139 @@
+"""
+국회정보 Open API 요청 병합(single-flight) 모듈
+
+같은 엔드포인트/파라미터로 동시에 들어온 요청은 첫 요청 하나만 실제로 API를 호출하고,
+나머지는 그 결과(또는 예외)를 함께 받습니다.
+병합된 호출자가 있으면 공유 결과는 그대로 두고 각 호출자(첫 요청 포함)에게 깊은 복사본을 주므로,
+한 호출자가 응답을 고쳐도 다른 호출자의 결과는 바뀌지 않습니다.
+예: 새로 공유된 의안 상세 페이지에 동시에 접속한 방문자들이 같은 API 호출을 반복하지 않음
+"""
+import asyncio
+import copy
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class _Call:
+    """진행 중인 동기 호출 하나의 결과를 기다리는 자리"""
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0  # 이 호출에 병합된 호출자 수
+
+class SingleFlight:
+    """
+    키별로 진행 중인 호출을 하나로 합치는 요청 병합기
+
+    동기 클라이언트(스레드)와 비동기 클라이언트(이벤트 루프)가 하나의 인스턴스를 공유하며,
+    진행 중인 호출은 각각 따로 관리합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}  # 키 -> 진행 중인 비동기 호출에 병합된 호출자 수
+
+        # 통계
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        같은 키로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 직접 호출
+
+        Args:
+            key: 요청 키 (엔드포인트 + 정규화된 파라미터)
+            fn: 실제 호출 함수
+
+        Returns:
+            Any: 호출 결과 (병합된 호출자는 결과의 깊은 복사본을 받음)
+
+        Raises:
+            Exception: 실제 호출에서 발생한 예외 (병합된 호출자에게도 전달)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            logger.debug(f"진행 중인 API 요청에 병합: {key}")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        # 병합된 호출자가 복사해 갈 공유 결과는 그대로 두고 첫 요청에는 복사본 반환
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        같은 키로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 직접 호출 (비동기 버전)
+
+        Args:
+            key: 요청 키 (엔드포인트 + 정규화된 파라미터)
+            fn: 실제 호출 코루틴 함수
+
+        Returns:
+            Any: 호출 결과 (병합된 호출자는 결과의 깊은 복사본을 받음)
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self.coalesced += 1
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            logger.debug(f"진행 중인 API 요청에 병합: {key}")
+            # 기다리던 호출자 하나가 취소되어도 공유 결과는 취소되지 않도록 보호
+            return copy.deepcopy(await asyncio.shield(future))
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출자가 없어도 "예외가 회수되지 않음" 경고가 남지 않도록 표시
+            future.exception()
+            raise
+        finally:
+            self._futures.pop(key, None)
+            waiters = self._waiters.pop(key, 0)
+        future.set_result(result)
+        # 병합된 호출자가 복사해 갈 공유 결과는 그대로 두고 첫 요청에는 복사본 반환
+        return copy.deepcopy(result) if waiters else result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        요청 병합 통계 조회
+
+        Returns:
+            Dict[str, Any]: 실제 호출 수, 병합된 호출 수, 진행 중인 호출 수
+        """
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls) + len(self._futures),
+        }
+
+# 두 API 클라이언트(동기/비동기)가 함께 사용하는 요청 병합기
+request_coalescer = SingleFlight()
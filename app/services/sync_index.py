@@ -0,0 +1,87 @@
+"""
+동기화 작업용 인메모리 조회 인덱스 모듈
+
+동기화 한 번이 진행되는 동안 의안ID 존재 여부, 의원 이름 -> ID, 의안별 변경 감지 해시를
+매번 SQL로 조회하지 않도록 시작할 때 한 번에 읽어 두고, 행을 저장할 때마다 함께 갱신합니다.
+(의원 약 300명, 의안 수만 건 수준이므로 메모리에 모두 올려도 부담이 적음)
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.models.bill import Bill as BillModel
+from app.models.member import Member as MemberModel
+
+logger = logging.getLogger(__name__)
+
+def upstream_row_hash(row: Dict[str, Any]) -> str:
+    """
+    딕셔너리 전체로 변경 감지용 해시 생성 (키 순서와 무관)
+
+    Args:
+        row: API 응답 행 또는 해시할 값 딕셔너리
+
+    Returns:
+        str: 32자리 16진수 해시 문자열
+    """
+    raw = json.dumps(row, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+class SyncIndex:
+    """
+    동기화 작업 동안 사용하는 조회 인덱스
+
+    Attributes:
+        bill_ids: 저장된 의안ID 집합
+        member_ids: 의원 이름 -> 의원 ID
+        bill_hashes: 의안ID -> 저장된 변경 감지 해시 (bills.row_hash)
+    """
+    def __init__(self):
+        self.bill_ids: Set[str] = set()
+        self.member_ids: Dict[str, int] = {}
+        self.bill_hashes: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, db: Session) -> "SyncIndex":
+        """
+        DB에서 인덱스를 한 번에 읽어 생성
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            SyncIndex: 현재 DB 상태로 채운 인덱스
+        """
+        index = cls()
+        for bill_id, row_hash in db.query(BillModel.bill_id, BillModel.row_hash):
+            index.add_bill(bill_id, row_hash)
+        # 동명이인은 먼저 등록된 의원으로 연결 (기존 .first() 조회와 동일)
+        for member_id, name in db.query(MemberModel.id, MemberModel.name).order_by(MemberModel.id):
+            index.member_ids.setdefault(name, member_id)
+        logger.info(f"동기화 인덱스 로드: 의안 {len(index.bill_ids)}건, 의원 {len(index.member_ids)}명")
+        return index
+
+    def has_bill(self, bill_id: str) -> bool:
+        """의안ID가 이미 저장되어 있는지 확인"""
+        return bill_id in self.bill_ids
+
+    def bill_changed(self, bill_id: str, row_hash: str) -> bool:
+        """저장된 의안의 원본 행이 달라졌는지 확인 (저장되지 않았거나 해시가 없는 의안이면 True)"""
+        return self.bill_hashes.get(bill_id) != row_hash
+
+    def add_bill(self, bill_id: str, row_hash: Optional[str] = None) -> None:
+        """저장한 의안을 인덱스에 반영"""
+        self.bill_ids.add(bill_id)
+        if row_hash is not None:
+            self.bill_hashes[bill_id] = row_hash
+
+    def member_id(self, name: Optional[str]) -> Optional[int]:
+        """의원 이름으로 의원 ID 조회"""
+        return self.member_ids.get(name) if name else None
+
+    def add_member(self, name: str, member_id: int) -> None:
+        """저장한 의원을 인덱스에 반영"""
+        self.member_ids.setdefault(name, member_id)
@@ -0,0 +1,94 @@
+"""
+동기화 파이프라인 공통 모듈
+
+조회 -> 파싱 -> 저장 단계를 크기가 제한된 asyncio.Queue로 연결하여
+네트워크 대기와 DB 쓰기가 겹쳐 진행되도록 하고, 느린 단계가 있으면 앞 단계가 큐에서 대기(backpressure)하게 합니다.
+단계별 처리량은 StageStats로 집계합니다.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+class StageStats:
+    """
+    파이프라인 단계 하나의 처리량 통계
+
+    Attributes:
+        name: 단계 이름
+        pages: 처리한 페이지 수
+        rows: 처리한 행 수
+        busy_seconds: 실제 작업(요청 대기, 파싱, 쓰기)에 쓴 시간
+        blocked_seconds: 큐에서 앞/뒤 단계를 기다린 시간
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.pages = 0
+        self.rows = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+
+    def record(self, rows: int, busy_seconds: float) -> None:
+        """페이지 하나의 처리 결과 기록"""
+        self.pages += 1
+        self.rows += rows
+        self.busy_seconds += busy_seconds
+
+    async def put(self, queue: asyncio.Queue, item: Any) -> None:
+        """다음 단계 큐에 넣기 (큐가 가득 차 기다린 시간을 기록)"""
+        started = time.perf_counter()
+        await queue.put(item)
+        self.blocked_seconds += time.perf_counter() - started
+
+    async def get(self, queue: asyncio.Queue) -> Any:
+        """앞 단계 큐에서 꺼내기 (큐가 비어 기다린 시간을 기록)"""
+        started = time.perf_counter()
+        item = await queue.get()
+        self.blocked_seconds += time.perf_counter() - started
+        return item
+
+    def as_dict(self) -> Dict[str, Any]:
+        """통계를 딕셔너리로 변환"""
+        return {
+            "stage": self.name,
+            "pages": self.pages,
+            "rows": self.rows,
+            "busy_sec": round(self.busy_seconds, 3),
+            "blocked_sec": round(self.blocked_seconds, 3),
+            "rows_per_sec": round(self.rows / self.busy_seconds, 1) if self.busy_seconds > 0 else None,
+        }
+
+async def run_stages(*stages: Awaitable) -> None:
+    """
+    파이프라인 단계들을 동시에 실행하고 마지막 단계가 끝나면 종료
+
+    마지막 단계(저장)가 끝나면 아직 대기 중인 앞 단계(예: 중단 신호 후 남은 선조회)는 취소하고,
+    어느 단계에서든 예외가 발생하면 나머지 단계를 취소한 뒤 예외를 다시 발생시킵니다.
+
+    Args:
+        stages: 앞 단계부터 순서대로 나열한 단계 코루틴
+    """
+    tasks = [asyncio.ensure_future(stage) for stage in stages]
+    last = tasks[-1]
+    try:
+        while True:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            if last.done():
+                return
+            tasks = [task for task in tasks if not task.done()]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+def log_stage_report(title: str, stats: List[StageStats], elapsed: float) -> None:
+    """단계별 처리량을 한 번에 로그로 출력"""
+    logger.info(f"{title} 파이프라인 처리량 (전체 {elapsed:.2f}초):")
+    for stage in stats:
+        logger.info(f"  {stage.as_dict()}")
@@ -0,0 +1,233 @@
+"""
+동기화 실행 기록(sync_runs) 관리 모듈
+
+동기화를 시작할 때 실행 기록을 만들거나 중단된 실행을 이어받고,
+페이지를 저장할 때마다 같은 트랜잭션 안에서 체크포인트를 남깁니다.
+서버가 동기화 도중 재시작되어도 다음 실행은 마지막으로 완료한 페이지 다음부터 진행합니다.
+증분 동기화가 다음 실행의 조회 범위를 정할 때 쓰는 워터마크(sync_watermarks)도 함께 관리합니다.
+"""
+import logging
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.sync_run import SyncRun, SyncWatermark
+
+logger = logging.getLogger(__name__)
+
+RUN_RUNNING = "running"
+RUN_COMPLETED = "completed"
+RUN_FAILED = "failed"
+
+def find_resumable_run(db: Session, job: str, mode: Optional[str] = None) -> Optional[SyncRun]:
+    """
+    이어서 실행할 수 있는(완료되지 않은) 가장 최근 실행 기록 조회
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        mode: 실행 모드 (선택, 지정하면 해당 모드만 조회)
+
+    Returns:
+        Optional[SyncRun]: 가장 최근 실행이 완료되지 않았으면 그 실행 기록, 아니면 None
+    """
+    query = db.query(SyncRun).filter(SyncRun.job == job)
+    if mode:
+        query = query.filter(SyncRun.mode == mode)
+    latest = query.order_by(SyncRun.id.desc()).first()
+    if latest and latest.status != RUN_COMPLETED:
+        return latest
+    return None
+
+def start_run(db: Session, job: str, mode: str, max_pages: int, resume: bool = True) -> SyncRun:
+    """
+    동기화 실행 기록 생성 또는 중단된 실행 이어받기
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        mode: 실행 모드 (full/incremental)
+        max_pages: 처리할 최대 페이지 수
+        resume: 같은 작업/모드의 중단된 실행이 있으면 이어서 실행할지 여부
+
+    Returns:
+        SyncRun: 이번 실행의 기록 (이어받은 경우 last_completed_page 다음 페이지부터 진행)
+    """
+    run = find_resumable_run(db, job, mode) if resume else None
+    if run is not None:
+        logger.info(
+            f"중단된 {job} 동기화(실행 ID {run.id}, 상태 {run.status})를 "
+            f"페이지 {(run.last_completed_page or 0) + 1}부터 이어서 실행합니다."
+        )
+        run.status = RUN_RUNNING
+        run.resume_count = (run.resume_count or 0) + 1
+        run.max_pages = max_pages
+        run.error = None
+    else:
+        run = SyncRun(job=job, mode=mode, status=RUN_RUNNING, max_pages=max_pages, last_completed_page=0)
+        db.add(run)
+    db.commit()
+    return run
+
+def checkpoint_run(db: Session,
+                   run: SyncRun,
+                   page: int,
+                   new_count: int = 0,
+                   updated_count: int = 0,
+                   unchanged_count: int = 0,
+                   skipped_total: Optional[int] = None,
+                   high_water_date: Optional[date] = None,
+                   high_water_bill_no: Optional[str] = None,
+                   duration_seconds: Optional[float] = None) -> None:
+    """
+    페이지 저장 완료를 실행 기록에 반영 (커밋하지 않음 - 페이지 저장과 같은 트랜잭션에서 호출)
+
+    Args:
+        db: 데이터베이스 세션
+        run: 실행 기록
+        page: 저장을 마친 페이지 번호
+        new_count: 이 페이지에서 새로 저장한 건수
+        updated_count: 이 페이지에서 업데이트한 건수
+        unchanged_count: 이 페이지에서 원본 행이 바뀌지 않아 저장하지 않은 건수
+        skipped_total: 지금까지 건너뛴 전체 건수 (선택)
+        high_water_date: 이 페이지에서 저장한 가장 최근 날짜 (선택)
+        high_water_bill_no: 이 페이지에서 저장한 가장 큰 의안번호 (선택)
+        duration_seconds: 지금까지의 실행 시간 합계 (선택)
+    """
+    run.last_completed_page = max(run.last_completed_page or 0, page)
+    run.new_count = (run.new_count or 0) + new_count
+    run.updated_count = (run.updated_count or 0) + updated_count
+    run.unchanged_count = (run.unchanged_count or 0) + unchanged_count
+    if skipped_total is not None:
+        run.skipped_count = skipped_total
+    if high_water_date and (run.high_water_date is None or high_water_date > run.high_water_date):
+        run.high_water_date = high_water_date
+    if high_water_bill_no and bill_no_sort_key(high_water_bill_no) > bill_no_sort_key(run.high_water_bill_no):
+        run.high_water_bill_no = high_water_bill_no
+    if duration_seconds is not None:
+        run.duration_seconds = duration_seconds
+    db.add(run)
+
+def finish_run(db: Session, run: SyncRun, duration_seconds: float, skipped_total: Optional[int] = None) -> None:
+    """
+    실행 완료 기록
+
+    Args:
+        db: 데이터베이스 세션
+        run: 실행 기록
+        duration_seconds: 실행 시간 합계 (초)
+        skipped_total: 건너뛴 전체 건수 (선택)
+    """
+    run.status = RUN_COMPLETED
+    run.finished_at = datetime.now()
+    run.duration_seconds = duration_seconds
+    if skipped_total is not None:
+        run.skipped_count = skipped_total
+    db.add(run)
+    db.commit()
+
+def fail_run(db: Session, run: SyncRun, error: str, duration_seconds: float) -> None:
+    """
+    실행 실패 기록 (다음 실행에서 마지막 체크포인트부터 이어서 진행)
+
+    Args:
+        db: 데이터베이스 세션
+        run: 실행 기록
+        error: 오류 메시지
+        duration_seconds: 실행 시간 합계 (초)
+    """
+    try:
+        run.status = RUN_FAILED
+        run.error = error
+        run.duration_seconds = duration_seconds
+        db.add(run)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"동기화 실행 기록 저장 중 오류: {e}")
+
+def get_recent_runs(db: Session, job: Optional[str] = None, limit: int = 20) -> List[SyncRun]:
+    """
+    최근 동기화 실행 기록 조회
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름 (선택)
+        limit: 최대 조회 건수
+
+    Returns:
+        List[SyncRun]: 최근 실행부터 정렬된 실행 기록 목록
+    """
+    query = db.query(SyncRun)
+    if job:
+        query = query.filter(SyncRun.job == job)
+    return query.order_by(SyncRun.id.desc()).limit(limit).all()
+
+def get_watermark(db: Session, job: str, name: str) -> Optional[date]:
+    """
+    워터마크 조회
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        name: 워터마크 이름
+
+    Returns:
+        Optional[date]: 저장된 워터마크 날짜 (없으면 None)
+    """
+    watermark = db.query(SyncWatermark).filter(SyncWatermark.job == job, SyncWatermark.name == name).first()
+    return watermark.value if watermark else None
+
+def set_watermark(db: Session, job: str, name: str, value: Optional[date]) -> None:
+    """
+    워터마크 저장 (커밋하지 않음 - 실행 완료 기록과 같은 트랜잭션에서 호출)
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        name: 워터마크 이름
+        value: 워터마크 날짜
+    """
+    watermark = db.query(SyncWatermark).filter(SyncWatermark.job == job, SyncWatermark.name == name).first()
+    if watermark is None:
+        watermark = SyncWatermark(job=job, name=name)
+    watermark.value = value
+    db.add(watermark)
+
+def get_watermark_state(db: Session, job: str, name: str) -> Optional[str]:
+    """
+    날짜가 아닌 워터마크 상태 조회
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        name: 워터마크 이름
+
+    Returns:
+        Optional[str]: 저장된 상태 문자열 (없으면 None)
+    """
+    watermark = db.query(SyncWatermark).filter(SyncWatermark.job == job, SyncWatermark.name == name).first()
+    return watermark.state if watermark else None
+
+def set_watermark_state(db: Session, job: str, name: str, state: Optional[str]) -> None:
+    """
+    날짜가 아닌 워터마크 상태 저장 (커밋하지 않음 - 상태를 만든 쓰기와 같은 트랜잭션에서 호출)
+
+    Args:
+        db: 데이터베이스 세션
+        job: 동기화 작업 이름
+        name: 워터마크 이름
+        state: 저장할 상태 문자열
+    """
+    watermark = db.query(SyncWatermark).filter(SyncWatermark.job == job, SyncWatermark.name == name).first()
+    if watermark is None:
+        watermark = SyncWatermark(job=job, name=name)
+    watermark.state = state
+    db.add(watermark)
+
+def bill_no_sort_key(bill_no: Optional[str]) -> tuple:
+    """의안번호 정렬 키 (숫자로 된 번호는 숫자 크기로 비교)"""
+    if not bill_no:
+        return (-1, "")
+    return (int(bill_no), "") if bill_no.isdigit() else (0, bill_no)
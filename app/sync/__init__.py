@@ -0,0 +1,11 @@
+"""
+웹 서버와 분리된 데이터 동기화 워커
+
+- lock: 동기화 작업이 겹치지 않도록 하는 파일 잠금 (워커/웹 서버 프로세스 사이에서도 유효)
+- jobs: 정기 실행할 작업 (의원 정보, 의안, 의원별 발의안, 의안 상세 내용, 활동 점수)
+- scheduler: 작업별 주기에 무작위 편차(jitter)를 더해 실행하는 스케줄러
+
+실행 방법:
+    python -m app.sync                     # 모든 작업을 주기적으로 실행
+    python -m app.sync --once --jobs bills  # 지정한 작업만 한 번 실행하고 종료
+"""
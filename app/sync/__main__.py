@@ -0,0 +1,59 @@
+"""
+동기화 워커 실행 진입점
+
+실행 방법:
+    python -m app.sync                         # 모든 작업을 주기적으로 실행
+    python -m app.sync --once                  # 모든 작업을 한 번씩 실행하고 종료
+    python -m app.sync --jobs bills contents   # 지정한 작업만 실행
+"""
+import argparse
+import asyncio
+import logging
+
+from app.sync.jobs import JOBS, job_intervals
+from app.sync.scheduler import JobScheduler
+
+logger = logging.getLogger(__name__)
+
+async def run(job_names, once: bool):
+    from app.services.assembly_api import assembly_api, async_assembly_api
+
+    scheduler = JobScheduler()
+    intervals = job_intervals()
+    for name in job_names:
+        scheduler.add_job(name, JOBS[name], intervals[name])
+
+    try:
+        if once:
+            for summary in await scheduler.run_once():
+                print(summary)
+        else:
+            await scheduler.run_forever()
+    finally:
+        assembly_api.close()
+        await async_assembly_api.aclose()
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.sync", description="데이터 동기화 워커")
+    parser.add_argument("--jobs", nargs="+", choices=list(JOBS), default=list(JOBS), help="실행할 작업 (기본값: 전체)")
+    parser.add_argument("--once", action="store_true", help="작업을 한 번씩만 실행하고 종료")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    # 웹 서버 없이 실행될 수 있으므로 테이블/컬럼을 먼저 준비
+    from app.db.migrations import upgrade_schema
+    from app.db.session import Base, engine
+    from app.models import bill, member, sync_run  # create_all 대상 테이블 등록
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+
+    # 작업은 JOBS에 정의된 순서대로 실행 (의원 -> 의안 -> 의원별 발의안 -> 출석률/발언 -> 상세 내용 -> 점수)
+    job_names = [name for name in JOBS if name in args.jobs]
+    try:
+        asyncio.run(run(job_names, args.once))
+    except KeyboardInterrupt:
+        logger.info("동기화 워커를 종료합니다.")
+
+if __name__ == "__main__":
+    main()
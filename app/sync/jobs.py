@@ -0,0 +1,84 @@
+"""
+동기화 워커가 정기 실행하는 작업 모듈
+
+작업마다 새 DB 세션을 열고 닫으며, 동기 함수(의원 정보, 활동 점수)는 스레드에서 실행하여
+이벤트 루프가 다른 작업의 스케줄을 계속 관리할 수 있게 합니다.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services import bill_prefetch, bill_service, member_activity, member_service
+
+logger = logging.getLogger(__name__)
+
+async def sync_members() -> int:
+    """현재 대수 국회의원 정보 동기화"""
+    db = SessionLocal()
+    try:
+        return await asyncio.to_thread(member_service.sync_members_from_api, db, settings.ASSEMBLY_TERM)
+    finally:
+        db.close()
+
+async def sync_bills() -> int:
+    """현재 대수 의안 동기화 (중단된 전체 동기화 재개 / 전체 / 증분 중 자동 선택)"""
+    db = SessionLocal()
+    try:
+        return await bill_service.auto_sync_bills(db)
+    finally:
+        db.close()
+
+async def sync_member_bills() -> int:
+    """의원별 대표발의 의안 목록으로 발의자 연결/발의안 수 보정"""
+    db = SessionLocal()
+    try:
+        return await member_service.sync_member_bills(db)
+    finally:
+        db.close()
+
+async def sync_activity() -> int:
+    """대수 전체 표결정보/영상회의록으로 의원별 출석률/발언 횟수 갱신"""
+    db = SessionLocal()
+    try:
+        return await member_activity.sync_member_activity(db)
+    finally:
+        db.close()
+
+async def fill_contents() -> int:
+    """상세 내용이 비어 있는 의안의 제안이유 및 주요내용을 우선순위 순으로 채우기"""
+    db = SessionLocal()
+    try:
+        return await bill_prefetch.prefetch_bill_contents(db, budget=settings.SYNC_CONTENT_BATCH)
+    finally:
+        db.close()
+
+async def update_scores() -> int:
+    """국회의원 활동 점수 재계산 (지표가 바뀐 의원만, 정규화 상한이 바뀌면 전체)"""
+    db = SessionLocal()
+    try:
+        return await asyncio.to_thread(member_service.update_activity_scores, db)
+    finally:
+        db.close()
+
+# 작업 이름 -> 실행 함수 (실행 순서대로)
+JOBS: Dict[str, Callable[[], Awaitable[int]]] = {
+    "members": sync_members,
+    "bills": sync_bills,
+    "member_bills": sync_member_bills,
+    "activity": sync_activity,
+    "contents": fill_contents,
+    "scores": update_scores,
+}
+
+def job_intervals() -> Dict[str, float]:
+    """작업별 실행 주기 (초, 설정값)"""
+    return {
+        "members": settings.SYNC_MEMBERS_INTERVAL,
+        "bills": settings.SYNC_BILLS_INTERVAL,
+        "member_bills": settings.SYNC_MEMBER_BILLS_INTERVAL,
+        "activity": settings.SYNC_ACTIVITY_INTERVAL,
+        "contents": settings.SYNC_CONTENTS_INTERVAL,
+        "scores": settings.SYNC_SCORES_INTERVAL,
+    }
@@ -0,0 +1,124 @@
+"""
+동기화 작업 잠금 모듈
+
+잠금 파일을 배타적으로 생성(O_CREAT | O_EXCL)하는 방식이라 운영체제와 관계없이 동작하고,
+같은 DB를 쓰는 여러 프로세스(동기화 워커, 웹 서버 시작 시 동기화) 사이에서도 실행이 겹치지 않습니다.
+잠금을 잡은 프로세스가 비정상 종료되어 파일이 남으면 일정 시간이 지난 뒤(또는 프로세스가 없으면) 회수합니다.
+"""
+import json
+import logging
+import os
+import socket
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class SyncLock:
+    """
+    파일 기반 프로세스 간 잠금
+
+    Attributes:
+        path: 잠금 파일 경로
+        stale_seconds: 이 시간보다 오래된 잠금은 남은 파일로 보고 회수
+    """
+    def __init__(self, path: str, stale_seconds: float):
+        self.path = path
+        self.stale_seconds = stale_seconds
+        self._held = False
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """잠금 파일 내용 읽기 (없거나 읽을 수 없으면 None)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_stale(self, info: Optional[Dict[str, Any]]) -> bool:
+        """남은 잠금 파일인지 확인 (오래되었거나, 같은 호스트에서 잡은 프로세스가 없는 경우)"""
+        if info is None:
+            # 다른 프로세스가 막 만들어 아직 내용을 쓰지 않았을 수 있으므로 파일 수정 시각으로 판단
+            try:
+                return time.time() - os.path.getmtime(self.path) > self.stale_seconds
+            except OSError:
+                return True
+        if time.time() - info.get("acquired_at", 0) > self.stale_seconds:
+            return True
+        if os.name == "posix" and info.get("host") == socket.gethostname():
+            try:
+                os.kill(int(info.get("pid", 0)), 0)
+            except ProcessLookupError:
+                return True
+            except (PermissionError, ValueError):
+                return False
+        return False
+
+    def acquire(self, owner: str) -> bool:
+        """
+        잠금 획득 시도 (기다리지 않음)
+
+        Args:
+            owner: 잠금을 잡는 작업 이름 (잠금 파일에 기록)
+
+        Returns:
+            bool: 획득 여부
+        """
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                info = self._read()
+                if not self._is_stale(info):
+                    logger.info(f"동기화 잠금을 다른 작업이 사용 중입니다: {info}")
+                    return False
+                logger.warning(f"남아 있는 동기화 잠금을 회수합니다: {info}")
+                try:
+                    os.remove(self.path)
+                except FileNotFoundError:
+                    pass
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "owner": owner,
+                    "pid": os.getpid(),
+                    "host": socket.gethostname(),
+                    "acquired_at": time.time(),
+                }, f)
+            self._held = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """잠금 해제 (이 인스턴스가 잡은 경우에만)"""
+        if not self._held:
+            return
+        self._held = False
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def hold(self, owner: str) -> Iterator[bool]:
+        """
+        잠금을 잡은 동안 실행하는 컨텍스트 매니저
+
+        Args:
+            owner: 잠금을 잡는 작업 이름
+
+        Yields:
+            bool: 획득 여부 (False면 작업을 건너뛰어야 함)
+        """
+        acquired = self.acquire(owner)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release()
+
+# 동기화 워커와 웹 서버 시작 시 동기화가 함께 사용하는 잠금 인스턴스
+sync_lock = SyncLock(settings.SYNC_LOCK_PATH, settings.SYNC_LOCK_STALE_SECONDS)
@@ -0,0 +1,141 @@
+"""
+동기화 작업 스케줄러 모듈
+
+작업별 실행 주기에 무작위 편차(jitter)를 더해 다음 실행 시각을 정하고, 실행할 때마다 동기화 잠금을 잡아
+작업이 서로(또는 다른 프로세스의 동기화와) 겹치지 않게 합니다.
+잠금을 얻지 못한 작업은 settings.SYNC_LOCK_RETRY_SECONDS 뒤에 다시 시도합니다.
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.sync.lock import SyncLock, sync_lock
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ScheduledJob:
+    """스케줄러에 등록된 작업과 실행 통계"""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: float
+    next_run: float = 0.0
+    runs: int = 0
+    failures: int = 0
+    last_result: Any = None
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def summary(self) -> Dict[str, Any]:
+        """실행 통계 요약"""
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_result": self.last_result,
+            "last_duration_sec": round(self.last_duration, 2) if self.last_duration is not None else None,
+            "last_error": self.last_error,
+        }
+
+@dataclass
+class JobScheduler:
+    """
+    작업을 하나씩 순서대로 실행하는 스케줄러
+
+    Attributes:
+        jitter_ratio: 실행 주기에 더할 무작위 편차 비율 (0.1이면 주기의 ±10%)
+        lock: 작업 실행 중 잡는 동기화 잠금
+    """
+    jitter_ratio: float = settings.SYNC_JITTER_RATIO
+    lock: SyncLock = sync_lock
+    jobs: List[ScheduledJob] = field(default_factory=list)
+
+    def add_job(self, name: str, func: Callable[[], Awaitable[Any]], interval: float) -> ScheduledJob:
+        """
+        작업 등록
+
+        Args:
+            name: 작업 이름
+            func: 실행할 비동기 함수
+            interval: 실행 주기 (초)
+
+        Returns:
+            ScheduledJob: 등록된 작업
+        """
+        job = ScheduledJob(name=name, func=func, interval=interval)
+        self.jobs.append(job)
+        return job
+
+    def _jittered(self, interval: float) -> float:
+        """주기에 무작위 편차 적용"""
+        return max(1.0, interval * (1 + random.uniform(-self.jitter_ratio, self.jitter_ratio)))
+
+    async def run_job(self, job: ScheduledJob) -> bool:
+        """
+        잠금을 잡고 작업을 한 번 실행
+
+        Args:
+            job: 실행할 작업
+
+        Returns:
+            bool: 실행 여부 (잠금을 얻지 못했으면 False)
+        """
+        with self.lock.hold(f"sync:{job.name}") as acquired:
+            if not acquired:
+                return False
+            started = time.perf_counter()
+            logger.info(f"[{job.name}] 작업 시작")
+            try:
+                job.last_result = await job.func()
+                job.last_error = None
+            except Exception as e:
+                job.failures += 1
+                job.last_error = str(e)
+                logger.error(f"[{job.name}] 작업 중 오류: {e}")
+            job.runs += 1
+            job.last_duration = time.perf_counter() - started
+            logger.info(f"[{job.name}] 작업 종료: {job.summary()}")
+            return True
+
+    async def run_once(self) -> List[Dict[str, Any]]:
+        """
+        등록된 작업을 순서대로 한 번씩 실행 (잠금을 얻을 때까지 기다림)
+
+        Returns:
+            List[Dict[str, Any]]: 작업별 실행 통계
+        """
+        for job in self.jobs:
+            while not await self.run_job(job):
+                await asyncio.sleep(settings.SYNC_LOCK_RETRY_SECONDS)
+        return [job.summary() for job in self.jobs]
+
+    async def run_forever(self, startup_delay_max: float = settings.SYNC_STARTUP_DELAY_MAX) -> None:
+        """
+        등록된 작업을 주기에 맞춰 계속 실행
+
+        Args:
+            startup_delay_max: 첫 실행까지 최대 대기 시간 (여러 워커가 동시에 시작해도 실행 시각이 분산되도록 작업마다 무작위로 정함)
+        """
+        if not self.jobs:
+            logger.warning("등록된 동기화 작업이 없습니다.")
+            return
+
+        now = time.monotonic()
+        for job in self.jobs:
+            job.next_run = now + random.uniform(0, max(0.0, startup_delay_max))
+        logger.info(f"동기화 워커 시작: {[(job.name, job.interval) for job in self.jobs]}")
+
+        while True:
+            job = min(self.jobs, key=lambda job: job.next_run)
+            delay = job.next_run - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if await self.run_job(job):
+                job.next_run = time.monotonic() + self._jittered(job.interval)
+            else:
+                job.next_run = time.monotonic() + self._jittered(settings.SYNC_LOCK_RETRY_SECONDS)
@@ -0,0 +1,116 @@
+"""
+국회정보 API 클라이언트 커넥션 풀 벤치마크
+
+로컬 스텁 서버를 띄워 놓고 1,000건의 요청을 보내면서
+요청마다 새 연결을 여는 방식(requests.get)과 AssemblyAPI의 keep-alive 세션을 비교합니다.
+
+실행 방법:
+    python -m benchmarks.bench_connection_pool [--requests 1000]
+"""
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.services.assembly_api import AssemblyAPI
+
+ENDPOINT = "BILLINFOPPSR"
+STUB_BODY = json.dumps({
+    ENDPOINT: [
+        {"head": [{"list_total_count": 1}, {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}}]},
+        {"row": [{"PPSR_NM": "홍길동", "REP_DIV": "대표발의"}]}
+    ]
+}, ensure_ascii=False).encode("utf-8")
+
+class StubHandler(BaseHTTPRequestHandler):
+    """고정 JSON을 응답하고, 새로 열린 TCP 연결 수를 세는 핸들러"""
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 방지
+    
+    def setup(self):
+        # setup()은 TCP 연결 하나당 한 번 호출됨
+        with self.server.lock:
+            self.server.connections_opened += 1
+        super().setup()
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(STUB_BODY)))
+        self.end_headers()
+        self.wfile.write(STUB_BODY)
+    
+    def log_message(self, format, *args):
+        pass  # 요청 로그 출력 생략
+
+def start_stub_server() -> ThreadingHTTPServer:
+    """임의 포트에 스텁 서버를 띄우고 서버 객체 반환"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections_opened = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def run_case(server: ThreadingHTTPServer, name: str, send, count: int) -> dict:
+    """요청 함수를 count번 호출하고 연결 수와 소요 시간 측정"""
+    server.connections_opened = 0
+    started = time.perf_counter()
+    for _ in range(count):
+        send()
+    elapsed = time.perf_counter() - started
+    return {
+        "case": name,
+        "requests": count,
+        "connections_opened": server.connections_opened,
+        "wall_time_sec": round(elapsed, 3),
+        "wall_time_per_1000_sec": round(elapsed * 1000 / count, 3),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="AssemblyAPI 커넥션 풀 벤치마크")
+    parser.add_argument("--requests", type=int, default=1000, help="보낼 요청 수 (기본값: 1000)")
+    args = parser.parse_args()
+    
+    # 요청마다 남는 INFO 로그가 측정값을 흐리지 않도록 경고 이상만 출력
+    logging.basicConfig(level=logging.WARNING)
+    
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    params = {"BILL_ID": "PRC_TEST", "pIndex": 1, "pSize": 100, "Type": "json"}
+    
+    results = []
+    
+    # 1) 기존 방식: 요청마다 requests.get (매번 새 연결)
+    results.append(run_case(
+        server, "requests.get (연결 재사용 없음)",
+        lambda: requests.get(f"{base_url}/{ENDPOINT}", params=params, timeout=10).json(),
+        args.requests
+    ))
+    
+    # 2) AssemblyAPI: keep-alive 커넥션 풀 세션 (연결 비용만 보기 위해 응답 캐시와 속도 제한은 끔)
+    api = AssemblyAPI(base_url=base_url, api_key="BENCH", cache=None, limiter=None)
+    try:
+        results.append(run_case(
+            server, "AssemblyAPI (keep-alive 풀)",
+            lambda: api._make_request(ENDPOINT, dict(params)),
+            args.requests
+        ))
+    finally:
+        api.close()
+        server.shutdown()
+    
+    for result in results:
+        print(
+            f"{result['case']:<32} 요청 {result['requests']:>6}건 | "
+            f"새 연결 {result['connections_opened']:>6}개 | "
+            f"소요 {result['wall_time_sec']:>7.3f}초 | "
+            f"1,000건당 {result['wall_time_per_1000_sec']:>7.3f}초"
+        )
+
+if __name__ == "__main__":
+    main()
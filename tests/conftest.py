@@ -0,0 +1,90 @@
+"""
+테스트 공용 설정
+
+앱 모듈을 불러오기 전에 임시 DB/캐시 경로를 지정하여 작업 디렉터리의 app.db와 api_cache.db를 건드리지 않고,
+모의 API 서버(app.devtools.mock_server)의 synthetic 데이터로 API 클라이언트를 실행합니다.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+
+_TMP_DIR = tempfile.mkdtemp(prefix="assembly-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/test.db"
+os.environ["ASSEMBLY_API_CACHE_ENABLED"] = "False"
+os.environ["ASSEMBLY_API_CACHE_PATH"] = f"{_TMP_DIR}/api_cache.db"
+os.environ["ASSEMBLY_API_RATE_LIMIT"] = "1000"
+os.environ["ASSEMBLY_API_RATE_BURST"] = "1000"
+os.environ["ASSEMBLY_API_RATE_MAX"] = "1000"
+
+import pytest
+
+from app.db.session import Base, SessionLocal, engine
+
+@pytest.fixture
+def db():
+    """테스트마다 빈 스키마로 시작하는 DB 세션"""
+    import app.models.bill  # noqa: F401
+    import app.models.member  # noqa: F401
+    import app.models.sync_run  # noqa: F401
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def synthetic():
+    """모의 API 서버가 사용할 가짜 국회 데이터 (작은 규모)"""
+    from app.devtools.synthetic import SyntheticAssemblyData
+    return SyntheticAssemblyData(bills=300, members=40)
+
+@pytest.fixture
+def mock_api(synthetic, monkeypatch):
+    """
+    synthetic 데이터로 응답하는 모의 API 서버를 띄우고 공용 API 클라이언트를 그 서버로 연결
+
+    Yields:
+        MockAPIServer: 요청 수 등 통계를 확인할 수 있는 서버
+    """
+    import app.services.assembly_api as assembly_api_module
+    from app.devtools.mock_server import MockAPIServer
+    from app.services.circuit_breaker import CircuitBreakerRegistry
+
+    server = MockAPIServer(("127.0.0.1", 0), synthetic=synthetic)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}/portal/openapi"
+    breakers = CircuitBreakerRegistry(failure_threshold=5, recovery_timeout=30)
+    for client in (assembly_api_module.assembly_api, assembly_api_module.async_assembly_api):
+        monkeypatch.setattr(client, "base_url", base_url)
+        monkeypatch.setattr(client, "breakers", breakers)
+    # 테스트마다 새 이벤트 루프에서 실행하므로 이전 루프에 묶인 비동기 HTTP 클라이언트는 버림
+    assembly_api_module.async_assembly_api._client = None
+    try:
+        yield server
+    finally:
+        assembly_api_module.async_assembly_api._client = None
+        server.shutdown()
+        server.server_close()
+
+@pytest.fixture
+def run_async():
+    """
+    코루틴을 새 이벤트 루프에서 실행하는 함수
+
+    실행이 끝나면 그 루프에 묶인 공용 비동기 HTTP 클라이언트를 닫아, 다음 실행이 닫힌 루프의 연결을 쓰지 않게 합니다.
+    """
+    from app.services.assembly_api import async_assembly_api
+
+    def run(coro):
+        async def main():
+            try:
+                return await coro
+            finally:
+                await async_assembly_api.aclose()
+        return asyncio.run(main())
+    return run
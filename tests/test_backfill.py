@@ -0,0 +1,64 @@
+"""다대수 백필 보조 기능과 DB 잠금 대기/재시도 테스트"""
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.db.upsert import run_with_lock_retry
+from app.models.bill import Bill
+from app.services.backfill import parse_terms
+from app.services.bill_service import _bill_row, _write_bill_page
+from app.services.sync_index import SyncIndex
+
+def locked_error() -> OperationalError:
+    return OperationalError("INSERT ...", {}, sqlite3.OperationalError("database is locked"))
+
+def test_parse_terms():
+    assert parse_terms("17-19, 22,21 ,") == [17, 18, 19, 21, 22]
+    assert parse_terms("") == []
+
+def test_lock_errors_are_retried(db):
+    attempts = []
+
+    def write():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise locked_error()
+        return "ok"
+
+    assert run_with_lock_retry(db, write, retries=3, backoff=0) == "ok"
+    assert len(attempts) == 3
+
+def test_other_errors_and_exhausted_retries_raise(db):
+    with pytest.raises(ValueError):
+        run_with_lock_retry(db, lambda: (_ for _ in ()).throw(ValueError("bad row")), retries=3, backoff=0)
+
+    def always_locked():
+        raise locked_error()
+
+    with pytest.raises(OperationalError):
+        run_with_lock_retry(db, always_locked, retries=2, backoff=0)
+
+def test_page_write_waits_for_another_process_lock(db, synthetic):
+    summary = synthetic.bill_summary(0)
+    rows = [_bill_row(summary, None, None, [], 22, datetime(2024, 9, 1))]
+    index = SyncIndex.load(db)
+
+    # 다른 프로세스가 쓰기 잠금을 잡고 있다가 잠시 뒤 커밋
+    other = sqlite3.connect(settings.DATABASE_URL.replace("sqlite:///", ""), isolation_level=None, check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    other.execute("INSERT INTO bills (bill_id, bill_no, title) VALUES ('OTHER', '1', '다른 프로세스')")
+    release = threading.Timer(0.3, other.execute, args=("COMMIT",))
+    release.start()
+    started = time.perf_counter()
+    try:
+        _write_bill_page(db, index, rows, {})
+    finally:
+        release.join()
+        other.close()
+    assert time.perf_counter() - started >= 0.25
+    assert db.query(Bill).count() == 2
@@ -0,0 +1,38 @@
+"""의안 변경 감지 해시와 변경 없는 의안 건너뛰기 테스트"""
+from datetime import datetime
+
+from app.models.sync_run import SyncRun
+from app.services import bill_service
+from app.services.bill_service import _bill_row, _list_row_from_allbill, bill_row_hash
+
+NOW = datetime(2024, 9, 1)
+
+def list_row(synthetic, index):
+    row = synthetic.bill_summary(index)
+    return _bill_row(row, datetime.strptime(row["PROC_DT"], "%Y-%m-%d").date(), None, [], 22, NOW)
+
+def allbill_row(synthetic, index, **extra):
+    row = _list_row_from_allbill({**synthetic.bill_detail(index), **extra})
+    return _bill_row(row, datetime.strptime(row["PROC_DT"], "%Y-%m-%d").date(), None, [], 22, NOW)
+
+def test_list_and_allbill_rows_hash_the_same(synthetic):
+    for index in range(synthetic.bill_count):
+        assert list_row(synthetic, index)["row_hash"] == allbill_row(synthetic, index)["row_hash"]
+
+def test_hash_ignores_columns_an_update_does_not_write(synthetic):
+    row = allbill_row(synthetic, 0)
+    other = dict(row, title="다른 제목", proposer="다른 사람", last_updated=datetime(2030, 1, 1))
+    assert bill_row_hash(other) == row["row_hash"]
+    assert bill_row_hash(dict(row, status="원안가결")) != row["row_hash"]
+
+def test_unchanged_bills_are_not_rewritten(db, mock_api, run_async):
+    run_async(bill_service.sync_bills_data(db, max_pages=10, incremental=False, fetch_content=False))
+    run_async(bill_service.sync_bills_data(db, max_pages=10, incremental=False, update_existing=True, fetch_content=False, resume=False))
+    run_async(bill_service.sync_bills_data(db, incremental=True, fetch_content=False))
+    full, refresh, incremental = db.query(SyncRun).order_by(SyncRun.id).all()
+    assert full.new_count == 300
+    assert (refresh.updated_count, refresh.unchanged_count) == (0, 300)
+    # 증분 업데이트는 ALLBILL 행이지만 같은 해시가 나오므로 갱신 없음
+    assert incremental.new_count == 0
+    assert incremental.updated_count == 0
+    assert incremental.unchanged_count > 0
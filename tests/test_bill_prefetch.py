@@ -0,0 +1,65 @@
+"""의안 상세 내용 미리 가져오기의 실패/빈 응답 구분 테스트"""
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.models.bill import Bill
+from app.services import bill_prefetch
+from app.services.assembly_api import AsyncAssemblyAPI
+from app.services.circuit_breaker import CircuitBreakerRegistry
+
+NO_DATA = {"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}}
+
+def detail_response(request: httpx.Request) -> httpx.Response:
+    """의안ID별로 내용 있음/데이터 없음/서버 오류를 돌려주는 응답"""
+    bill_id = request.url.params.get("BILL_ID")
+    if bill_id == "FILLED":
+        return httpx.Response(200, json={"ALLBILL": {"row": [{"BILL_ID": bill_id, "DETAIL_CONTENT": "제안이유"}]}})
+    if bill_id == "EMPTY":
+        return httpx.Response(200, json=NO_DATA)
+    return httpx.Response(503, text="busy")
+
+def make_client() -> AsyncAssemblyAPI:
+    """detail_response로 응답하는 비동기 클라이언트 (캐시/속도 제한/요청 병합 없음)"""
+    client = AsyncAssemblyAPI(base_url="http://assembly.test/portal/openapi", api_key="test",
+                              cache=None, limiter=None, coalescer=None,
+                              breakers=CircuitBreakerRegistry(failure_threshold=10, recovery_timeout=30))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(detail_response))
+    return client
+
+def test_get_bill_detail_raises_only_when_asked():
+    async def main():
+        client = make_client()
+        try:
+            assert await client.get_bill_detail(bill_id="FAILED") == {}
+            with pytest.raises(Exception):
+                await client.get_bill_detail(bill_id="FAILED", raise_errors=True)
+            # 데이터 없음은 실패가 아니라 빈 결과
+            assert await client.get_bill_detail(bill_id="EMPTY", raise_errors=True) == {}
+        finally:
+            await client.aclose()
+    asyncio.run(main())
+
+def test_prefetch_does_not_mark_failed_fetches_as_checked(db, monkeypatch):
+    for index, bill_id in enumerate(["FILLED", "EMPTY", "FAILED"]):
+        db.add(Bill(bill_id=bill_id, bill_no=str(index), title=bill_id, term=settings.ASSEMBLY_TERM,
+                    proposal_date=date(2024, 9, 1), content=""))
+    db.commit()
+    client = make_client()
+    monkeypatch.setattr(bill_prefetch, "async_assembly_api", client)
+
+    async def main():
+        try:
+            return await bill_prefetch.prefetch_bill_contents(db, budget=10, rate=1000)
+        finally:
+            await client.aclose()
+    assert asyncio.run(main()) == 1
+
+    bills = {bill.bill_id: bill for bill in db.query(Bill).all()}
+    assert bills["FILLED"].content == "제안이유"
+    assert bills["EMPTY"].content_checked_at is not None
+    # 조회에 실패한 의안은 다음 실행에서 다시 후보가 되도록 조회 일시를 남기지 않음
+    assert bills["FAILED"].content_checked_at is None
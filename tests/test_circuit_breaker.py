@@ -0,0 +1,114 @@
+"""CircuitBreaker 상태 전환과 API 클라이언트의 실패 분류 테스트"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import circuit_breaker as circuit_breaker_module
+from app.services.assembly_api import AsyncAssemblyAPI
+from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+
+class FakeClock:
+    """time.monotonic 대신 사용할 수동 시계"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module.time, "monotonic", fake)
+    return fake
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+def test_opens_after_consecutive_failures_and_rejects(clock):
+    breaker = CircuitBreaker("ALLBILL", failure_threshold=3, recovery_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    # 중간에 성공하면 연속 실패가 초기화되므로 아직 닫혀 있음
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["rejected"] == 1
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker("ALLBILL", failure_threshold=2, recovery_timeout=30)
+    open_breaker(breaker)
+    clock.now += 31
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # 시험 호출은 한 번에 하나만
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker("ALLBILL", failure_threshold=2, recovery_timeout=30)
+    open_breaker(breaker)
+    clock.now += 31
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["times_opened"] == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+def test_stale_probe_does_not_block_half_open_forever(clock):
+    breaker = CircuitBreaker("ALLBILL", failure_threshold=1, recovery_timeout=30)
+    open_breaker(breaker)
+    clock.now += 31
+    breaker.before_call()  # 응답 없이 취소된 시험 호출
+    clock.now += 31
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def make_client(handler) -> AsyncAssemblyAPI:
+    """응답을 handler로 만드는 비동기 클라이언트 (캐시/속도 제한/요청 병합 없음)"""
+    client = AsyncAssemblyAPI(base_url="http://assembly.test/portal/openapi", api_key="test",
+                              cache=None, limiter=None, coalescer=None,
+                              breakers=CircuitBreakerRegistry(failure_threshold=3, recovery_timeout=30))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+async def call_repeatedly(client: AsyncAssemblyAPI, times: int):
+    errors = []
+    for _ in range(times):
+        try:
+            await client._make_request("ALLBILL", {"AGE": 22})
+        except Exception as e:
+            errors.append(e)
+    await client.aclose()
+    return errors
+
+def test_html_maintenance_page_counts_as_failure():
+    client = make_client(lambda request: httpx.Response(200, text="<html>점검 중입니다</html>"))
+    errors = asyncio.run(call_repeatedly(client, 4))
+    assert client.breakers.get("ALLBILL").state == CircuitBreaker.OPEN
+    assert isinstance(errors[-1], CircuitOpenError)
+
+def test_request_errors_from_a_healthy_server_do_not_open():
+    body = {"RESULT": {"CODE": "ERROR-300", "MESSAGE": "필수 값이 누락되어 있습니다."}}
+    client = make_client(lambda request: httpx.Response(200, json=body))
+    errors = asyncio.run(call_repeatedly(client, 5))
+    assert len(errors) == 5
+    assert not any(isinstance(e, CircuitOpenError) for e in errors)
+    assert client.breakers.get("ALLBILL").state == CircuitBreaker.CLOSED
+
+def test_server_errors_open_the_endpoint_breaker_only():
+    client = make_client(lambda request: httpx.Response(503, text="busy"))
+    asyncio.run(call_repeatedly(client, 3))
+    assert client.breakers.get("ALLBILL").state == CircuitBreaker.OPEN
+    assert client.breakers.get("BILLINFOPPSR").state == CircuitBreaker.CLOSED
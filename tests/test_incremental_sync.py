@@ -0,0 +1,47 @@
+"""증분 의안 동기화(ALLBILL 경로, 발의일/처리 상태 워터마크) 테스트"""
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.models.bill import Bill
+from app.models.sync_run import SyncRun
+from app.services import bill_service
+from app.services.bill_service import _bill_row, _list_row_from_allbill
+from app.services.sync_runs import get_watermark
+from app.utils.helpers import parse_date
+
+def test_allbill_row_without_result_is_pending(synthetic):
+    detail = synthetic.bill_detail(0)
+    detail.update({"RGS_CONF_RSLT": None, "JRCMIT_PROC_RSLT": None, "RGS_RSLN_DT": None, "JRCMIT_PROC_DT": None})
+    row = _bill_row(_list_row_from_allbill(detail), None, None, [], 22, datetime(2024, 9, 1))
+    assert row["status"] == "계류"
+    assert row["vote_result"] is None
+
+def test_allbill_row_with_result_keeps_it(synthetic):
+    detail = dict(synthetic.bill_detail(0), RGS_CONF_RSLT="원안가결")
+    row = _bill_row(_list_row_from_allbill(detail), None, None, [], 22, datetime(2024, 9, 1))
+    assert (row["status"], row["vote_result"]) == ("원안가결", "원안가결")
+
+def test_incremental_sync_stores_pending_status_and_advances_watermarks(db, mock_api, synthetic, run_async):
+    assert run_async(bill_service.sync_bills_data(db, incremental=True, fetch_content=False)) == 300
+    assert db.query(Bill).filter(Bill.status.is_(None)).count() == 0
+    pending = db.query(Bill).filter(Bill.vote_result.is_(None)).all()
+    assert pending and all(bill.status == "계류" for bill in pending)
+
+    job = bill_service.bill_sync_job(22)
+    # bills.proposal_date는 처리일(PROC_DT)이므로 실제 발의일은 원본 행에서 확인
+    proposed = [parse_date(synthetic.bill_summary(index)["PROPOSE_DT"]) for index in range(synthetic.bill_count)]
+    newest = max(proposed)
+    oldest_pending = min(bill.proposal_date for bill in pending)
+    assert get_watermark(db, job, "proposed") == newest
+    assert get_watermark(db, job, "status") == oldest_pending
+
+    # 다음 실행은 발의일 워터마크(겹침 포함) 이후 구간과 처리 상태 점검 구간만 조회
+    run_async(bill_service.sync_bills_data(db, incremental=True, fetch_content=False))
+    second = db.query(SyncRun).order_by(SyncRun.id.desc()).first()
+    assert (second.new_count, second.updated_count) == (0, 0)
+    assert second.unchanged_count < 300
+    overlap_from = newest - timedelta(days=settings.SYNC_WATERMARK_OVERLAP_DAYS)
+    sweep_to = oldest_pending + timedelta(days=settings.SYNC_STATUS_SWEEP_DAYS - 1)
+    expected = sum(1 for day in proposed if day >= overlap_from or oldest_pending <= day <= sweep_to)
+    assert second.unchanged_count == expected
+    assert get_watermark(db, job, "status_sweep") == sweep_to + timedelta(days=1)
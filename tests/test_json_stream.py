@@ -0,0 +1,72 @@
+"""RowStreamParser 점진 파싱 테스트 (청크 경계와 관계없이 json.loads와 같은 결과인지)"""
+import asyncio
+import json
+
+import pytest
+
+from app.services.assembly_api import async_assembly_api
+from app.services.json_stream import RowStreamParser, StreamParseError
+
+LIST_RESPONSE = {
+    "ncocpgfiaoituanbr": [
+        {"head": [{"list_total_count": 3}, {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}}]},
+        {"row": [
+            {"BILL_ID": "PRC_A", "BILL_NAME": "민법 일부개정법률안(홍길동의원 대표발의)", "PROC_RESULT_CD": None},
+            {"BILL_ID": "PRC_B", "BILL_NAME": "따옴표 \"}]\" 와 \\ 역슬래시", "AGE": "22"},
+            {"BILL_ID": "PRC_C", "NESTED": {"row": [1, 2]}, "EMPTY": []},
+        ]},
+    ]
+}
+
+def parse(text: str, chunk_size: int):
+    parser = RowStreamParser()
+    events = []
+    for start in range(0, len(text), chunk_size):
+        events.extend(parser.feed(text[start:start + chunk_size]))
+    parser.close()
+    return events
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100000])
+def test_rows_and_head_match_json_loads_for_any_chunking(chunk_size):
+    text = json.dumps(LIST_RESPONSE, ensure_ascii=False, indent=1)
+    events = parse(text, chunk_size)
+    body = LIST_RESPONSE["ncocpgfiaoituanbr"]
+    assert [value for kind, value in events if kind == "row"] == body[1]["row"]
+    assert [value for kind, value in events if kind == "head"] == [body[0]["head"]]
+
+def test_dict_body_form():
+    text = json.dumps({"ALLBILL": {"head": [{"list_total_count": 1}], "row": [{"BILL_ID": "X"}]}})
+    events = parse(text, 5)
+    assert ("row", {"BILL_ID": "X"}) in events
+    assert ("head", [{"list_total_count": 1}]) in events
+
+def test_top_level_result_event():
+    text = json.dumps({"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}}, ensure_ascii=False)
+    assert parse(text, 4) == [("RESULT", {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."})]
+
+def test_truncated_body_raises_on_close():
+    text = json.dumps(LIST_RESPONSE)
+    parser = RowStreamParser()
+    parser.feed(text[:len(text) // 2])
+    with pytest.raises(StreamParseError):
+        parser.close()
+
+def test_non_json_body_raises():
+    parser = RowStreamParser()
+    with pytest.raises(StreamParseError):
+        parser.feed("<html>점검 중</html>")
+
+def test_streaming_iter_rows_matches_buffered(mock_api, monkeypatch):
+    # 작은 청크로 받아 멀티바이트 문자가 청크 경계에서 잘리도록 함
+    monkeypatch.setattr("app.core.config.settings.ASSEMBLY_API_STREAM_CHUNK_SIZE", 7)
+    params = {"AGE": 22, "PROPOSE_FROM": "20240101"}
+
+    async def collect(stream: bool):
+        rows = [row async for row in async_assembly_api.iter_rows("ALLBILL", params, page_size=40, stream=stream)]
+        await async_assembly_api.aclose()
+        return rows
+
+    buffered = asyncio.run(collect(False))
+    streamed = asyncio.run(collect(True))
+    assert len(buffered) == 300
+    assert streamed == buffered
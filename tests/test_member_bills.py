@@ -0,0 +1,75 @@
+"""의원별 발의안 동기화의 대표발의자 확인과 저장 규칙 테스트"""
+from datetime import date
+
+import httpx
+
+from app.core.config import settings
+from app.models.bill import Bill
+from app.models.member import Member
+from app.services import member_service
+from app.services.assembly_api import AsyncAssemblyAPI
+from app.services.bill_service import _bill_row, _list_row_from_allbill
+from app.services.circuit_breaker import CircuitBreakerRegistry
+
+def allbill_row(bill_id: str, proposer: str, **extra) -> dict:
+    row = {
+        "BILL_ID": bill_id, "BILL_NO": bill_id[-3:], "AGE": str(settings.ASSEMBLY_TERM),
+        "BILL_NM": f"{bill_id} 일부개정법률안", "BILL_KND": "법률안", "PPSR_NM": proposer,
+        "PPSL_DT": "2024-09-01", "JRCMIT_NM": "법제사법위원회",
+    }
+    row.update(extra)
+    return row
+
+# 대표발의자 조건으로 조회했지만 정부/다른 의원 의안도 섞여 오는 응답
+ROWS = [
+    allbill_row("BILL_OWN", "홍길동의원 등 10인"),
+    allbill_row("BILL_GOV", "정부"),
+    allbill_row("BILL_OTHER", "홍길동수의원 등 12인"),
+]
+
+def make_client(rows: list) -> AsyncAssemblyAPI:
+    """rows로 응답하는 비동기 클라이언트 (캐시/속도 제한/요청 병합 없음)"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ALLBILL": [
+            {"head": [{"list_total_count": len(rows)}, {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}}]},
+            {"row": rows},
+        ]})
+    client = AsyncAssemblyAPI(base_url="http://assembly.test/portal/openapi", api_key="test",
+                              cache=None, limiter=None, coalescer=None,
+                              breakers=CircuitBreakerRegistry(failure_threshold=10, recovery_timeout=30))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+def test_only_exact_rep_proposer_rows_are_linked(db, monkeypatch, run_async):
+    member = Member(name="홍길동", member_code="M1", term=settings.ASSEMBLY_TERM, num_bills=0)
+    db.add(member)
+    db.commit()
+    monkeypatch.setattr(member_service, "async_assembly_api", make_client(ROWS))
+
+    assert run_async(member_service.sync_member_bills(db)) == 1
+
+    bills = db.query(Bill).all()
+    assert [(bill.bill_id, bill.proposer_id) for bill in bills] == [("BILL_OWN", member.id)]
+    db.refresh(member)
+    assert member.num_bills == 1
+
+def test_member_bill_rows_match_bill_sync_rows_and_keep_vote_date(db, monkeypatch, run_async):
+    member = Member(name="홍길동", member_code="M1", term=settings.ASSEMBLY_TERM, num_bills=1)
+    db.add(member)
+    db.commit()
+    # 처리일이 있던 의안을 이전 동기화에서 저장해 둠
+    processed = allbill_row("BILL_OWN", "홍길동의원 등 10인", JRCMIT_PROC_DT="2024-10-01", JRCMIT_PROC_RSLT="대안반영폐기")
+    stored = _bill_row(_list_row_from_allbill(processed), date(2024, 10, 1), "홍길동의원", [], settings.ASSEMBLY_TERM, None)
+    db.add(Bill(**{**stored, "proposer_id": member.id, "last_updated": None}))
+    db.commit()
+    # 이번 응답에는 처리일이 빠짐 (발의일도 없는 행)
+    changed = allbill_row("BILL_OWN", "홍길동의원 등 10인", PPSL_DT=None, JRCMIT_PROC_RSLT="대안반영폐기")
+    monkeypatch.setattr(member_service, "async_assembly_api", make_client([changed]))
+
+    run_async(member_service.sync_member_bills(db))
+
+    bill = db.query(Bill).filter(Bill.bill_id == "BILL_OWN").one()
+    db.refresh(bill)
+    assert bill.status == "대안반영폐기"
+    # 의안 동기화와 같이 새 행에 표결일이 없으면 기존 값 유지
+    assert bill.vote_date == date(2024, 10, 1)
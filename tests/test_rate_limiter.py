@@ -0,0 +1,88 @@
+"""AdaptiveRateLimiter 토큰 버킷/AIMD 동작 테스트"""
+import pytest
+
+from app.services import rate_limiter as rate_limiter_module
+from app.services.rate_limiter import AdaptiveRateLimiter
+
+class FakeClock:
+    """time.monotonic 대신 사용할 수동 시계"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", fake)
+    return fake
+
+def make_limiter(**overrides) -> AdaptiveRateLimiter:
+    options = dict(rate=10.0, burst=2.0, min_rate=1.0, max_rate=12.0,
+                   increase_step=1.0, decrease_factor=0.5, success_threshold=3)
+    options.update(overrides)
+    return AdaptiveRateLimiter(**options)
+
+def test_burst_is_free_then_calls_queue_behind_each_other(clock):
+    limiter = make_limiter()
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == 0.0
+    # 버킷이 비면 먼저 예약한 호출부터 1/rate 간격으로 대기
+    assert limiter._reserve() == pytest.approx(0.1)
+    assert limiter._reserve() == pytest.approx(0.2)
+    assert limiter.stats()["acquired"] == 4
+
+def test_tokens_refill_with_elapsed_time_up_to_burst(clock):
+    limiter = make_limiter()
+    limiter._reserve()
+    limiter._reserve()
+    clock.now += 10.0
+    # 오래 쉬어도 버킷 크기(2)까지만 채워짐
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() > 0.0
+
+def test_throttle_halves_rate_and_drains_bucket(clock):
+    limiter = make_limiter()
+    limiter.record_throttle()
+    assert limiter.rate == pytest.approx(5.0)
+    assert limiter._reserve() == pytest.approx(0.2)
+    for _ in range(5):
+        limiter.record_throttle()
+    assert limiter.rate == limiter.min_rate
+    assert limiter.stats()["throttle_count"] == 6
+
+def test_success_streak_raises_rate_up_to_max(clock):
+    limiter = make_limiter()
+    for _ in range(2):
+        limiter.record_success()
+    assert limiter.rate == 10.0
+    limiter.record_success()
+    assert limiter.rate == 11.0
+    for _ in range(9):
+        limiter.record_success()
+    assert limiter.rate == limiter.max_rate
+
+def test_throttle_resets_success_streak(clock):
+    limiter = make_limiter()
+    limiter.record_success()
+    limiter.record_success()
+    limiter.record_throttle()
+    limiter.record_success()
+    assert limiter.rate == pytest.approx(5.0)
+
+def test_fixed_budget_never_adapts(clock):
+    budget = AdaptiveRateLimiter.fixed(4.0)
+    assert budget._reserve() == 0.0
+    assert budget._reserve() == pytest.approx(0.25)
+    budget.record_throttle()
+    for _ in range(10):
+        budget.record_success()
+    assert budget.rate == 4.0
+
+def test_scale_shares_limits_between_processes(clock):
+    limiter = make_limiter()
+    limiter.scale(0.5)
+    assert (limiter.rate, limiter.min_rate, limiter.max_rate) == (5.0, 0.5, 6.0)
+    assert limiter.burst == 1.0
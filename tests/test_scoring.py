@@ -0,0 +1,80 @@
+"""활동 점수 계산 대상과 상세 페이지 지표 테스트"""
+import pytest
+
+from app.core.config import settings
+from app.models.member import Member
+from app.services import scoring
+
+@pytest.fixture(autouse=True)
+def clear_profile_cache():
+    """테스트마다 DB를 새로 만들므로 이전 테스트의 상세 페이지 지표 캐시는 버림"""
+    scoring._profile_cache.clear()
+    yield
+    scoring._profile_cache.clear()
+
+def add_members(db, term: int, bills: list) -> list:
+    members = [
+        Member(name=f"{term}대 의원{i}", member_code=f"{term}-{i}", term=term, num_bills=count,
+               attendance_rate=90.0, speech_count=10, bill_pass_rate=20.0, score_dirty=True)
+        for i, count in enumerate(bills)
+    ]
+    db.add_all(members)
+    db.commit()
+    return members
+
+def test_load_metrics_only_reads_the_term(db):
+    current = add_members(db, settings.ASSEMBLY_TERM, [10, 20])
+    add_members(db, settings.ASSEMBLY_TERM - 1, [500])
+
+    ids, metrics, _, _ = scoring.load_metrics(db)
+    assert sorted(ids.tolist()) == sorted(member.id for member in current)
+    assert metrics["bills"].max() == 20
+
+def test_previous_term_members_do_not_move_current_bounds(db, monkeypatch):
+    monkeypatch.setattr(settings, "SCORE_NORMALIZATION", "max")
+    current = add_members(db, settings.ASSEMBLY_TERM, [10, 20])
+    previous = add_members(db, settings.ASSEMBLY_TERM - 1, [500])
+
+    result = scoring.rescore_members(db, full=True)
+    assert result["scored"] == 2
+    assert result["bounds"]["bills"] == 20
+
+    profile = scoring.member_metric_profile(db, current[1].id)
+    assert profile["member"]["bills"] == 100.0
+    assert profile["average"]["bills"] == 75.0
+    # 이전 대수 의원은 그 대수 의원끼리 비교
+    assert scoring.member_metric_profile(db, previous[0].id) is None
+    assert scoring.member_metric_profile(db, previous[0].id, settings.ASSEMBLY_TERM - 1)["member"]["bills"] == 100.0
+
+def test_profile_reuses_normalized_arrays_until_scores_change(db, monkeypatch):
+    monkeypatch.setattr(settings, "SCORE_NORMALIZATION", "max")
+    members = add_members(db, settings.ASSEMBLY_TERM, [10, 20])
+    scoring.rescore_members(db)
+    loads = []
+    load_metrics = scoring.load_metrics
+    monkeypatch.setattr(scoring, "load_metrics", lambda *args: loads.append(args) or load_metrics(*args))
+
+    first = scoring.member_metric_profile(db, members[0].id)
+    second = scoring.member_metric_profile(db, members[1].id)
+    assert len(loads) == 1
+    assert first["member"]["bills"] == 50.0
+    assert second["member"]["bills"] == 100.0
+
+    # 지표가 바뀌어 점수를 다시 계산하면 다음 조회에서 새로 읽음
+    members[0].num_bills = 40
+    scoring.mark_dirty(db, [members[0].id])
+    db.commit()
+    scoring.rescore_members(db)
+    assert scoring.member_metric_profile(db, members[0].id)["member"]["bills"] == 100.0
+    assert len(loads) == 3
+
+def test_profile_cache_expires(db, monkeypatch):
+    members = add_members(db, settings.ASSEMBLY_TERM, [10, 20])
+    monkeypatch.setattr(settings, "SCORE_PROFILE_CACHE_SECONDS", 0)
+    loads = []
+    load_metrics = scoring.load_metrics
+    monkeypatch.setattr(scoring, "load_metrics", lambda *args: loads.append(args) or load_metrics(*args))
+
+    scoring.member_metric_profile(db, members[0].id)
+    scoring.member_metric_profile(db, members[0].id)
+    assert len(loads) == 2
@@ -0,0 +1,83 @@
+"""SingleFlight 요청 병합 테스트"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+def test_concurrent_async_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"ALLBILL": {"row": [{"BILL_ID": "A"}]}}
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", fetch) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+    assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+def test_async_followers_get_independent_copies():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return {"ALLBILL": {"row": [{"BILL_ID": "A"}]}}
+
+    async def mutate_first():
+        result = await flight.do_async("key", fetch)
+        result["ALLBILL"]["row"].pop()
+        return result
+
+    async def main():
+        leader = asyncio.ensure_future(mutate_first())
+        await asyncio.sleep(0)
+        follower = await flight.do_async("key", fetch)
+        return await leader, follower
+
+    leader_result, follower_result = asyncio.run(main())
+    assert leader_result["ALLBILL"]["row"] == []
+    assert follower_result["ALLBILL"]["row"] == [{"BILL_ID": "A"}]
+
+def test_async_error_is_shared_and_key_released():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.stats()["in_flight"] == 0
+
+def test_threaded_followers_get_copies():
+    flight = SingleFlight()
+    started = threading.Event()
+    results = []
+
+    def fetch():
+        started.set()
+        time.sleep(0.05)
+        return {"rows": [1, 2, 3]}
+
+    def follower():
+        started.wait()
+        results.append(flight.do("key", fetch))
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    leader = flight.do("key", fetch)
+    thread.join()
+    leader["rows"].clear()
+    assert results == [{"rows": [1, 2, 3]}]
+    assert flight.stats()["executed"] == 1
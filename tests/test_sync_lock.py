@@ -0,0 +1,30 @@
+"""동기화 작업 잠금과 웹 서버 시작 시 동기화의 잠금 사용 테스트"""
+import app.main as main_module
+from app.sync.lock import SyncLock
+
+def test_lock_is_exclusive_until_released(tmp_path):
+    path = str(tmp_path / "sync.lock")
+    first = SyncLock(path, stale_seconds=3600)
+    second = SyncLock(path, stale_seconds=3600)
+
+    with first.hold("worker:bills") as acquired:
+        assert acquired
+        assert not second.acquire("web:members")
+    assert second.acquire("web:members")
+    second.release()
+
+def test_startup_member_sync_skips_while_worker_holds_lock(db, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(main_module.settings, "SYNC_IN_WEB_PROCESS", True)
+    monkeypatch.setattr(main_module.member_service, "sync_members_from_api",
+                        lambda db, assembly_term: calls.append(assembly_term) or {"total": 0})
+    lock = SyncLock(str(tmp_path / "sync.lock"), stale_seconds=3600)
+    monkeypatch.setattr(main_module, "sync_lock", lock)
+
+    worker = SyncLock(lock.path, stale_seconds=3600)
+    with worker.hold("worker:members"):
+        main_module.startup_event()
+    assert calls == []
+
+    main_module.startup_event()
+    assert calls == [main_module.settings.ASSEMBLY_TERM]
@@ -0,0 +1,73 @@
+"""동기화 실행 기록(체크포인트/이어받기)과 워터마크 테스트"""
+from datetime import date
+
+from app.models.bill import Bill
+from app.models.sync_run import SyncRun
+from app.services import bill_service
+from app.services.sync_runs import (
+    RUN_COMPLETED, RUN_FAILED, checkpoint_run, fail_run, finish_run, get_watermark, get_watermark_state,
+    set_watermark, set_watermark_state, start_run
+)
+
+def test_failed_run_is_resumed_from_last_checkpoint(db):
+    run = start_run(db, "bills:22", "full", max_pages=10)
+    checkpoint_run(db, run, 1, new_count=100, high_water_date=date(2024, 6, 1), high_water_bill_no="2200100")
+    checkpoint_run(db, run, 2, new_count=100, high_water_date=date(2024, 5, 30), high_water_bill_no="2200099")
+    db.commit()
+    fail_run(db, run, "페이지 3: 오류", 1.5)
+
+    resumed = start_run(db, "bills:22", "full", max_pages=10)
+    assert resumed.id == run.id
+    assert (resumed.last_completed_page, resumed.resume_count, resumed.error) == (2, 1, None)
+    assert resumed.new_count == 200
+    # 고수위 값은 더 큰 값만 남음
+    assert (resumed.high_water_date, resumed.high_water_bill_no) == (date(2024, 6, 1), "2200100")
+
+def test_completed_run_starts_fresh_and_modes_are_separate(db):
+    run = start_run(db, "bills:22", "full", max_pages=10)
+    finish_run(db, run, 1.0)
+    incremental = start_run(db, "bills:22", "incremental", max_pages=5)
+    fail_run(db, incremental, "오류", 0.1)
+
+    assert start_run(db, "bills:22", "full", max_pages=10).id not in (run.id, incremental.id)
+    assert start_run(db, "bills:22", "incremental", max_pages=5, resume=False).id != incremental.id
+
+def test_watermarks_are_per_job_and_name(db):
+    set_watermark(db, "bills:22", "proposed", date(2024, 7, 1))
+    set_watermark(db, "bills:21", "proposed", date(2020, 7, 1))
+    set_watermark_state(db, "scores", "fingerprint", '{"v": 1}')
+    db.commit()
+    set_watermark(db, "bills:22", "proposed", date(2024, 8, 1))
+    db.commit()
+    assert get_watermark(db, "bills:22", "proposed") == date(2024, 8, 1)
+    assert get_watermark(db, "bills:21", "proposed") == date(2020, 7, 1)
+    assert get_watermark(db, "bills:22", "status") is None
+    assert get_watermark_state(db, "scores", "fingerprint") == '{"v": 1}'
+
+def test_interrupted_full_sync_resumes_at_next_page(db, mock_api, run_async, monkeypatch):
+    write_page = bill_service._write_bill_page
+    calls = {"count": 0}
+
+    def fail_second_write(*args, **kwargs):
+        calls["count"] += 1
+        if calls["count"] == 2:
+            raise RuntimeError("database is locked")
+        return write_page(*args, **kwargs)
+
+    monkeypatch.setattr(bill_service, "_write_bill_page", fail_second_write)
+    run_async(bill_service.sync_bills_data(db, max_pages=10, incremental=False, fetch_content=False))
+    run = db.query(SyncRun).one()
+    assert run.status == RUN_FAILED
+    assert run.last_completed_page == 1
+    assert db.query(Bill).count() == 100
+
+    served = mock_api.stats()["requests"]
+    run_async(bill_service.sync_bills_data(db, max_pages=10, incremental=False, fetch_content=False))
+    db.refresh(run)
+    assert (run.status, run.resume_count, run.last_completed_page) == (RUN_COMPLETED, 1, 3)
+    assert db.query(Bill).count() == 300
+    # 첫 페이지는 다시 받지 않음 (2~3페이지 목록 + 신규 의안 제안자 조회만)
+    assert mock_api.stats()["requests"] - served == 2 + 200
+    # 완료되면 발의일 워터마크 기록 (저장된 의안보다 앞서지 않음)
+    newest = db.query(Bill.proposal_date).order_by(Bill.proposal_date.desc()).limit(1).scalar()
+    assert get_watermark(db, "bills:22", "proposed") <= newest
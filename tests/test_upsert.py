@@ -0,0 +1,47 @@
+"""bulk_upsert/increment_column 대량 쓰기 헬퍼 테스트"""
+from datetime import date
+
+from app.db.upsert import bulk_upsert, increment_column
+from app.models.bill import Bill
+from app.models.member import Member
+
+def bill(bill_id: str, **values):
+    row = {"bill_id": bill_id, "bill_no": bill_id[-4:], "title": f"의안 {bill_id}",
+           "status": "계류", "vote_result": None, "vote_date": None, "row_hash": None}
+    row.update(values)
+    return row
+
+def test_inserts_new_rows_in_chunks(db):
+    rows = [bill(f"PRC_{index:04d}") for index in range(23)]
+    assert bulk_upsert(db, Bill, rows, ["bill_id"], ["status"], chunk_size=5) == 23
+    db.commit()
+    assert db.query(Bill).count() == 23
+
+def test_conflict_updates_only_listed_columns(db):
+    bulk_upsert(db, Bill, [bill("PRC_A", title="원래 제목")], ["bill_id"], ["status"])
+    db.commit()
+    bulk_upsert(db, Bill, [bill("PRC_A", title="바뀐 제목", status="원안가결")], ["bill_id"], ["status"])
+    db.commit()
+    stored = db.query(Bill).one()
+    assert (stored.title, stored.status) == ("원래 제목", "원안가결")
+
+def test_coalesce_column_keeps_existing_value_when_new_is_null(db):
+    columns = ["status", "vote_date"]
+    bulk_upsert(db, Bill, [bill("PRC_A", vote_date=date(2024, 7, 1))], ["bill_id"], columns, coalesce_columns=["vote_date"])
+    bulk_upsert(db, Bill, [bill("PRC_A", status="폐기", vote_date=None)], ["bill_id"], columns, coalesce_columns=["vote_date"])
+    db.commit()
+    stored = db.query(Bill).one()
+    assert (stored.status, stored.vote_date) == ("폐기", date(2024, 7, 1))
+
+def test_no_update_columns_means_insert_or_ignore(db):
+    bulk_upsert(db, Bill, [bill("PRC_A", title="처음")], ["bill_id"], [])
+    bulk_upsert(db, Bill, [bill("PRC_A", title="나중")], ["bill_id"], [])
+    db.commit()
+    assert db.query(Bill.title).scalar() == "처음"
+
+def test_increment_column_adds_per_row_amounts(db):
+    db.add_all([Member(id=1, name="가", num_bills=2), Member(id=2, name="나", num_bills=None), Member(id=3, name="다", num_bills=5)])
+    db.commit()
+    assert increment_column(db, Member, "num_bills", {1: 3, 2: 1, 3: 0}) == 2
+    db.commit()
+    assert dict(db.query(Member.id, Member.num_bills).all()) == {1: 5, 2: 1, 3: 5}